@@ -0,0 +1,392 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import instrumentation
+from data_loader import DATASETS, data_version, dataset_version, load_dataset, load_table, respondent_path
+from instrumentation import instrumented
+from query_cache import QueryCache, normalize_filters, share
+
+# API HTTP lokal untuk sistem internal yang butuh angka laporan tanpa
+# membaca halaman Streamlit. Server asyncio kecil (HTTP/1.1, keep-alive,
+# hanya GET/HEAD) yang dijalankan terpisah dari app:
+#
+#   python api.py [--host 127.0.0.1] [--port 8600]
+#
+#   GET /api                          daftar resource + ETag
+#   GET /api/datasets/<nama>[.arrow]  dataset data/ (JSON atau Arrow IPC)
+#   GET /api/survey/<tabel>[.arrow]   agregat survei (platform, konsumsi,
+#                                     karir, mental_health, segmentasi,
+#                                     agregat_responden); filter lewat query
+#                                     string, mis. ?gender=Perempuan
+#   GET /api/export.zip               semua tabel di atas (CSV + Parquet),
+#                                     dikirim chunked lewat exports.iter_zip
+#   GET /metrics                      teks Prometheus
+#
+# Data berasal dari lapisan yang sama dengan app (data_loader, cube survei).
+# ETag kuat = hash versi data + format (+ filter); klien yang mengirim
+# If-None-Match yang cocok mendapat 304 tanpa payload. Payload diserialisasi
+# sekali per ETag lalu disimpan di cache bersama "api" (anggaran
+# MEDAN_API_CACHE_MB); pekerjaan berat (versi data untuk ETag, baca data,
+# bangun cube, serialisasi) berjalan di thread executor agar event loop
+# tetap melayani revalidasi.
+HOST = os.environ.get("MEDAN_API_HOST", "127.0.0.1")
+PORT = int(os.environ.get("MEDAN_API_PORT", "8600"))
+MAX_BYTES = int(float(os.environ.get("MEDAN_API_CACHE_MB", "64")) * 1024 * 1024)
+
+# Naikkan jika bentuk payload berubah, agar ETag lama tidak lagi cocok
+PAYLOAD_VERSION = 1
+
+JSON_MIME = "application/json"
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+ZIP_MIME = "application/zip"
+
+SURVEY_TABLES = ('platform', 'konsumsi', 'karir', 'mental_health', 'segmentasi', 'agregat_responden')
+
+# Batas ukuran kepala request; request lebih besar ditolak
+MAX_HEADER_BYTES = 16 * 1024
+
+PAYLOADS = share(QueryCache("api", max_bytes=MAX_BYTES, ttl=float("inf")))
+
+_survey = {}
+_survey_lock = threading.Lock()
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseAborted(Exception):
+    # Galat setelah kepala respons terkirim; koneksi sudah diputus
+    pass
+
+
+class Resource:
+    # build() -> bytes payload; stream() -> iterator potongan bytes (ZIP).
+    # Arsip ZIP memuat waktu pembuatan, jadi isinya setara tetapi tidak
+    # identik per byte: ETag-nya lemah
+    def __init__(self, key, content_type, build=None, stream=None):
+        self.key = key
+        digest = hashlib.blake2b(repr((PAYLOAD_VERSION,) + key).encode(), digest_size=16).hexdigest()
+        self.etag = f'W/"{digest}"' if stream is not None else f'"{digest}"'
+        self.content_type = content_type
+        self.build = build
+        self.stream = stream
+
+
+def _stamp(path):
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def survey_version():
+    # Sama dengan app.py: file responden + model segmen + margin populasi
+    path = respondent_path()
+    if path is None:
+        return None
+    from segmentation import MODEL_PATH
+    from weighting import MARGIN_PATH
+
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size, _stamp(MODEL_PATH), _stamp(MARGIN_PATH))
+
+
+def survey_cube(version):
+    # Satu cube per proses, dibangun ulang hanya jika versi data berubah
+    with _survey_lock:
+        if _survey.get('version') != version:
+            from cube import AggregateCube
+            from segmentation import load_segment_model
+            from weighting import rake
+
+            path = respondent_path()
+            weights = rake(path) if version[4] is not None else None
+            _survey['cube'] = AggregateCube.build(path, segment_model=load_segment_model(), weights=weights)
+            _survey['version'] = version
+        return _survey['cube']
+
+
+def survey_table(version, name, filters):
+    cube = survey_cube(version)
+    if name == 'agregat_responden':
+        return cube.table(filters)
+    return cube.frames(filters)[name]
+
+
+def json_payload(name, version, frame):
+    # to_json pandas jauh lebih cepat dari json.dumps per baris
+    head = json.dumps({'name': name, 'version': version, 'columns': [str(c) for c in frame.columns]},
+                      ensure_ascii=False)
+    return (head[:-1] + ', "data": ' + frame.to_json(orient='records', force_ascii=False) + '}').encode('utf-8')
+
+
+def arrow_payload(table):
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def frame_payload(name, version, frame, fmt):
+    if fmt == 'arrow':
+        import pyarrow as pa
+
+        return arrow_payload(pa.Table.from_pandas(frame, preserve_index=False))
+    return json_payload(name, version, frame)
+
+
+def _split_format(segment, accept):
+    # <nama>.arrow / <nama>.json, atau negosiasi lewat header Accept
+    name, dot, ext = segment.rpartition('.')
+    if dot and ext in ('json', 'arrow'):
+        return name, ext
+    return segment, 'arrow' if ARROW_MIME in accept else 'json'
+
+
+def _filters(query):
+    from survey import DIMENSION_COLUMNS
+
+    filters = {}
+    for dim, values in parse_qs(query).items():
+        if dim not in DIMENSION_COLUMNS:
+            raise HTTPError(400, f"Filter tidak dikenal: {dim} (pilihan: {', '.join(DIMENSION_COLUMNS)})")
+        # ?kecamatan=A&kecamatan=B atau ?kecamatan=A,B
+        filters[dim] = [v for value in values for v in value.split(',') if v]
+    return filters
+
+
+def index_payload(survey):
+    resources = {
+        'datasets': {name: {'json': f"/api/datasets/{name}", 'arrow': f"/api/datasets/{name}.arrow",
+                            'version': dataset_version(name)} for name in DATASETS},
+        'survey': {name: {'json': f"/api/survey/{name}", 'arrow': f"/api/survey/{name}.arrow"}
+                   for name in SURVEY_TABLES} if survey is not None else {},
+        'export': "/api/export.zip"
+    }
+    return json.dumps(resources, ensure_ascii=False).encode('utf-8')
+
+
+def reference_version():
+    # Tabel survei juga bergantung pada dataset acuan cube (YoY konsumsi,
+    # urutan & warna segmen); versinya ikut di setiap kunci/ETag survei
+    from cube import REFERENCE_DATASETS
+
+    return data_version(REFERENCE_DATASETS)
+
+
+def export_members(survey, filters):
+    from exports import available_formats, export_bytes
+
+    sources = {name: (dataset_version(name), lambda name=name: load_dataset(name)) for name in DATASETS}
+    if survey is not None:
+        version = (survey, reference_version(), normalize_filters(filters))
+        for name in SURVEY_TABLES:
+            sources[f"survei_{name}"] = (version, lambda name=name: survey_table(survey, name, filters))
+    formats = [fmt for fmt in available_formats() if fmt != 'xlsx']
+    return [
+        (f"{fmt}/{name}.{fmt}", fmt, lambda name=name, fmt=fmt, version=version, load=load: export_bytes(
+            name, fmt, version, load
+        ))
+        for name, (version, load) in sources.items() for fmt in formats
+    ]
+
+
+def resolve(path, query, accept):
+    parts = [unquote(p) for p in path.strip('/').split('/')]
+    if parts[0] != 'api':
+        raise HTTPError(404, f"Tidak ditemukan: {path}")
+    survey = survey_version()
+
+    if len(parts) == 1:
+        return Resource(('index', data_version(), survey, reference_version()), JSON_MIME, lambda: index_payload(survey))
+
+    if parts[1:] == ['export.zip']:
+        from exports import iter_zip
+
+        filters = _filters(query)
+        key = ('export', data_version(), survey, reference_version(), normalize_filters(filters))
+        return Resource(key, ZIP_MIME, stream=lambda: iter_zip(export_members(survey, filters)))
+
+    if len(parts) == 3 and parts[1] == 'datasets':
+        name, fmt = _split_format(parts[2], accept)
+        if name not in DATASETS:
+            raise HTTPError(404, f"Dataset tidak dikenal: {name}")
+        version = dataset_version(name)
+        if fmt == 'arrow':
+            build = lambda: arrow_payload(load_table(name))  # noqa: E731
+        else:
+            build = lambda: json_payload(name, version, load_dataset(name))  # noqa: E731
+        return Resource(('dataset', name, fmt, version), ARROW_MIME if fmt == 'arrow' else JSON_MIME, build)
+
+    if len(parts) == 3 and parts[1] == 'survey':
+        name, fmt = _split_format(parts[2], accept)
+        if name not in SURVEY_TABLES:
+            raise HTTPError(404, f"Tabel survei tidak dikenal: {name}")
+        if survey is None:
+            raise HTTPError(404, "Data survei tingkat responden tidak tersedia")
+        filters = _filters(query)
+        key = ('survey', name, fmt, survey, reference_version(), normalize_filters(filters))
+        version = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return Resource(key, ARROW_MIME if fmt == 'arrow' else JSON_MIME,
+                        lambda: frame_payload(name, version, survey_table(survey, name, filters), fmt))
+
+    raise HTTPError(404, f"Tidak ditemukan: {path}")
+
+
+def _build(resource):
+    return PAYLOADS.put(resource.etag, resource.build())
+
+
+_build = instrumented(_build, "api:build")
+
+
+def _etag_matches(header, etag):
+    if not header:
+        return False
+    return header.strip() == '*' or etag in [tag.strip() for tag in header.split(',')]
+
+
+def _head(status, headers):
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+
+async def respond(writer, method, target, headers):
+    loop = asyncio.get_running_loop()
+    url = urlsplit(target)
+    if method not in ('GET', 'HEAD'):
+        raise HTTPError(405, f"Metode tidak didukung: {method}")
+
+    if url.path == '/metrics':
+        body = instrumentation.REGISTRY.prometheus_text().encode('utf-8')
+        writer.write(_head(200, {'Content-Type': "text/plain; version=0.0.4", 'Content-Length': len(body)}))
+        if method == 'GET':
+            writer.write(body)
+        return
+
+    # resolve() men-stat file data & menghitung versi dataset acuan di setiap
+    # request; jalankan di executor agar revalidasi lain tidak ikut menunggu
+    resource = await loop.run_in_executor(None, resolve, url.path, url.query, headers.get('accept', ''))
+    common = {'ETag': resource.etag, 'Cache-Control': "no-cache"}
+    if _etag_matches(headers.get('if-none-match'), resource.etag):
+        writer.write(_head(304, common))
+        return
+
+    if resource.stream is not None:
+        # Ukuran ZIP tidak diketahui di awal: kirim chunked, potongan
+        # berikutnya dihitung di executor sementara potongan sebelumnya dikirim
+        head = _head(200, dict(common, **{'Content-Type': resource.content_type, 'Transfer-Encoding': "chunked"}))
+        if method == 'HEAD':
+            writer.write(head)
+            return
+        # Kepala baru dikirim setelah potongan pertama siap, jadi galat di
+        # awal stream masih dijawab 500 biasa
+        chunks = await loop.run_in_executor(None, resource.stream)
+        chunk = await loop.run_in_executor(None, next, chunks, None)
+        writer.write(head)
+        try:
+            while chunk is not None:
+                if chunk:
+                    writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                    await writer.drain()
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+        except Exception as exc:
+            # Kepala 200 sudah terkirim: putus koneksi tanpa chunk penutup
+            # agar klien melihat body tidak lengkap, bukan kepala 500 di
+            # tengah body
+            writer.transport.abort()
+            raise ResponseAborted(f"{type(exc).__name__}: {exc}") from exc
+        writer.write(b"0\r\n\r\n")
+        return
+
+    body = PAYLOADS.get(resource.etag)
+    if body is None:
+        body = await loop.run_in_executor(None, _build, resource)
+    writer.write(_head(200, dict(common, **{'Content-Type': resource.content_type, 'Content-Length': len(body)})))
+    if method == 'GET':
+        writer.write(body)
+
+
+async def handle(reader, writer):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            lines = head.decode('latin-1').split("\r\n")
+            try:
+                method, target, version = lines[0].split(" ", 2)
+            except ValueError:
+                writer.write(_head(400, {'Content-Length': 0, 'Connection': "close"}))
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, sep, value = line.partition(":")
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+            if headers.get('content-length'):
+                await reader.readexactly(int(headers['content-length']))
+            keep_alive = version == "HTTP/1.1" and headers.get('connection', '').lower() != 'close'
+
+            try:
+                await respond(writer, method, target, headers)
+            except ResponseAborted:
+                break
+            except HTTPError as exc:
+                body = json.dumps({'error': str(exc)}, ensure_ascii=False).encode('utf-8')
+                writer.write(_head(exc.status, {'Content-Type': JSON_MIME, 'Content-Length': len(body)}))
+                writer.write(body)
+            except Exception as exc:  # noqa: BLE001
+                body = json.dumps({'error': f"{type(exc).__name__}: {exc}"}, ensure_ascii=False).encode('utf-8')
+                writer.write(_head(500, {'Content-Type': JSON_MIME, 'Content-Length': len(body),
+                                         'Connection': "close"}))
+                writer.write(body)
+                keep_alive = False
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host=HOST, port=PORT, ready=None):
+    server = await asyncio.start_server(handle, host, port, limit=MAX_HEADER_BYTES)
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API JSON/Arrow untuk agregat laporan Medan Youth Insights")
+    parser.add_argument("--host", default=HOST, help=f"Alamat (default: {HOST})")
+    parser.add_argument("--port", type=int, default=PORT, help=f"Port (default: {PORT})")
+    args = parser.parse_args()
+
+    def ready(server):
+        for sock in server.sockets:
+            print(f"API laporan aktif di http://{sock.getsockname()[0]}:{sock.getsockname()[1]}/api", flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,29 @@
+import os
+import time
+import uuid
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+import instrumentation
+import warmup
+from data_loader import load_dataset, load_table, respondent_path
+from display import column_config, text_table
+from figure_artifacts import compiled
+from figures import COLORSCALES, apply_layout, compact_figure
+from instrumentation import instrumented
+
+# Modul berat (pandas, plotly.express, numpy lewat modul survei) diimpor di
+# tempat pertama kali dipakai, bukan di sini: worker baru yang membuka halaman
+# pembuka tidak perlu membayar biaya import-nya. Import berulang saat rerun
+# hanya lookup sys.modules.
+
+# Instrumentasi (aktif dengan MEDAN_METRICS=1): tanpa itu, pembungkus di bawah
+# adalah fungsi Streamlit/data_loader aslinya
+load_dataset = instrumented(load_dataset, "load_dataset:{0}")
+load_table = instrumented(load_table, "load_table:{0}")
+plotly_chart = instrumented(st.plotly_chart, "st.plotly_chart")
+dataframe = instrumented(st.dataframe, "st.dataframe")
+table = instrumented(st.table, "st.table")
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -97,253 +118,649 @@ section = st.sidebar.radio(
     ]
 )
 
+if instrumentation.ENABLED:
+    st.session_state.setdefault("metrics_session", uuid.uuid4().hex[:8])
+run_metrics = instrumentation.begin_run(section, st.session_state.get("metrics_session"))
+
+# Jika data survei tingkat responden tersedia (data/responden.parquet atau
+# data/responden.csv), agregat chart dihitung dari cube agregat yang dibangun
+# sekali per versi file; filter sidebar hanya mengiris cube tersebut
+@instrumented
+@st.cache_resource(show_spinner="Membangun cube agregat survei...", max_entries=2)
+def load_survey_cube(path, mtime_ns, size, model_stamp, margin_stamp):
+    from cube import AggregateCube
+    from segmentation import load_segment_model
+    from weighting import rake
+
+    # Bobot raking ke margin populasi BPS (data/populasi_margin.csv) jika ada
+    weights = rake(path) if margin_stamp is not None else None
+    return AggregateCube.build(path, segment_model=load_segment_model(), weights=weights)
+
+def file_stamp(path):
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Satu entri per versi file responden + margin; versi lama tidak menumpuk
+@instrumented
+@st.cache_data(persist="disk", show_spinner="Menghitung interval kepercayaan bootstrap...", max_entries=4)
+def load_bootstrap_ci(path, mtime_ns, size, margin_stamp):
+    from bootstrap import bootstrap_ci
+    from weighting import rake
+
+    weights = rake(path) if margin_stamp is not None else None
+    return bootstrap_ci(path, weights=weights)
+
+# Kode kategori + bobot per responden untuk tabulasi silang (satu versi file)
+@instrumented
+@st.cache_resource(show_spinner="Menyiapkan tabulasi silang...", max_entries=1)
+def load_crosstab_index(path, mtime_ns, size, model_stamp, margin_stamp):
+    from crosstab import CrosstabIndex
+    from segmentation import load_segment_model
+    from weighting import rake
+
+    weights = rake(path) if margin_stamp is not None else None
+    return CrosstabIndex.build(path, segment_model=load_segment_model(), weights=weights)
+
+# Indeks tabel responden untuk viewer berhalaman (satu versi file saja)
+@instrumented
+@st.cache_resource(show_spinner="Memuat data responden...", max_entries=1)
+def load_respondent_table(path, mtime_ns, size):
+    from table_viewer import TableIndex
+
+    return TableIndex.from_file(path)
+
+# Hasil agregat per kombinasi filter di-cache lintas sesi (query_cache.py),
+# dengan kunci jenis query + versi data survei + versi dataset acuan cube
+# (konsumsi, segmentasi) + filter yang dinormalisasi. Perubahan data apa pun
+# langsung menghasilkan kunci baru; TTL hanya membatasi memori
+def survey_query(kind, filters, compute, *params):
+    from cube import REFERENCE_DATASETS
+    from data_loader import data_version
+    from query_cache import AGGREGATES, normalize_filters
+
+    key = (kind, survey_version, data_version(REFERENCE_DATASETS), normalize_filters(filters)) + params
+    return AGGREGATES.get_or_compute(key, compute)
+
+FILTER_LABELS = {
+    'kelompok_umur': "Kelompok Umur",
+    'gender': "Gender",
+    'pendidikan': "Jenjang Pendidikan",
+    'kecamatan': "Kecamatan"
+}
+
+# Bagian yang menampilkan chart dari dataset; bagian lain (termasuk halaman
+# pembuka) tidak memuat dataset chart sama sekali
+DATA_SECTIONS = ("📈 Analisis Data & Temuan", "👥 Segmentasi Gen Z Medan")
+
+survey_path = respondent_path()
+if survey_path is not None:
+    from segmentation import MODEL_PATH as SEGMENT_MODEL_PATH
+    from weighting import MARGIN_PATH
+
+    survey_stat = survey_path.stat()
+    # Versi data survei: file responden + model segmen + margin populasi
+    survey_version = (
+        str(survey_path), survey_stat.st_mtime_ns, survey_stat.st_size,
+        file_stamp(SEGMENT_MODEL_PATH), file_stamp(MARGIN_PATH)
+    )
+    survey_cube = load_survey_cube(*survey_version)
+    
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 🔎 Filter Responden")
+    survey_filters = {
+        dim: st.sidebar.multiselect(label, survey_cube.options(dim), key=f"filter_{dim}", placeholder="Semua")
+        for dim, label in FILTER_LABELS.items()
+    }
+    
+    info = survey_cube.describe()
+    survey_sums = survey_query('sums', survey_filters, lambda: survey_cube.sums(survey_filters))
+    st.sidebar.caption(
+        f"{int(survey_sums['n_responden']):,} dari {info['n_respondents']:,} responden"
+        f"{' (tertimbang ke populasi BPS)' if survey_cube.weighted else ''} • "
+        f"cube {info['n_cells']:,} sel ({info['nbytes'] / 1024:.0f} KB, dibangun {info['build_seconds']} dtk)"
+    )
+
 # Data untuk visualisasi
-# Data Demografi
-demografi_data = pd.DataFrame({
-    'Kelompok Umur': ['15-19 tahun', '20-24 tahun'],
-    'Jumlah (ribu jiwa)': [220.5, 235.0],
-    'Persentase Populasi Medan': [13.2, 14.1]
-})
-
-# Data Segmentasi
-segmentasi_data = pd.DataFrame({
-    'Segment': ['Digital-First Urbanites', 'Edu-Career Seekers', 'Entrepreneurial Hustlers', 'Tradition-Oriented Youth'],
-    'Persentase': [40, 27.5, 20, 12.5],
-    'Warna': ['#3B82F6', '#10B981', '#F59E0B', '#8B5CF6']
-})
-
-# Data Penggunaan Platform
-platform_data = pd.DataFrame({
-    'Platform': ['TikTok', 'Instagram', 'YouTube', 'Spotify', 'Shopee'],
-    'Pengguna Gen Z (%)': [92, 88, 85, 72, 68],
-    'Waktu Harian (menit)': [95, 75, 60, 45, 35]
-})
-
-# Data Pola Konsumsi
-konsumsi_data = pd.DataFrame({
-    'Kategori': ['Fashion', 'Kuliner', 'Elektronik', 'Kecantikan', 'Hiburan'],
-    'Persentase Pembelian Online': [65, 58, 42, 55, 48],
-    'Pertumbuhan YoY (%)': [15, 22, 8, 18, 12]
-})
-
-# Data Aspirasi Karir
-karir_data = pd.DataFrame({
-    'Jenis Pekerjaan': ['Wirausaha/Digital', 'PNS/ASN', 'Perusahaan Swasta', 'Freelancer', 'Lainnya'],
-    'Minat (%)': [35, 25, 20, 15, 5]
-})
-
-# Data Isu Kesehatan Mental
-mental_health_data = pd.DataFrame({
-    'Masalah': ['Stress Akademik', 'Kecemasan Sosial', 'Depresi', 'Body Image Issues', 'Burnout'],
-    'Prevalensi (%)': [65, 48, 32, 45, 38]
-})
+# Dataset dibaca dari folder data/ lewat data_loader (cache bersama per proses,
+# dibaca ulang hanya jika file berubah)
+CHART_DATASETS = ("demografi", "segmentasi", "platform", "konsumsi", "karir", "mental_health")
+
+def chart_data(filters):
+    data = {name: load_dataset(name) for name in CHART_DATASETS}
+    
+    if survey_path is not None:
+        survey_frames = survey_query('frames', filters, lambda: survey_cube.frames(filters))
+        for name in ('platform', 'konsumsi', 'karir', 'mental_health', 'segmentasi'):
+            data[name] = survey_frames[name]
+        
+        # Error bar CI bootstrap dihitung sekali per versi data untuk seluruh
+        # responden, jadi hanya ditampilkan saat tidak ada filter aktif
+        if not any(filters.values()):
+            from bootstrap import with_ci
+
+            survey_ci = load_bootstrap_ci(
+                str(survey_path), survey_stat.st_mtime_ns, survey_stat.st_size, file_stamp(MARGIN_PATH)
+            )
+            data['platform'] = with_ci(data['platform'], survey_ci['platform'], 'Platform')
+            data['mental_health'] = with_ci(data['mental_health'], survey_ci['mental_health'], 'Masalah')
+    return data
+
+if section in DATA_SECTIONS:
+    data = chart_data(survey_filters if survey_path is not None else {})
+    demografi_data = data['demografi']
+    segmentasi_data = data['segmentasi']
+    platform_data = data['platform']
+    konsumsi_data = data['konsumsi']
+    karir_data = data['karir']
+    mental_health_data = data['mental_health']
 
 # Fungsi untuk visualisasi
-def create_demografi_chart():
+# Figure di-cache lintas sesi dengan kunci hash isi DataFrame + opsi chart,
+# sehingga rerun berikutnya tidak membangun ulang figure Plotly Express.
+# Jumlah entri dibatasi; entri paling lama tidak dipakai akan dibuang.
+FIGURE_CACHE_MAX_ENTRIES = 64
+
+# Error bar dari kolom CI bootstrap (jika DataFrame membawanya)
+def ci_error_bars(data, value_column, axis):
+    from bootstrap import CI_LOWER, CI_UPPER
+
+    if CI_LOWER not in data.columns:
+        return {}
+    return {
+        f'error_{axis}': data[CI_UPPER] - data[value_column],
+        f'error_{axis}_minus': data[value_column] - data[CI_LOWER]
+    }
+
+# Proporsi sumber data (bagian metodologi)
+METODE_DATA = (
+    ('Data Resmi', 35),
+    ('Survei Lembaga', 25),
+    ('Platform Digital', 25),
+    ('Laporan Institusi', 15)
+)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_metode_chart(data, height=300):
+    import pandas as pd
+    import plotly.express as px
+
+    metode_data = pd.DataFrame(list(data), columns=['Kategori', 'Proporsi'])
+    fig = px.pie(metode_data, values='Proporsi', names='Kategori',
+                 color_discrete_sequence=px.colors.qualitative.Set3,
+                 height=height)
+    return compact_figure(fig)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_demografi_chart(data, height=400):
+    import plotly.express as px
+
     # Buat dua chart terpisah karena ada masalah dengan pie chart dalam subplot
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Bar chart
-        fig1 = px.bar(
-            demografi_data,
-            x='Kelompok Umur',
-            y='Jumlah (ribu jiwa)',
-            title='Distribusi Usia Gen Z Medan',
-            color='Kelompok Umur',
-            color_discrete_sequence=['#3B82F6', '#1D4ED8'],
-            text=demografi_data['Jumlah (ribu jiwa)'].apply(lambda x: f'{x:.1f}K')
-        )
-        fig1.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig1, width='stretch')
-    
-    with col2:
-        # Pie chart terpisah
-        fig2 = px.pie(
-            demografi_data,
-            values='Persentase Populasi Medan',
-            names='Kelompok Umur',
-            title='Proporsi dalam Populasi',
-            hole=0.4,
-            color_discrete_sequence=['#3B82F6', '#1D4ED8']
-        )
-        fig2.update_layout(height=400)
-        st.plotly_chart(fig2, width='stretch')
+    # Bar chart
+    fig1 = px.bar(
+        data,
+        x='Kelompok Umur',
+        y='Jumlah (ribu jiwa)',
+        title='Distribusi Usia Gen Z Medan',
+        color='Kelompok Umur',
+        color_discrete_sequence=['#3B82F6', '#1D4ED8'],
+        text=data['Jumlah (ribu jiwa)'].apply(lambda x: f'{x:.1f}K')
+    )
+    fig1.update_layout(height=height, showlegend=False)
+    
+    # Pie chart terpisah
+    fig2 = px.pie(
+        data,
+        values='Persentase Populasi Medan',
+        names='Kelompok Umur',
+        title='Proporsi dalam Populasi',
+        hole=0.4,
+        color_discrete_sequence=['#3B82F6', '#1D4ED8']
+    )
+    fig2.update_layout(height=height)
     
-    return None
+    return compact_figure(fig1), compact_figure(fig2)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_segmentasi_chart(data, height=500):
+    import plotly.express as px
 
-def create_segmentasi_chart():
     fig = px.pie(
-        segmentasi_data,
+        data,
         values='Persentase',
         names='Segment',
         title='Segmentasi Gen Z Medan',
         color='Segment',
-        color_discrete_map={
-            'Digital-First Urbanites': '#3B82F6',
-            'Edu-Career Seekers': '#10B981',
-            'Entrepreneurial Hustlers': '#F59E0B',
-            'Tradition-Oriented Youth': '#8B5CF6'
-        },
+        color_discrete_map=dict(zip(data['Segment'], data['Warna'])),
         hole=0.3,
-        height=500
+        height=height
     )
     fig.update_traces(textposition='inside', textinfo='percent+label')
-    return fig
+    return compact_figure(fig)
 
 # Di bagian create_platform_usage_chart():
 
-def create_platform_usage_chart():
-    # Definisikan custom color scales yang lebih gelap
-    custom_blues = [
-        [0.0, '#1e3b8a'],  # Dark blue
-        [0.3, '#2563eb'],  # Medium blue
-        [0.6, '#3b82f6'],  # Standard blue
-        [1.0, '#60a5fa']   # Light blue (tidak terlalu cerah)
-    ]
-    
-    custom_greens = [
-        [0.0, '#065f46'],  # Dark green
-        [0.3, '#059669'],  # Medium green
-        [0.6, '#10b981'],  # Standard green
-        [1.0, '#34d399']   # Light green (tidak terlalu cerah)
-    ]
-    
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_platform_usage_chart(data, height=400):
+    import plotly.express as px
+
     # Chart 1: Pengguna Gen Z per Platform
     fig1 = px.bar(
-        platform_data,
+        data,
         y='Platform',
         x='Pengguna Gen Z (%)',
         orientation='h',
         title='Pengguna Gen Z per Platform (%)',
         color='Pengguna Gen Z (%)',
-        color_continuous_scale=custom_blues,
-        text=platform_data['Pengguna Gen Z (%)'].apply(lambda x: f'{x}%'),
-        range_color=[60, 100]  # Batasi range warna dari 60% ke 100%
-    )
-    fig1.update_layout(
-        height=400, 
-        coloraxis_showscale=False,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#333333')
+        color_continuous_scale=COLORSCALES['blues'],
+        text=data['Pengguna Gen Z (%)'].apply(lambda x: f'{x}%'),
+        range_color=[60, 100],  # Batasi range warna dari 60% ke 100%
+        **ci_error_bars(data, 'Pengguna Gen Z (%)', 'x')
     )
+    apply_layout(fig1, height=height)
     
     # Chart 2: Waktu Penggunaan Harian
     fig2 = px.bar(
-        platform_data,
+        data,
         y='Platform',
         x='Waktu Harian (menit)',
         orientation='h',
         title='Waktu Penggunaan Harian (menit)',
         color='Waktu Harian (menit)',
-        color_continuous_scale=custom_greens,
-        text=platform_data['Waktu Harian (menit)'].apply(lambda x: f'{x}m'),
+        color_continuous_scale=COLORSCALES['greens'],
+        text=data['Waktu Harian (menit)'].apply(lambda x: f'{x}m'),
         range_color=[30, 100]  # Batasi range warna dari 30 menit ke 100 menit
     )
-    fig2.update_layout(
-        height=400, 
-        coloraxis_showscale=False,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#333333')
-    )
+    apply_layout(fig2, height=height)
     
-    return fig1, fig2
+    return compact_figure(fig1), compact_figure(fig2)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_konsumsi_chart(data, height=400):
+    import plotly.express as px
 
-def create_konsumsi_chart():
-    # Definisikan custom color scales yang lebih gelap
-    custom_purples = [
-        [0.0, '#4c1d95'],  # Very dark purple
-        [0.3, '#6d28d9'],  # Dark purple
-        [0.6, '#8b5cf6'],  # Standard purple
-        [1.0, '#a78bfa']   # Light purple (tidak terlalu cerah)
-    ]
-    
-    custom_oranges = [
-        [0.0, '#9a3412'],  # Very dark orange/brown
-        [0.3, '#ea580c'],  # Dark orange
-        [0.6, '#f97316'],  # Standard orange
-        [1.0, '#fdba74']   # Light orange (tidak terlalu cerah)
-    ]
     # Chart 1: Pembelian Online per Kategori
     fig1 = px.bar(
-        konsumsi_data,
+        data,
         x='Kategori',
         y='Persentase Pembelian Online',
         title='Pembelian Online per Kategori (%)',
         color='Persentase Pembelian Online',
-        color_continuous_scale=custom_purples,
-        text=konsumsi_data['Persentase Pembelian Online'].apply(lambda x: f'{x}%')
-    )
-    fig1.update_layout(
-        height=400, 
-        coloraxis_showscale=False,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#333333')
+        color_continuous_scale=COLORSCALES['purples'],
+        text=data['Persentase Pembelian Online'].apply(lambda x: f'{x}%')
     )
+    apply_layout(fig1, height=height)
     
     # Chart 2: Pertumbuhan YoY
     fig2 = px.bar(
-        konsumsi_data,
+        data,
         x='Kategori',
         y='Pertumbuhan YoY (%)',
         title='Pertumbuhan YoY Konsumsi (%)',
         color='Pertumbuhan YoY (%)',
-        color_continuous_scale=custom_oranges,
-        text=konsumsi_data['Pertumbuhan YoY (%)'].apply(lambda x: f'{x}%')
-    )
-    fig2.update_layout(
-        height=400, 
-        coloraxis_showscale=False,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#333333')
+        color_continuous_scale=COLORSCALES['oranges'],
+        text=data['Pertumbuhan YoY (%)'].apply(lambda x: f'{x}%')
     )
+    apply_layout(fig2, height=height)
     
-    return fig1, fig2
+    return compact_figure(fig1), compact_figure(fig2)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_karir_chart(data, height=400):
+    import plotly.express as px
 
-def create_karir_chart():
     fig = px.pie(
-        karir_data,
+        data,
         values='Minat (%)',
         names='Jenis Pekerjaan',
         title='Minat Jenis Pekerjaan Gen Z Medan',
         hole=0.4,
         color_discrete_sequence=px.colors.sequential.Blues_r,
-        height=400
+        height=height
     )
     fig.update_traces(textposition='inside', textinfo='percent+label')
-    return fig
-
-def create_mental_health_chart():
-    custom_reds = [
-        [0.0, '#7f1d1d'],  # Very dark red
-        [0.3, '#dc2626'],  # Dark red
-        [0.6, '#ef4444'],  # Standard red
-        [1.0, '#f87171']   # Light red (tidak terlalu cerah)
-    ]
+    return compact_figure(fig)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+@compiled
+def create_mental_health_chart(data, height=400):
+    import plotly.express as px
+
     fig = px.bar(
-        mental_health_data,
+        data,
         x='Prevalensi (%)',
         y='Masalah',
         orientation='h',
         title='Prevalensi Masalah Kesehatan Mental (%)',
         color='Prevalensi (%)',
-        color_continuous_scale=custom_reds,
-        text=mental_health_data['Prevalensi (%)'].apply(lambda x: f'{x}%'),
-        height=400
+        color_continuous_scale=COLORSCALES['reds'],
+        text=data['Prevalensi (%)'].apply(lambda x: f'{x}%'),
+        height=height,
+        **ci_error_bars(data, 'Prevalensi (%)', 'x')
     )
-    fig.update_layout(
-        coloraxis_showscale=False,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#333333')
+    apply_layout(fig)
+    return compact_figure(fig)
+
+@instrumented
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def create_crosstab_heatmap(data, value, height=None):
+    import plotly.express as px
+    from crosstab import COUNT_COLUMN
+
+    # data: Crosstab.frame(); kolom sebelum COUNT_COLUMN adalah variabel
+    # (baris, kolom, lapisan) dalam urutan produk kartesius
+    variables = list(data.columns[:list(data.columns).index(COUNT_COLUMN)])
+    labels = [list(data[v].unique()) for v in variables]
+    values = data[value].to_numpy().reshape([len(l) for l in labels])
+    
+    facet, panel_rows = {}, 1
+    if len(variables) == 3:
+        # Lapisan (variabel ketiga) jadi panel terpisah, 3 panel per baris
+        values = values.transpose(2, 0, 1)
+        facet = dict(facet_col=0, facet_col_wrap=3)
+        panel_rows = -(-len(labels[2]) // 3)
+    
+    fig = px.imshow(
+        values,
+        x=labels[1],
+        y=labels[0],
+        labels=dict(x=variables[1], y=variables[0], color=value),
+        color_continuous_scale=COLORSCALES['blues'],
+        text_auto='.1f' if value != COUNT_COLUMN else '.3s',
+        aspect='auto',
+        title=f"{value}: {' × '.join(variables)}",
+        height=height or max(400, panel_rows * (120 + 28 * len(labels[0]))),
+        **facet
     )
-    return fig
+    if facet:
+        fig.for_each_annotation(lambda a: a.update(
+            text=f"{variables[2]}: {labels[2][int(a.text.split('=')[-1])]}"
+        ))
+    apply_layout(fig)
+    return compact_figure(fig)
+
+# Region interaktif (chart + kontrolnya) dibungkus st.fragment: interaksi
+# widget di dalamnya hanya menjalankan ulang fungsi region tersebut, bukan
+# seluruh script (CSS, markdown, bagian lain). Data masuk lewat argumen, jadi
+# perubahan filter sidebar tetap memicu rerun penuh seperti biasa.
+KONSUMSI_URUTAN = {
+    "Urutan survei": None,
+    "Pembelian online tertinggi": 'Persentase Pembelian Online',
+    "Pertumbuhan tertinggi": 'Pertumbuhan YoY (%)'
+}
+
+@st.fragment
+@instrumented
+def konsumsi_panel(data):
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        kategori = st.multiselect("Kategori", list(data['Kategori']), default=list(data['Kategori']),
+                                  key="konsumsi_kategori")
+    with col2:
+        urutan = st.selectbox("Urutkan", list(KONSUMSI_URUTAN), key="konsumsi_urutan")
+    
+    view = data[data['Kategori'].isin(kategori)]
+    if KONSUMSI_URUTAN[urutan] is not None:
+        view = view.sort_values(KONSUMSI_URUTAN[urutan], ascending=False)
+    if view.empty:
+        st.info("Pilih minimal satu kategori.")
+        return
+    
+    # Tampilkan dua chart secara terpisah
+    fig1, fig2 = create_konsumsi_chart(view)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        plotly_chart(fig1, width='stretch')
+    with col2:
+        plotly_chart(fig2, width='stretch')
+
+# Viewer data responden: pencarian, sort dan filter sidebar dikerjakan di
+# server (table_viewer.TableIndex); yang dikirim ke browser hanya satu halaman
+TANPA_SORT = "(urutan file)"
+
+@st.fragment
+@instrumented
+def respondent_viewer(index, filters):
+    from table_viewer import DEFAULT_PAGE_SIZE, PAGE_SIZES, n_pages
+    
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        search = st.text_input("Cari", key="responden_cari", placeholder="kecamatan, institusi, minat karir...")
+    with col2:
+        sort = st.selectbox("Urutkan menurut", [TANPA_SORT] + index.columns, key="responden_sort")
+    with col3:
+        descending = st.toggle("Menurun", key="responden_desc")
+    with col4:
+        page_size = st.selectbox("Baris", PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE), key="responden_baris")
+    
+    rows = index.query(search, filters, None if sort == TANPA_SORT else sort, not descending)
+    if len(rows) == 0:
+        st.info("Tidak ada responden yang cocok dengan pencarian/filter.")
+        return
+    pages = n_pages(len(rows), page_size)
+    # Hasil pencarian bisa lebih sedikit dari halaman yang sedang dibuka
+    if st.session_state.get("responden_halaman", 1) > pages:
+        st.session_state["responden_halaman"] = pages
+    page = st.number_input(f"Halaman (dari {pages:,})", min_value=1, max_value=pages, key="responden_halaman")
+    
+    start = (page - 1) * page_size
+    dataframe(index.page(rows, page - 1, page_size), width='stretch')
+    st.caption(
+        f"Baris {start + 1:,}–{min(start + page_size, len(rows)):,} dari {len(rows):,} "
+        f"hasil (total {index.n_rows:,} responden)"
+    )
+
+# Tabulasi silang tertimbang 2-3 variabel survei (crosstab.CrosstabIndex);
+# filter sidebar ikut diterapkan
+CROSSTAB_NILAI = ("% Baris", "% Kolom", "Jumlah (tertimbang)")
+
+@st.fragment
+@instrumented
+def crosstab_panel(index, filters):
+    from crosstab import (
+        COLUMN_PERCENT_COLUMN,
+        COUNT_COLUMN,
+        MAX_VARIABLES,
+        MIN_VARIABLES,
+        ROW_PERCENT_COLUMN,
+    )
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        variables = st.multiselect(
+            "Variabel (baris, kolom, lapisan)", index.variables,
+            default=[v for v in ('menit_tiktok', 'stress_akademik') if v in index.variables],
+            format_func=index.label, max_selections=MAX_VARIABLES, key="crosstab_variabel"
+        )
+    with col2:
+        nilai = st.radio("Nilai heatmap", CROSSTAB_NILAI, horizontal=True, key="crosstab_nilai")
+    
+    if len(variables) < MIN_VARIABLES:
+        st.info(f"Pilih {MIN_VARIABLES}-{MAX_VARIABLES} variabel.")
+        return
+    start = time.perf_counter()
+    result = survey_query('crosstab', filters, lambda: index.tabulate(variables, filters), tuple(variables))
+    elapsed = time.perf_counter() - start
+    if result.n_respondents == 0:
+        st.info("Tidak ada responden yang cocok dengan filter.")
+        return
+    
+    data = result.frame()
+    value = dict(zip(CROSSTAB_NILAI, (ROW_PERCENT_COLUMN, COLUMN_PERCENT_COLUMN, COUNT_COLUMN)))[nilai]
+    plotly_chart(create_crosstab_heatmap(data, value), width='stretch')
+    dataframe(data, width='stretch', hide_index=True, column_config={
+        COUNT_COLUMN: st.column_config.NumberColumn(format="%.1f"),
+        ROW_PERCENT_COLUMN: st.column_config.NumberColumn(format="%.1f%%"),
+        COLUMN_PERCENT_COLUMN: st.column_config.NumberColumn(format="%.1f%%"),
+    })
+    st.caption(
+        f"{result.n_respondents:,} responden{' (tertimbang ke populasi BPS)' if index.weighted else ''} • "
+        f"dijawab dalam {elapsed * 1000:.0f} ms"
+    )
+
+# Tab ringan: hanya isi tab yang aktif yang dihitung dan dikirim ke browser.
+# st.tabs selalu mengeksekusi semua isi tab, jadi pada mode ini tab diganti
+# radio horizontal dengan urutan label yang sama. Set MEDAN_LAZY_TABS=0
+# untuk kembali ke st.tabs biasa (mis. saat perlu semua tab sekaligus).
+LAZY_TABS = os.environ.get("MEDAN_LAZY_TABS", "1") != "0"
+
+def lazy_tabs(labels, key):
+    if not LAZY_TABS:
+        return st.tabs(labels)
+    
+    aktif = st.radio(
+        "Pilih tab",
+        labels,
+        key=key,
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    return [st.container() if label == aktif else None for label in labels]
+
+# Tabel rekomendasi penelitian per prioritas (bagian Kesimpulan)
+RESEARCH_COLUMNS = ['Research Topics', 'Alasan']
+RESEARCH_LEVELS = ('Tinggi', 'Sedang', 'Rendah')
+
+# Pemanasan cache bersama (warmup.py): sekali per proses, thread latar
+# membangun dataset, tabel tampilan dan figure default setiap bagian, lalu
+# indeks data responden, sebelum pengguna membuka bagian tersebut
+def warm_caches(step):
+    from data_loader import DATASETS
+
+    step("datasets", lambda: [load_dataset(name) for name in DATASETS])
+    step("display_tables", lambda: (
+        [load_table(name) for name in DATASETS]
+        + [load_table("research_priority", columns=RESEARCH_COLUMNS, where={'Priority': level})
+           for level in RESEARCH_LEVELS]
+        + [text_table("segment_summary")]
+    ))
+    data = step("chart_data", lambda: chart_data({}))
+    step("create_metode_chart", lambda: create_metode_chart(METODE_DATA))
+    step("create_demografi_chart", lambda: create_demografi_chart(data['demografi']))
+    step("create_platform_usage_chart", lambda: create_platform_usage_chart(data['platform']))
+    step("create_konsumsi_chart", lambda: create_konsumsi_chart(data['konsumsi']))
+    step("create_karir_chart", lambda: create_karir_chart(data['karir']))
+    step("create_mental_health_chart", lambda: create_mental_health_chart(data['mental_health']))
+    step("create_segmentasi_chart", lambda: create_segmentasi_chart(data['segmentasi']))
+    if survey_path is not None:
+        step("load_crosstab_index", lambda: load_crosstab_index(*survey_version))
+        step("load_respondent_table", lambda: load_respondent_table(
+            str(survey_path), survey_stat.st_mtime_ns, survey_stat.st_size
+        ))
+
+warmup_status = warmup.start(warm_caches).summary()
+if warmup_status['state'] == warmup.RUNNING:
+    st.sidebar.caption(f"⏳ Menyiapkan cache bagian laporan ({warmup_status['steps']} langkah selesai)...")
+
+# Unduh data di balik chart (exports.py). Tombol memakai data tertunda:
+# bytes baru diambil saat tombol diklik, dari cache per versi data, dan
+# klik tidak memicu rerun
+EXPORT_LABELS = {
+    'demografi': "Demografi",
+    'segmentasi': "Segmentasi",
+    'platform': "Penggunaan Platform",
+    'konsumsi': "Konsumsi Online",
+    'karir': "Minat Karir",
+    'mental_health': "Kesehatan Mental",
+    'roadmap': "Roadmap Implementasi",
+    'research_priority': "Prioritas Penelitian",
+    'agregat_responden': "Agregat Responden"
+}
+
+def export_sources(filters):
+    # nama -> (fungsi versi data, fungsi pemuat DataFrame); keduanya baru
+    # dipanggil saat tombol diklik, jadi halaman tanpa chart tetap ringan
+    from data_loader import data_version, dataset_version
+
+    sources = {
+        name: (lambda name=name: dataset_version(name), lambda name=name: load_dataset(name))
+        for name in CHART_DATASETS + ('roadmap', 'research_priority')
+    }
+    if survey_path is not None:
+        from cube import REFERENCE_DATASETS
+        from query_cache import normalize_filters
+
+        # Data chart dari survei mengikuti filter responden yang aktif; versinya
+        # juga mencakup dataset acuan cube (konsumsi, segmentasi)
+        version = lambda: (  # noqa: E731
+            survey_version, data_version(REFERENCE_DATASETS), normalize_filters(filters)
+        )
+        for name in ('platform', 'konsumsi', 'karir', 'mental_health', 'segmentasi'):
+            sources[name] = (version, lambda name=name: chart_data(filters)[name])
+        sources['agregat_responden'] = (version, lambda: survey_cube.table(filters))
+    return sources
+
+def download_panel(sources):
+    from exports import (
+        FORMATS,
+        XLSX_AVAILABLE,
+        XLSX_MISSING_NOTICE,
+        available_formats,
+        export_bytes,
+        notice_members,
+        zip_file,
+    )
+
+    formats = available_formats()
+    with st.sidebar.container(border=True):
+        if not XLSX_AVAILABLE:
+            st.warning(XLSX_MISSING_NOTICE, icon="⚠️")
+        if survey_path is not None:
+            st.caption("Data survei mengikuti filter responden yang aktif.")
+        for name, (version, load) in sources.items():
+            st.markdown(f"**{EXPORT_LABELS[name]}**")
+            for col, fmt in zip(st.columns(len(formats)), formats):
+                label, mime = FORMATS[fmt]
+                col.download_button(
+                    label,
+                    data=lambda name=name, fmt=fmt, version=version, load=load: export_bytes(
+                        name, fmt, version(), load
+                    ),
+                    file_name=f"{name}.{fmt}",
+                    mime=mime,
+                    key=f"unduh_{name}_{fmt}",
+                    on_click="ignore",
+                    width='stretch'
+                )
+        members = [
+            (f"{fmt}/{name}.{fmt}", fmt, lambda name=name, fmt=fmt, version=version, load=load: export_bytes(
+                name, fmt, version(), load
+            ))
+            for name, (version, load) in sources.items() for fmt in formats
+        ] + notice_members()
+        st.download_button(
+            "📦 Unduh semua (ZIP)",
+            data=lambda: zip_file(members),
+            file_name="medan_youth_insights_data.zip",
+            mime="application/zip",
+            key="unduh_semua",
+            on_click="ignore",
+            type="primary",
+            width='stretch'
+        )
+
+# Tombol unduhan (dan modul exports) baru dibangun bila diminta; tanpa toggle
+# ini setiap rerun di semua bagian ikut membawa puluhan tombol di payload
+if st.sidebar.toggle("⬇️ Unduh data", key="tampilkan_unduhan"):
+    download_panel(export_sources(survey_filters if survey_path is not None else {}))
 
 # Tampilkan konten berdasarkan pilihan sidebar
+instrumentation.start_section(run_metrics)
 if section == "📋 Executive Summary":
     st.markdown('<h2 class="section-header">Executive Summary</h2>', unsafe_allow_html=True)
     
@@ -450,15 +867,7 @@ elif section == "🎯 Pendahuluan & Metodologi":
             """)
             
             # Visualisasi metode
-            metode_data = pd.DataFrame({
-                'Kategori': ['Data Resmi', 'Survei Lembaga', 'Platform Digital', 'Laporan Institusi'],
-                'Proporsi': [35, 25, 25, 15]
-            })
-            
-            fig = px.pie(metode_data, values='Proporsi', names='Kategori',
-                        color_discrete_sequence=px.colors.qualitative.Set3,
-                        height=300)
-            st.plotly_chart(fig, width='stretch')
+            plotly_chart(create_metode_chart(METODE_DATA), width='stretch')
     
     with tab3:
         st.markdown("""
@@ -488,273 +897,300 @@ elif section == "🎯 Pendahuluan & Metodologi":
 elif section == "📈 Analisis Data & Temuan":
     st.markdown('<h2 class="section-header">Analisis Data & Temuan</h2>', unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5 = lazy_tabs([
         "👥 Profil Demografi",
         "📱 Akses Digital",
         "🛍️ Pola Konsumsi",
         "🎓 Aspirasi Karir",
         "💭 Kesehatan Mental"
-    ])
+    ], key="tab_analisis")
     
-    with tab1:
-        st.markdown('<h3 class="subsection-header">Profil Demografi Gen Z Medan</h3>', unsafe_allow_html=True)
+    if tab1 is not None:
+        with tab1:
+            st.markdown('<h3 class="subsection-header">Profil Demografi Gen Z Medan</h3>', unsafe_allow_html=True)
         
-        # Panggil fungsi demografi chart
-        create_demografi_chart()
+            # Panggil fungsi demografi chart
+            fig1, fig2 = create_demografi_chart(demografi_data)
         
-        col1, col2 = st.columns([2, 1])
+            col1, col2 = st.columns(2)
+            with col1:
+                plotly_chart(fig1, width='stretch')
+            with col2:
+                plotly_chart(fig2, width='stretch')
         
-        with col1:
-            st.markdown("""
-            ### 📊 Insight Demografis
+            col1, col2 = st.columns([2, 1])
+        
+            with col1:
+                st.markdown("""
+                ### 📊 Insight Demografis
             
-            **Karakteristik Utama**:
-            - **Rasio Gender**: Seimbang (50.2% Laki-laki, 49.8% Perempuan)
-            - **Distribusi Geografis**: Tertinggi di Kecamatan Medan Kota, Medan Petisah, Medan Barat
-            - **Status Pendidikan**: 65% masih sekolah/kuliah, 35% sudah bekerja/mencari kerja
-            - **Tren Urbanisasi**: Migrasi pemuda dari kabupaten sekitar untuk pendidikan dan kerja
+                **Karakteristik Utama**:
+                - **Rasio Gender**: Seimbang (50.2% Laki-laki, 49.8% Perempuan)
+                - **Distribusi Geografis**: Tertinggi di Kecamatan Medan Kota, Medan Petisah, Medan Barat
+                - **Status Pendidikan**: 65% masih sekolah/kuliah, 35% sudah bekerja/mencari kerja
+                - **Tren Urbanisasi**: Migrasi pemuda dari kabupaten sekitar untuk pendidikan dan kerja
             
-            **Implikasi**:
-            1. **Potensi Pasar**: Segment besar dengan daya beli berkembang
-            2. **Kebutuhan Pendidikan**: Kapasitas sekolah/kampus perlu ditingkatkan
-            3. **Ketersediaan Lapangan Kerja**: Tekanan tinggi untuk penciptaan lapangan kerja
-            """)
-        
-        with col2:
-            st.markdown("""
-            <div class="highlight-box">
-            <h4>📌 Insight Kunci</h4>
-            <p><strong>Total Gen Z Medan</strong>: ~455,500 jiwa</p>
-            <p><strong>Proporsi Populasi</strong>: ~27.3%</p>
-            <p><strong>Pertumbuhan Tahunan</strong>: 1.8% (2020-2024)</p>
-            <p><strong>Kepadatan</strong>: 2,100 jiwa/km²</p>
-            <p><strong>Rata-rata Ukuran Keluarga</strong>: 4 orang</p>
-            </div>
-            """, unsafe_allow_html=True)
+                **Implikasi**:
+                1. **Potensi Pasar**: Segment besar dengan daya beli berkembang
+                2. **Kebutuhan Pendidikan**: Kapasitas sekolah/kampus perlu ditingkatkan
+                3. **Ketersediaan Lapangan Kerja**: Tekanan tinggi untuk penciptaan lapangan kerja
+                """)
+        
+            with col2:
+                st.markdown("""
+                <div class="highlight-box">
+                <h4>📌 Insight Kunci</h4>
+                <p><strong>Total Gen Z Medan</strong>: ~455,500 jiwa</p>
+                <p><strong>Proporsi Populasi</strong>: ~27.3%</p>
+                <p><strong>Pertumbuhan Tahunan</strong>: 1.8% (2020-2024)</p>
+                <p><strong>Kepadatan</strong>: 2,100 jiwa/km²</p>
+                <p><strong>Rata-rata Ukuran Keluarga</strong>: 4 orang</p>
+                </div>
+                """, unsafe_allow_html=True)
             
-            st.dataframe(demografi_data.style.format({
-                'Jumlah (ribu jiwa)': '{:.1f}',
-                'Persentase Populasi Medan': '{:.1f}%'
-            }), width='stretch')
+                dataframe(load_table("demografi"), width='stretch', hide_index=True,
+                          column_config=column_config("demografi"))
     
-    with tab2:
-        st.markdown('<h3 class="subsection-header">Akses & Penggunaan Teknologi Digital</h3>', unsafe_allow_html=True)
+    if tab2 is not None:
+        with tab2:
+            st.markdown('<h3 class="subsection-header">Akses & Penggunaan Teknologi Digital</h3>', unsafe_allow_html=True)
         
-        # Tampilkan dua chart secara terpisah
-        fig1, fig2 = create_platform_usage_chart()
+            # Tampilkan dua chart secara terpisah
+            fig1, fig2 = create_platform_usage_chart(platform_data)
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(fig1, width='stretch')
-        with col2:
-            st.plotly_chart(fig2, width='stretch')
+            col1, col2 = st.columns(2)
+            with col1:
+                plotly_chart(fig1, width='stretch')
+            with col2:
+                plotly_chart(fig2, width='stretch')
         
-        col1, col2, col3 = st.columns(3)
+            col1, col2, col3 = st.columns(3)
         
-        with col1:
-            st.metric("Penetrasi Internet", "80.66%", "+5.2% YoY")
-        with col2:
-            st.metric("Rata-rata Waktu Sosmed", "2.3 jam/hari", "+18 menit")
-        with col3:
-            st.metric("Pengguna Smartphone", "94%", "Hampir universal")
+            with col1:
+                st.metric("Penetrasi Internet", "80.66%", "+5.2% YoY")
+            with col2:
+                st.metric("Rata-rata Waktu Sosmed", "2.3 jam/hari", "+18 menit")
+            with col3:
+                st.metric("Pengguna Smartphone", "94%", "Hampir universal")
         
-        st.markdown("""
-        ### 📈 Trend Penggunaan Platform
+            st.markdown("""
+            ### 📈 Trend Penggunaan Platform
         
-        1. **TikTok Dominan**: 92% Gen Z Medan aktif (95 menit/hari)
-           - Konten favorit: Hiburan, Tutorial, Lifestyle
-           - Pengaruh besar pada tren fashion & kuliner
+            1. **TikTok Dominan**: 92% Gen Z Medan aktif (95 menit/hari)
+               - Konten favorit: Hiburan, Tutorial, Lifestyle
+               - Pengaruh besar pada tren fashion & kuliner
         
-        2. **Instagram** untuk koneksi sosial & ekspresi diri
-           - Stories & Reels paling populer
-           - Platform utama untuk personal branding
+            2. **Instagram** untuk koneksi sosial & ekspresi diri
+               - Stories & Reels paling populer
+               - Platform utama untuk personal branding
         
-        3. **YouTube** untuk edukasi & hiburan panjang
-           - Konten edukasi (tutorial, pembelajaran)
-           - Vlog & konten kreator lokal
+            3. **YouTube** untuk edukasi & hiburan panjang
+               - Konten edukasi (tutorial, pembelajaran)
+               - Vlog & konten kreator lokal
         
-        4. **Spotify** untuk audio streaming & podcast
-           - Playlist personalization
-           - Podcast pendidikan & motivasi
+            4. **Spotify** untuk audio streaming & podcast
+               - Playlist personalization
+               - Podcast pendidikan & motivasi
         
-        5. **E-commerce** terintegrasi dengan sosial media
-           - TikTok Shop pertumbuhan tercepat
-           - Live commerce meningkatkan konversi 3x
-        """)
+            5. **E-commerce** terintegrasi dengan sosial media
+               - TikTok Shop pertumbuhan tercepat
+               - Live commerce meningkatkan konversi 3x
+            """)
     
-    with tab3:
-        st.markdown('<h3 class="subsection-header">Pola Konsumsi & Gaya Hidup</h3>', unsafe_allow_html=True)
+    if tab3 is not None:
+        with tab3:
+            st.markdown('<h3 class="subsection-header">Pola Konsumsi & Gaya Hidup</h3>', unsafe_allow_html=True)
         
-        # Tampilkan dua chart secara terpisah
-        fig1, fig2 = create_konsumsi_chart()
+            konsumsi_panel(konsumsi_data)
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(fig1, width='stretch')
-        with col2:
-            st.plotly_chart(fig2, width='stretch')
-        
-        col1, col2 = st.columns(2)
+            col1, col2 = st.columns(2)
         
-        with col1:
-            st.markdown("""
-            ### 🛒 Karakteristik Pembelian
+            with col1:
+                st.markdown("""
+                ### 🛒 Karakteristik Pembelian
             
-            **Impulsive Buying**: Dipicu oleh:
-            - Konten video pendek (TikTok/Reels): 45%
-            - Live commerce (interaksi real-time): 30%
-            - Promo flash sale & diskon: 25%
+                **Impulsive Buying**: Dipicu oleh:
+                - Konten video pendek (TikTok/Reels): 45%
+                - Live commerce (interaksi real-time): 30%
+                - Promo flash sale & diskon: 25%
             
-            **Preferensi Produk**:
-            1. **Fashion & Aksesoris** (65%)
-               - Streetwear lokal populer
-               - Sustainable fashion mulai tren
+                **Preferensi Produk**:
+                1. **Fashion & Aksesoris** (65%)
+                   - Streetwear lokal populer
+                   - Sustainable fashion mulai tren
             
-            2. **Makanan & Minuman** (58%)
-               - Cafe hopping culture
-               - Makanan viral di media sosial
+                2. **Makanan & Minuman** (58%)
+                   - Cafe hopping culture
+                   - Makanan viral di media sosial
             
-            3. **Produk Kecantikan** (55%)
-               - Skincare > makeup
-               - Brand lokal lebih diminati
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 🏪 Pola Pengeluaran
+                3. **Produk Kecantikan** (55%)
+                   - Skincare > makeup
+                   - Brand lokal lebih diminati
+                """)
+        
+            with col2:
+                st.markdown("""
+                ### 🏪 Pola Pengeluaran
             
-            **Rata-rata Bulanan**: Rp 500K - 1.5Jt
-            **Sumber Dana**:
-            - Orang tua (65%)
-            - Part-time job (25%)
-            - Usaha sampingan (10%)
+                **Rata-rata Bulanan**: Rp 500K - 1.5Jt
+                **Sumber Dana**:
+                - Orang tua (65%)
+                - Part-time job (25%)
+                - Usaha sampingan (10%)
             
-            **Metode Pembayaran**:
-            - Dompet digital (45%)
-            - Transfer bank (35%)
-            - COD (20%)
+                **Metode Pembayaran**:
+                - Dompet digital (45%)
+                - Transfer bank (35%)
+                - COD (20%)
             
-            **Faktor Keputusan**:
-            - Review & testimoni (40%)
-            - Rekomendasi influencer (30%)
-            - Harga & promo (30%)
+                **Faktor Keputusan**:
+                - Review & testimoni (40%)
+                - Rekomendasi influencer (30%)
+                - Harga & promo (30%)
             
-            **Trend Belanja**:
-            - Pre-order items (limited edition)
-            - Group buying (lebih murah)
-            - Second-hand fashion (thrifting)
-            """)
+                **Trend Belanja**:
+                - Pre-order items (limited edition)
+                - Group buying (lebih murah)
+                - Second-hand fashion (thrifting)
+                """)
     
-    with tab4:
-        st.markdown('<h3 class="subsection-header">Aspirasi Pendidikan & Karir</h3>', unsafe_allow_html=True)
+    if tab4 is not None:
+        with tab4:
+            st.markdown('<h3 class="subsection-header">Aspirasi Pendidikan & Karir</h3>', unsafe_allow_html=True)
         
-        fig = create_karir_chart()
-        st.plotly_chart(fig, width='stretch')
+            fig = create_karir_chart(karir_data)
+            plotly_chart(fig, width='stretch')
         
-        st.markdown("""
-        ### 🎯 Orientasi Karir Gen Z Medan
-        
-        **Karir Digital & Wirausaha (35%)**:
-        - **Content Creator**: Gaming, lifestyle, edukasi
-        - **Dropshipper/Reseller**: Fashion, aksesoris, skincare
-        - **Freelancer Digital**: Desain grafis, editing video, social media management
-        - **Startup Founder**: Tech startup, F&B, retail
-        
-        **Sektor Formal (45%)**:
-        - **PNS/ASN**: Stabilitas dan jaminan pensiun
-        - **Perusahaan Swasta**: Gaji kompetitif dan growth opportunity
-        - **BUMN**: Kombinasi stabilitas dan benefit
-        - **Multinational Company**: Exposure internasional
-        
-        **Pilihan Studi Prioritas**:
-        1. **Teknologi Informasi** (25%): Data science, cybersecurity, software engineering
-        2. **Bisnis & Ekonomi** (20%): Digital marketing, finance, entrepreneurship
-        3. **Kesehatan** (18%): Kedokteran, farmasi, nutrisi
-        4. **Pendidikan** (15%): Guru, konselor, pendidikan khusus
-        5. **Lainnya** (22%): Seni, hukum, teknik, sosial
-        """)
+            st.markdown("""
+            ### 🎯 Orientasi Karir Gen Z Medan
+        
+            **Karir Digital & Wirausaha (35%)**:
+            - **Content Creator**: Gaming, lifestyle, edukasi
+            - **Dropshipper/Reseller**: Fashion, aksesoris, skincare
+            - **Freelancer Digital**: Desain grafis, editing video, social media management
+            - **Startup Founder**: Tech startup, F&B, retail
+        
+            **Sektor Formal (45%)**:
+            - **PNS/ASN**: Stabilitas dan jaminan pensiun
+            - **Perusahaan Swasta**: Gaji kompetitif dan growth opportunity
+            - **BUMN**: Kombinasi stabilitas dan benefit
+            - **Multinational Company**: Exposure internasional
+        
+            **Pilihan Studi Prioritas**:
+            1. **Teknologi Informasi** (25%): Data science, cybersecurity, software engineering
+            2. **Bisnis & Ekonomi** (20%): Digital marketing, finance, entrepreneurship
+            3. **Kesehatan** (18%): Kedokteran, farmasi, nutrisi
+            4. **Pendidikan** (15%): Guru, konselor, pendidikan khusus
+            5. **Lainnya** (22%): Seni, hukum, teknik, sosial
+            """)
         
-        # Tambahan data
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Minat Kuliah", "85%", "+5% dari 2020")
-        with col2:
-            st.metric("Prefers Remote Work", "68%", "Fleksibilitas penting")
-        with col3:
-            st.metric("Side Hustle", "42%", "Sudah punya usaha sampingan")
+            # Tambahan data
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Minat Kuliah", "85%", "+5% dari 2020")
+            with col2:
+                st.metric("Prefers Remote Work", "68%", "Fleksibilitas penting")
+            with col3:
+                st.metric("Side Hustle", "42%", "Sudah punya usaha sampingan")
     
-    with tab5:
-        st.markdown('<h3 class="subsection-header">Kesehatan Mental & Isu Sosial</h3>', unsafe_allow_html=True)
+    if tab5 is not None:
+        with tab5:
+            st.markdown('<h3 class="subsection-header">Kesehatan Mental & Isu Sosial</h3>', unsafe_allow_html=True)
         
-        fig = create_mental_health_chart()
-        st.plotly_chart(fig, width='stretch')
+            fig = create_mental_health_chart(mental_health_data)
+            plotly_chart(fig, width='stretch')
         
-        col1, col2 = st.columns(2)
+            col1, col2 = st.columns(2)
         
-        with col1:
-            st.markdown("""
-            ### 😔 Faktor Penyebab
+            with col1:
+                st.markdown("""
+                ### 😔 Faktor Penyebab
             
-            **Akademik (65%)**:
-            - Pressure nilai & ranking
-            - Tugas menumpuk dan deadline
-            - Ekspektasi orang tua tinggi
-            - Kompetisi masuk perguruan tinggi
+                **Akademik (65%)**:
+                - Pressure nilai & ranking
+                - Tugas menumpuk dan deadline
+                - Ekspektasi orang tua tinggi
+                - Kompetisi masuk perguruan tinggi
             
-            **Sosial Media (48%)**:
-            - Fear of Missing Out (FOMO)
-            - Perbandingan sosial dan envy
-            - Cyberbullying dan hate comments
-            - Pressure untuk tampil sempurna
+                **Sosial Media (48%)**:
+                - Fear of Missing Out (FOMO)
+                - Perbandingan sosial dan envy
+                - Cyberbullying dan hate comments
+                - Pressure untuk tampil sempurna
             
-            **Ekonomi & Masa Depan (45%)**:
-            - Keterbatasan finansial keluarga
-            - Ekspektasi kemandirian ekonomi
-            - Ketidakpastian lapangan kerja
-            - Konsumerisme vs kemampuan
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 🛡️ Mekanisme Koping & Dukungan
+                **Ekonomi & Masa Depan (45%)**:
+                - Keterbatasan finansial keluarga
+                - Ekspektasi kemandirian ekonomi
+                - Ketidakpastian lapangan kerja
+                - Konsumerisme vs kemampuan
+                """)
+        
+            with col2:
+                st.markdown("""
+                ### 🛡️ Mekanisme Koping & Dukungan
             
-            **Koping Positif**:
-            - Cerita ke teman dekat (45%)
-            - Hobi & kreativitas (30%)
-            - Olahraga & aktivitas fisik (25%)
-            - Meditasi & mindfulness (15%)
+                **Koping Positif**:
+                - Cerita ke teman dekat (45%)
+                - Hobi & kreativitas (30%)
+                - Olahraga & aktivitas fisik (25%)
+                - Meditasi & mindfulness (15%)
             
-            **Koping Negatif**:
-            - Menarik diri dari sosial (35%)
-            - Overthinking & ruminasi (40%)
-            - Emotional eating (25%)
-            - Begadang & pola tidur buruk (30%)
+                **Koping Negatif**:
+                - Menarik diri dari sosial (35%)
+                - Overthinking & ruminasi (40%)
+                - Emotional eating (25%)
+                - Begadang & pola tidur buruk (30%)
             
-            **Dukungan yang Diinginkan**:
-            - Konseling sekolah/kampus gratis (60%)
-            - Peer support group (45%)
-            - Hotline kesehatan mental 24/7 (35%)
-            - Workshop coping skills (50%)
-            - Aplikasi self-help (40%)
-            """)
+                **Dukungan yang Diinginkan**:
+                - Konseling sekolah/kampus gratis (60%)
+                - Peer support group (45%)
+                - Hotline kesehatan mental 24/7 (35%)
+                - Workshop coping skills (50%)
+                - Aplikasi self-help (40%)
+                """)
+    
+    # Tabulasi silang bebas atas data responden (jika ada), dimuat saat diminta
+    if survey_path is not None and st.toggle("🔀 Tabulasi silang", key="tampilkan_crosstab"):
+        crosstab_panel(load_crosstab_index(*survey_version), survey_filters)
+    
+    # Data responden mentah (jika ada), dimuat hanya saat diminta
+    if survey_path is not None and st.toggle("🗂️ Tampilkan data responden", key="tampilkan_responden"):
+        respondent_viewer(
+            load_respondent_table(str(survey_path), survey_stat.st_mtime_ns, survey_stat.st_size),
+            survey_filters
+        )
 
 elif section == "👥 Segmentasi Gen Z Medan":
     st.markdown('# 👥 Segmentasi Gen Z Medan')
     
-    fig = create_segmentasi_chart()
-    st.plotly_chart(fig, width='stretch')
+    fig = create_segmentasi_chart(segmentasi_data)
+    plotly_chart(fig, width='stretch')
     
     # Tampilkan statistik ringkasan
     col1, col2, col3, col4 = st.columns(4)
     
+    # Persentase diambil dari segmentasi_data (data/segmentasi.csv atau hasil
+    # segmentasi data survei); rentang target tetap dari laporan
+    persen_segmen = segmentasi_data.set_index('Segment')['Persentase']
+    
     with col1:
-        st.metric("Digital-First Urbanites", "40%", "35-45% range")
+        st.metric("Digital-First Urbanites", f"{persen_segmen['Digital-First Urbanites']:g}%", "35-45% range")
     with col2:
-        st.metric("Edu-Career Seekers", "27.5%", "25-30% range")
+        st.metric("Edu-Career Seekers", f"{persen_segmen['Edu-Career Seekers']:g}%", "25-30% range")
     with col3:
-        st.metric("Entrepreneurial Hustlers", "20%", "15-25% range")
+        st.metric("Entrepreneurial Hustlers", f"{persen_segmen['Entrepreneurial Hustlers']:g}%", "15-25% range")
     with col4:
-        st.metric("Tradition-Oriented", "12.5%", "10-15% range")
+        st.metric("Tradition-Oriented", f"{persen_segmen['Tradition-Oriented Youth']:g}%", "10-15% range")
+    
+    if survey_path is not None:
+        from segmentation import load_segment_model
+
+        segment_model = load_segment_model()
+    else:
+        segment_model = None
+    if segment_model is not None:
+        with st.expander("📐 Profil Segmen dari Data Survei (mini-batch k-means)"):
+            dataframe(segment_model.profile_frame(), width='stretch', hide_index=True)
     
     st.markdown("---")
     
@@ -907,287 +1343,225 @@ elif section == "👥 Segmentasi Gen Z Medan":
     # Tabel Ringkasan Rekomendasi
     st.markdown("### 📊 Ringkasan Rekomendasi Segmentasi")
     
-    data_segment = {
-        "Segment": ["Digital-First Urbanites", "Edu-Career Seekers", "Entrepreneurial Hustlers", "Tradition-Oriented Youth"],
-        "Target (%)": ["35-45%", "25-30%", "15-25%", "10-15%"],
-        "Strategi Utama": ["Influencer & Konten Viral", "Edukasi & Karir", "Wirausaha & Bisnis", "Komunitas & Nilai"],
-        "Channel Prioritas": ["TikTok, Instagram", "YouTube, LinkedIn", "Marketplace, WA Business", "Facebook, Grup Komunitas"]
-    }
-    
-    df_segment = pd.DataFrame(data_segment)
-    st.table(df_segment.style.hide(axis="index"))
+    table(text_table("segment_summary"))
 
 elif section == "💡 Implikasi & Rekomendasi":
     st.markdown('<h2 class="section-header">Implikasi & Rekomendasi Strategis</h2>', unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tab1, tab2, tab3, tab4 = lazy_tabs([
         "🏛️ Pemerintah Daerah",
         "🏫 Institusi Pendidikan",
         "💼 Pelaku Bisnis",
         "🤝 LSM & Organisasi"
-    ])
+    ], key="tab_rekomendasi")
     
-    with tab1:
-        st.markdown("""
-        ### 🎯 Rekomendasi untuk Pemkot Medan & Dinas Terkait
-        
-        **1. 🎓 Program Literasi Digital & Keuangan Terintegrasi**
-        - **Kolaborasi Dinas Pendidikan, OJK, Bank Indonesia**
-        - **target** = "SMA & Mahasiswa di 50+ institusi"
-        - **metode** = "Workshop hybrid, mobile app gamification, peer mentoring"
-        - **indikator** = "Pengetahuan 80%, sikap positif 75%, perilaku sehat 70%"
-        - **timeline** = "Q3 2024 - Q4 2025"
-        
-        **2. 💚 Layanan Kesehatan Mental Komprehensif**
-        - **Screening rutin** di 100+ sekolah/kampus
-        - **Training school counselor** (500+ orang tahun 2024)
-        - **Sistem rujukan terintegrasi** dengan puskesmas & rumah sakit
-        - **Hotline 24/7** dengan psikolog profesional
-        - **Mobile app** self-assessment & resources
-        
-        **3. 🚀 Inkubator Wirausaha Remaja Medan**
-        - **Akselerator startup lokal** (100 startup/tahun)
-        - **Digital marketing bootcamp** (2000 peserta/tahun)
-        - **Akses modal mikro** (Rp 5-50 juta/proyek)
-        - **Pasar lokal & ekspor digital** support
-        - **Mentorship network** 500+ pengusaha sukses
-        
-        **4. 🌐 Infrastruktur Digital Inklusif**
-        - **Free WiFi** di 50 ruang publik (perpustakaan, taman, pusat pemuda)
-        - **Digital creative hub** di 5 kecamatan
-        - **Co-working space** terjangkau (Rp 50K/hari)
-        - **Public charging station** di transportasi umum
-        
-        **5. 📊 Youth Data Dashboard Real-time**
-        - Monitoring indikator pemuda berkala
-        - Early warning system isu sosial
-        - Policy simulation tool
-        - Public accountability portal
-        """)
+    if tab1 is not None:
+        with tab1:
+            st.markdown("""
+            ### 🎯 Rekomendasi untuk Pemkot Medan & Dinas Terkait
+        
+            **1. 🎓 Program Literasi Digital & Keuangan Terintegrasi**
+            - **Kolaborasi Dinas Pendidikan, OJK, Bank Indonesia**
+            - **target** = "SMA & Mahasiswa di 50+ institusi"
+            - **metode** = "Workshop hybrid, mobile app gamification, peer mentoring"
+            - **indikator** = "Pengetahuan 80%, sikap positif 75%, perilaku sehat 70%"
+            - **timeline** = "Q3 2024 - Q4 2025"
+        
+            **2. 💚 Layanan Kesehatan Mental Komprehensif**
+            - **Screening rutin** di 100+ sekolah/kampus
+            - **Training school counselor** (500+ orang tahun 2024)
+            - **Sistem rujukan terintegrasi** dengan puskesmas & rumah sakit
+            - **Hotline 24/7** dengan psikolog profesional
+            - **Mobile app** self-assessment & resources
+        
+            **3. 🚀 Inkubator Wirausaha Remaja Medan**
+            - **Akselerator startup lokal** (100 startup/tahun)
+            - **Digital marketing bootcamp** (2000 peserta/tahun)
+            - **Akses modal mikro** (Rp 5-50 juta/proyek)
+            - **Pasar lokal & ekspor digital** support
+            - **Mentorship network** 500+ pengusaha sukses
+        
+            **4. 🌐 Infrastruktur Digital Inklusif**
+            - **Free WiFi** di 50 ruang publik (perpustakaan, taman, pusat pemuda)
+            - **Digital creative hub** di 5 kecamatan
+            - **Co-working space** terjangkau (Rp 50K/hari)
+            - **Public charging station** di transportasi umum
+        
+            **5. 📊 Youth Data Dashboard Real-time**
+            - Monitoring indikator pemuda berkala
+            - Early warning system isu sosial
+            - Policy simulation tool
+            - Public accountability portal
+            """)
         
-        # Roadmap implementation
-        st.markdown("### 🗺️ Roadmap Implementasi 2024-2025")
-        roadmap_data = pd.DataFrame({
-            'Tahap': ['Persiapan (Q3-Q4 2024)', 'Pilot (Q1-Q2 2025)', 'Skala (Q3 2025 - Q1 2026)', 'Evaluasi & Replikasi (Q2 2026)'],
-            'Aktivitas': [
-                'Stakeholder mapping, needs assessment, curriculum development, team formation',
-                'Program di 5 sekolah/kampus perwakilan, feedback collection, adjustment',
-                'Ekspansi ke 50+ institusi, city-wide coverage, digital platform launch',
-                'Impact measurement, satisfaction survey, best practices documentation, replication planning'
-            ],
-            'Indikator Sukses': [
-                'MOU signed 100%, team formed, curriculum approved',
-                'Participation rate >80%, satisfaction >4/5, knowledge improvement >40%',
-                'City coverage 100%, digital adoption >60%, behavioral change >50%',
-                'ROI calculated, policy impact measured, replication readiness 100%'
-            ],
-            'Budget Estimate': [
-                'Rp 2.5 Miliar',
-                'Rp 5 Miliar',
-                'Rp 15 Miliar',
-                'Rp 2 Miliar'
-            ]
-        })
-        
-        st.dataframe(roadmap_data, width='stretch', hide_index=True)
-        
-        # Funding sources
-        st.markdown("### 💰 Sumber Pendanaan Potensial")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("APBD Kota Medan", "40%", "Rp 10M")
-        with col2:
-            st.metric("APBN Kementerian", "35%", "Rp 8.75M")
-        with col3:
-            st.metric("CSR Perusahaan", "25%", "Rp 6.25M")
+            # Roadmap implementation
+            st.markdown("### 🗺️ Roadmap Implementasi 2024-2025")
+            roadmap_data = load_table("roadmap")
+        
+            dataframe(roadmap_data, width='stretch', hide_index=True)
+        
+            # Funding sources
+            st.markdown("### 💰 Sumber Pendanaan Potensial")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("APBD Kota Medan", "40%", "Rp 10M")
+            with col2:
+                st.metric("APBN Kementerian", "35%", "Rp 8.75M")
+            with col3:
+                st.metric("CSR Perusahaan", "25%", "Rp 6.25M")
     
-    with tab2:
-        st.markdown("""
-        ### 🎓 Rekomendasi untuk Sekolah & Kampus di Medan
-        
-        **1. 📚 Kurikulum Integratif Abad 21**
-        - **Literasi finansial** terintegrasi dalam ekonomi, matematika
-        - **Digital safety & ethics** dalam TIK, PPKN
-        - **Mental health awareness** dalam BK, agama
-        - **Entrepreneurship education** project-based learning
-        - **Critical thinking & media literacy** across curriculum
-        
-        **2. 🏫 Ekosistem Support System Holistik**
-        - **Peer counseling program** dengan supervision
-        - **Career guidance center** dengan industry partnership
-        - **Incubator space on campus** untuk student startups
-        - **Alumni mentorship network** terstruktur
-        - **Industry advisory board** untuk kurikulum
-        
-        **3. 📊 Assessment & Development Holistik**
-        - **360° student assessment** beyond academic scores
-        - **Soft skills portfolio** digital & terverifikasi
-        - **Mental wellbeing tracking** dengan privacy protection
-        - **Career readiness assessment** dengan personalized guidance
-        - **Impact measurement** learning outcomes vs employability
-        
-        **4. 💻 Digital Transformation Pendidikan**
-        - **E-learning platform** dengan konten lokal
-        - **Virtual counseling & career services**
-        - **Online internship & project marketplace**
-        - **Digital portfolio system** terintegrasi
-        - **AI-powered personalized learning**
-        
-        **5. 🤝 Community Engagement & Outreach**
-        - **Parent education programs** digital parenting
-        - **Community service requirements** dengan reflection
-        - **Industry immersion programs** regular & structured
-        - **Cross-institution collaboration** resource sharing
-        - **Public seminar & workshop** open for community
-        """)
+    if tab2 is not None:
+        with tab2:
+            st.markdown("""
+            ### 🎓 Rekomendasi untuk Sekolah & Kampus di Medan
+        
+            **1. 📚 Kurikulum Integratif Abad 21**
+            - **Literasi finansial** terintegrasi dalam ekonomi, matematika
+            - **Digital safety & ethics** dalam TIK, PPKN
+            - **Mental health awareness** dalam BK, agama
+            - **Entrepreneurship education** project-based learning
+            - **Critical thinking & media literacy** across curriculum
+        
+            **2. 🏫 Ekosistem Support System Holistik**
+            - **Peer counseling program** dengan supervision
+            - **Career guidance center** dengan industry partnership
+            - **Incubator space on campus** untuk student startups
+            - **Alumni mentorship network** terstruktur
+            - **Industry advisory board** untuk kurikulum
+        
+            **3. 📊 Assessment & Development Holistik**
+            - **360° student assessment** beyond academic scores
+            - **Soft skills portfolio** digital & terverifikasi
+            - **Mental wellbeing tracking** dengan privacy protection
+            - **Career readiness assessment** dengan personalized guidance
+            - **Impact measurement** learning outcomes vs employability
+        
+            **4. 💻 Digital Transformation Pendidikan**
+            - **E-learning platform** dengan konten lokal
+            - **Virtual counseling & career services**
+            - **Online internship & project marketplace**
+            - **Digital portfolio system** terintegrasi
+            - **AI-powered personalized learning**
+        
+            **5. 🤝 Community Engagement & Outreach**
+            - **Parent education programs** digital parenting
+            - **Community service requirements** dengan reflection
+            - **Industry immersion programs** regular & structured
+            - **Cross-institution collaboration** resource sharing
+            - **Public seminar & workshop** open for community
+            """)
+        
+            # Implementation priority
+            st.markdown("### 🎯 Prioritas Implementasi 1 Tahun")
+            priority_data = load_table("implementation_priority")
         
-        # Implementation priority
-        st.markdown("### 🎯 Prioritas Implementasi 1 Tahun")
-        priority_data = pd.DataFrame({
-            'Priority': ['Tinggi (1-3 bulan)', 'Sedang (4-9 bulan)', 'Rendah (10-12 bulan)'],
-            'Program': [
-                'Training guru BK, basic digital safety curriculum, peer counseling pilot',
-                'Career center setup, industry partnerships, mental health screening system',
-                'Full curriculum integration, alumni network activation, digital platform development'
-            ],
-            'Resource Needed': [
-                'Rp 500 juta, 20 trainer, 100 volunteer',
-                'Rp 1.5 miliar, 5 career counselors, industry MOU',
-                'Rp 3 miliar, curriculum experts, tech development team'
-            ]
-        })
-        
-        st.dataframe(priority_data, width='stretch', hide_index=True)
+            dataframe(priority_data, width='stretch', hide_index=True)
     
-    with tab3:
-        st.markdown("""
-        ### 📈 Rekomendasi untuk Bisnis & Industri di Medan
-        
-        **1. 🎯 Gen Z-Centric Marketing Strategy**
-        - **Platform Mix**: TikTok + Instagram + WhatsApp Business
-        - **Content Type**: Authentic, short-form, interactive, value-driven
-        - **Format**: Live commerce, UGC campaigns, AR experiences, micro-influencers
-        - **Payment**: Digital wallet options + financial education
-        - **Language**: Bahasa Medan informal, relatable, inclusive
-        
-        **2. 🛍️ Product & Service Development**
-        - **Youth-centric design thinking** dalam pengembangan produk
-        - **Affordable pricing tiers** dengan flexible payment options
-        - **Sustainability & ethical focus** transparent supply chain
-        - **Personalization & co-creation** involve Gen Z in design process
-        - **Experiential retail** offline spaces that are Instagrammable
-        
-        **3. 💼 Talent Engagement & Development**
-        - **Gen Z internship programs** dengan meaningful projects
-        - **Flexible work arrangements** hybrid, project-based
-        - **Side-hustle friendly policies** recognize diverse income streams
-        - **Digital upskilling opportunities** sponsored certifications
-        - **Mentorship reverse mentoring** Gen Z teach digital skills
-        
-        **4. 🤲 Corporate Responsibility & Community**
-        - **Support youth entrepreneurship** through incubation programs
-        - **Mental health initiatives** employee assistance programs extended to community
-        - **Digital literacy programs** in partnership with schools
-        - **Local content creation support** fund creative projects
-        - **Sustainable consumption education** environmental responsibility
-        
-        **5. 📊 Data-Driven Youth Insights**
-        - **Regular youth market research** local context specific
-        - **Gen Z advisory board** for product development
-        - **Trend forecasting unit** khusus pasar Medan
-        - **Social listening tools** untuk real-time insights
-        - **Collaboration dengan researcher lokal** untuk depth insights
-        """)
+    if tab3 is not None:
+        with tab3:
+            st.markdown("""
+            ### 📈 Rekomendasi untuk Bisnis & Industri di Medan
+        
+            **1. 🎯 Gen Z-Centric Marketing Strategy**
+            - **Platform Mix**: TikTok + Instagram + WhatsApp Business
+            - **Content Type**: Authentic, short-form, interactive, value-driven
+            - **Format**: Live commerce, UGC campaigns, AR experiences, micro-influencers
+            - **Payment**: Digital wallet options + financial education
+            - **Language**: Bahasa Medan informal, relatable, inclusive
+        
+            **2. 🛍️ Product & Service Development**
+            - **Youth-centric design thinking** dalam pengembangan produk
+            - **Affordable pricing tiers** dengan flexible payment options
+            - **Sustainability & ethical focus** transparent supply chain
+            - **Personalization & co-creation** involve Gen Z in design process
+            - **Experiential retail** offline spaces that are Instagrammable
+        
+            **3. 💼 Talent Engagement & Development**
+            - **Gen Z internship programs** dengan meaningful projects
+            - **Flexible work arrangements** hybrid, project-based
+            - **Side-hustle friendly policies** recognize diverse income streams
+            - **Digital upskilling opportunities** sponsored certifications
+            - **Mentorship reverse mentoring** Gen Z teach digital skills
+        
+            **4. 🤲 Corporate Responsibility & Community**
+            - **Support youth entrepreneurship** through incubation programs
+            - **Mental health initiatives** employee assistance programs extended to community
+            - **Digital literacy programs** in partnership with schools
+            - **Local content creation support** fund creative projects
+            - **Sustainable consumption education** environmental responsibility
+        
+            **5. 📊 Data-Driven Youth Insights**
+            - **Regular youth market research** local context specific
+            - **Gen Z advisory board** for product development
+            - **Trend forecasting unit** khusus pasar Medan
+            - **Social listening tools** untuk real-time insights
+            - **Collaboration dengan researcher lokal** untuk depth insights
+            """)
         
-        # Business metrics dashboard
-        st.markdown("### 📊 Youth Business Metrics Dashboard")
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("ROI Target Campaign Gen Z", "3.5x", "vs 2.8x average")
-        with col2:
-            st.metric("Conversion Rate Live Commerce", "8.5%", "+320% vs traditional")
-        with col3:
-            st.metric("Brand Lift & Perception", "+42%", "Gen Z brand affinity")
-        with col4:
-            st.metric("Customer Lifetime Value", "Rp 4.2Jt", "5-year projection")
-        
-        # Success case examples
-        st.markdown("### 🏆 Best Practice Examples")
-        success_cases = pd.DataFrame({
-            'Company': ['Local Fashion Brand A', 'Food & Beverage B', 'Tech Startup C', 'Retail Chain D'],
-            'Strategy': [
-                'TikTok UGC contest with local creators',
-                'Instagram Reels recipe challenges',
-                'Campus ambassador program with equity',
-                'Co-working space with youth discounts'
-            ],
-            'Result': [
-                '+200% sales, 50K new followers',
-                'Viral trend, 300% outlet traffic',
-                '100 campus reps, 40% user growth',
-                '85% occupancy, community hub status'
-            ]
-        })
-        
-        st.dataframe(success_cases, width='stretch', hide_index=True)
-    
-    with tab4:
-        st.markdown("""
-        ### 🤲 Rekomendasi untuk LSM & Organisasi Pemuda Medan
-        
-        **1. 🌱 Program Advokasi & Empowerment Berkelanjutan**
-        - **Youth entrepreneurship training** dengan follow-up mentoring
-        - **Mental health peer support** networks dengan professional backup
-        - **Digital rights advocacy** untuk safe online spaces
-        - **Community mapping initiatives** untuk resource optimization
-        - **Leadership development** untuk sustainable impact
-        
-        **2. 🤝 Platform Kolaborasi Multi-Stakeholder**
-        - **Medan Youth Coalition** network of 100+ youth organizations
-        - **Knowledge sharing portal** best practices & resources
-        - **Crowdfunding platform** untuk youth social projects
-        - **Volunteer matching system** skills-based opportunities
-        - **Policy dialogue forums** regular youth-government-business meetings
-        
-        **3. 🔬 Research & Development Berbasis Bukti**
-        - **Localized youth studies** Medan-specific issues & opportunities
-        - **Program impact evaluation** rigorous measurement & reporting
-        - **Best practices documentation** case studies & toolkits
-        - **Policy recommendation papers** data-driven advocacy
-        - **Longitudinal studies** tracking changes over time
-        
-        **4. 🌍 International Linkages & Exchange**
-        - **Youth exchange programs** dengan kota sister Medan
-        - **Global network participation** ASEAN youth networks
-        - **International funding access** grant writing support
-        - **Cross-cultural learning** virtual exchange programs
-        - **Best practice adaptation** global to local contextualization
-        
-        **5. 🎨 Creative & Cultural Expression Support**
-        - **Youth arts & culture festivals** showcasing local talent
-        - **Digital content creation labs** equipment & training access
-        - **Heritage preservation projects** youth-led documentation
-        - **Creative entrepreneurship** arts-based business incubation
-        - **Public space activation** youth-led urban interventions
-        """)
+            # Business metrics dashboard
+            st.markdown("### 📊 Youth Business Metrics Dashboard")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("ROI Target Campaign Gen Z", "3.5x", "vs 2.8x average")
+            with col2:
+                st.metric("Conversion Rate Live Commerce", "8.5%", "+320% vs traditional")
+            with col3:
+                st.metric("Brand Lift & Perception", "+42%", "Gen Z brand affinity")
+            with col4:
+                st.metric("Customer Lifetime Value", "Rp 4.2Jt", "5-year projection")
+        
+            # Success case examples
+            st.markdown("### 🏆 Best Practice Examples")
+            success_cases = load_table("success_cases")
+        
+            dataframe(success_cases, width='stretch', hide_index=True)
+    
+    if tab4 is not None:
+        with tab4:
+            st.markdown("""
+            ### 🤲 Rekomendasi untuk LSM & Organisasi Pemuda Medan
+        
+            **1. 🌱 Program Advokasi & Empowerment Berkelanjutan**
+            - **Youth entrepreneurship training** dengan follow-up mentoring
+            - **Mental health peer support** networks dengan professional backup
+            - **Digital rights advocacy** untuk safe online spaces
+            - **Community mapping initiatives** untuk resource optimization
+            - **Leadership development** untuk sustainable impact
+        
+            **2. 🤝 Platform Kolaborasi Multi-Stakeholder**
+            - **Medan Youth Coalition** network of 100+ youth organizations
+            - **Knowledge sharing portal** best practices & resources
+            - **Crowdfunding platform** untuk youth social projects
+            - **Volunteer matching system** skills-based opportunities
+            - **Policy dialogue forums** regular youth-government-business meetings
+        
+            **3. 🔬 Research & Development Berbasis Bukti**
+            - **Localized youth studies** Medan-specific issues & opportunities
+            - **Program impact evaluation** rigorous measurement & reporting
+            - **Best practices documentation** case studies & toolkits
+            - **Policy recommendation papers** data-driven advocacy
+            - **Longitudinal studies** tracking changes over time
+        
+            **4. 🌍 International Linkages & Exchange**
+            - **Youth exchange programs** dengan kota sister Medan
+            - **Global network participation** ASEAN youth networks
+            - **International funding access** grant writing support
+            - **Cross-cultural learning** virtual exchange programs
+            - **Best practice adaptation** global to local contextualization
+        
+            **5. 🎨 Creative & Cultural Expression Support**
+            - **Youth arts & culture festivals** showcasing local talent
+            - **Digital content creation labs** equipment & training access
+            - **Heritage preservation projects** youth-led documentation
+            - **Creative entrepreneurship** arts-based business incubation
+            - **Public space activation** youth-led urban interventions
+            """)
         
-        # Capacity building framework
-        st.markdown("### 🏗️ Capacity Building Framework")
-        capacity_data = pd.DataFrame({
-            'Level': ['Individual Youth', 'Youth Organizations', 'Ecosystem'],
-            'Focus Areas': [
-                'Skills training, mentorship, personal development, mental wellbeing',
-                'Organizational development, fundraising, program management, networking',
-                'Policy advocacy, multi-stakeholder coordination, resource mobilization, systemic change'
-            ],
-            'Key Programs': [
-                'Leadership bootcamps, skill certifications, personal coaching',
-                'Organizational assessment, grant writing workshops, partnership building',
-                'Policy roundtables, cross-sector task forces, collective impact initiatives'
-            ]
-        })
-        
-        st.dataframe(capacity_data, width='stretch', hide_index=True)
+            # Capacity building framework
+            st.markdown("### 🏗️ Capacity Building Framework")
+            capacity_data = load_table("capacity_building")
+        
+            dataframe(capacity_data, width='stretch', hide_index=True)
 
 elif section == "📚 Kesimpulan & Referensi":
     st.markdown('<h2 class="section-header">Kesimpulan & Referensi</h2>', unsafe_allow_html=True)
@@ -1313,36 +1687,10 @@ elif section == "📚 Kesimpulan & Referensi":
     # Rekomendasi Penelitian Lanjutan
     st.markdown('<h3 class="subsection-header">🔬 Rekomendasi Penelitian Lanjutan</h3>', unsafe_allow_html=True)
 
-    research_priority = pd.DataFrame({
-        'Priority': ['Tinggi', 'Tinggi', 'Tinggi', 'Sedang', 'Sedang', 'Sedang', 'Sedang', 'Rendah', 'Rendah', 'Rendah'],
-        'Research Topics': [
-            'Survei primer representatif di Medan (n=2000, stratified sampling SMA & mahasiswa)',
-            'Studi longitudinal dampak media sosial terhadap kesehatan mental',
-            'Evaluasi program literasi digital/keuangan (pre-post intervention dengan control group)',
-            'Analisis komparatif Medan vs kota besar Indonesia lainnya (benchmarking study)',
-            'Deep-dive qualitative motivasi & barriers entrepreneurship Gen Z Medan',
-            'Impact assessment mental health interventions di setting sekolah/kampus',
-            'Digital ethnography perilaku online Gen Z Medan (social media analysis)',
-            'Economic impact analysis youth entrepreneurship ecosystem di Medan',
-            'Policy analysis youth-focused policies & programs effectiveness',
-            'Future skills forecasting untuk kebutuhan pasar kerja Medan 2030'
-        ],
-        'Alasan': [
-            'Mengisi gap data spesifik Medan yang masih terbatas dalam laporan ini',
-            'Mengukur dampak jangka panjang media sosial terhadap kesehatan mental Gen Z Medan',
-            'Mengukur efektivitas intervensi literasi digital/keuangan yang sudah berjalan',
-            'Memahami posisi Medan dalam konteks nasional dan belajar best practices',
-            'Memahami motivasi mendalam dan hambatan wirausaha Gen Z Medan',
-            'Mengukur dampak nyata program kesehatan mental di lingkungan pendidikan',
-            'Memahami perilaku online Gen Z Medan secara natural dan kontekstual',
-            'Mengukur kontribusi ekonomi dari ekosistem wirausaha pemuda Medan',
-            'Mengevaluasi efektivitas kebijakan dan program yang sudah diimplementasikan',
-            'Mempersiapkan Gen Z Medan untuk kebutuhan keterampilan masa depan'
-        ]
-    })
+    research_priority = load_dataset("research_priority")
 
     # Tampilkan tabel lengkap
-    st.dataframe(research_priority, width='stretch', hide_index=True)
+    dataframe(load_table("research_priority"), width='stretch', hide_index=True)
 
     # Atau jika ingin mengelompokkan berdasarkan prioritas:
     st.markdown("---")
@@ -1375,22 +1723,22 @@ elif section == "📚 Kesimpulan & Referensi":
     st.markdown("---")
     st.markdown("### 📋 Detail Rekomendasi Penelitian")
 
-    tab1, tab2, tab3 = st.tabs(["🔥 Prioritas Tinggi", "⚖️ Prioritas Sedang", "📘 Prioritas Rendah"])
+    tab1, tab2, tab3 = lazy_tabs(["🔥 Prioritas Tinggi", "⚖️ Prioritas Sedang", "📘 Prioritas Rendah"], key="tab_prioritas")
 
-    with tab1:
-        high_df = research_priority[research_priority['Priority'] == 'Tinggi']
-        st.dataframe(high_df[['Research Topics', 'Alasan']], 
-                    width='stretch', hide_index=True)
-        
-    with tab2:
-        medium_df = research_priority[research_priority['Priority'] == 'Sedang']
-        st.dataframe(medium_df[['Research Topics', 'Alasan']], 
-                    width='stretch', hide_index=True)
-        
-    with tab3:
-        low_df = research_priority[research_priority['Priority'] == 'Rendah']
-        st.dataframe(low_df[['Research Topics', 'Alasan']], 
-                    width='stretch', hide_index=True)
+    if tab1 is not None:
+        with tab1:
+            high_df = load_table("research_priority", columns=RESEARCH_COLUMNS, where={'Priority': 'Tinggi'})
+            dataframe(high_df, width='stretch', hide_index=True)
+        
+    if tab2 is not None:
+        with tab2:
+            medium_df = load_table("research_priority", columns=RESEARCH_COLUMNS, where={'Priority': 'Sedang'})
+            dataframe(medium_df, width='stretch', hide_index=True)
+        
+    if tab3 is not None:
+        with tab3:
+            low_df = load_table("research_priority", columns=RESEARCH_COLUMNS, where={'Priority': 'Rendah'})
+            dataframe(low_df, width='stretch', hide_index=True)
 
     # Tambahan: Ringkasan alasan prioritas
     st.markdown("---")
@@ -1444,6 +1792,8 @@ elif section == "📚 Kesimpulan & Referensi":
     ***"Investasi terbaik untuk masa depan adalah investasi pada generasi mudanya hari ini."***
     """)
 
+instrumentation.end_section(run_metrics)
+
 # Footer
 st.markdown("---")
 col1, col2 = st.columns(2)
@@ -1453,4 +1803,32 @@ with col1:
 with col2:
     st.markdown("**⚠️ Disclaimer:** Estimasi berdasarkan data sekunder terverifikasi")
 
-st.markdown("<p style='text-align: center; color: #64748B; font-size: 0.9rem;'>© FXF28 MEDAN YOUTH INSIGHTS - Analisis Komprehensif Gen Z Medan</p>", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown("<p style='text-align: center; color: #64748B; font-size: 0.9rem;'>© FXF28 MEDAN YOUTH INSIGHTS - Analisis Komprehensif Gen Z Medan</p>", unsafe_allow_html=True)
+
+# Panel debug performa (opt-in): hanya ada saat instrumentasi aktif
+metrics_record = instrumentation.end_run(run_metrics)
+if metrics_record is not None and st.sidebar.checkbox("🛠️ Panel debug performa", key="debug_metrics"):
+    import pandas as pd
+
+    with st.sidebar.expander(f"Rerun ini: {metrics_record['total_ms']:.0f} ms", expanded=True):
+        st.dataframe(pd.DataFrame(metrics_record['spans']), width='stretch', hide_index=True)
+    with st.sidebar.expander("Agregat proses"):
+        st.dataframe(
+            pd.DataFrame.from_dict(instrumentation.REGISTRY.snapshot(), orient='index')
+            .rename_axis('span').reset_index(),
+            width='stretch', hide_index=True
+        )
+        st.caption(f"Log: {instrumentation.LOG_PATH} · Prometheus: {instrumentation.PROMETHEUS_PATH}")
+    if warmup.WARMUP.steps:
+        with st.sidebar.expander(f"Pemanasan cache: {warmup.status()['state']}"):
+            st.dataframe(pd.DataFrame(warmup.WARMUP.steps), width='stretch', hide_index=True)
+    from query_cache import SHARED
+
+    cache_stats = {cache.name: cache.stats() for cache in SHARED if cache.hits + cache.misses}
+    if cache_stats:
+        with st.sidebar.expander("Cache bersama (agregat, ekspor)"):
+            st.dataframe(
+                pd.DataFrame({name: [f"{v:,}" for v in stats.values()] for name, stats in cache_stats.items()},
+                             index=list(next(iter(cache_stats.values())))).rename_axis('statistik').reset_index(),
+                width='stretch', hide_index=True
+            )
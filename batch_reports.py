@@ -0,0 +1,215 @@
+import argparse
+import html
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from data_loader import RESPONDEN_ENV, load_all, respondent_path
+
+# Mode batch laporan per institusi (target roadmap: 50+ sekolah/kampus).
+# File responden dibaca sekali (per chunk) lalu dipecah per institusi menjadi file
+# Parquet kecil; setiap laporan dirender oleh export_static (AppTest, fungsi
+# chart app.py yang sama) dengan MEDAN_RESPONDEN menunjuk file institusi
+# tersebut, lalu ditulis sebagai HTML statis. Rendering berjalan di process
+# pool: dataset data/, model segmen, margin populasi dan modul berat dimuat
+# sekali di proses induk sebelum fork sehingga worker berbagi salinan
+# read-only-nya (initializer memuat ulang jika platform tidak mendukung
+# fork). plotly.js ditulis sekali ke folder output dan dirujuk semua laporan.
+# Pool bootstrap CI di dalam tiap worker dibatasi ke sisa core (CPU / worker)
+# agar total proses tidak menjadi CPU x CPU.
+#
+#   python batch_reports.py [--out dist/institusi] [--workers 4] [--min-responden 10]
+APP_DIR = Path(__file__).parent
+DEFAULT_OUT = APP_DIR / "dist" / "institusi"
+INSTITUTION_COLUMN = 'institusi'
+
+# Institusi dengan responden lebih sedikit tidak dibuatkan laporan (angka
+# tidak stabil dan responden mudah dikenali)
+DEFAULT_MIN_RESPONDENTS = 10
+
+PLOTLY_FILE = "plotly.min.js"
+
+
+def slugify(name):
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-') or 'institusi'
+
+
+def split_respondents(path, directory, column=INSTITUTION_COLUMN, min_respondents=DEFAULT_MIN_RESPONDENTS,
+                      chunksize=None):
+    # Satu file Parquet per institusi; mengembalikan (daftar tugas, dilewati).
+    # File dibaca per chunk dan tiap chunk langsung ditambahkan ke writer
+    # Parquet institusinya, jadi memori tetap sebesar satu chunk
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from survey import DEFAULT_CHUNKSIZE, available_columns, iter_chunks
+
+    path, directory = Path(path), Path(directory)
+    if column not in available_columns(path):
+        raise ValueError(f"Kolom '{column}' tidak ada di {path}")
+
+    schema = None
+    writers, parts, counts = {}, {}, {}
+    try:
+        for chunk in iter_chunks(path, chunksize or DEFAULT_CHUNKSIZE):
+            if schema is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                if path.suffix != ".parquet":
+                    # Chunk CSV berikutnya bisa membaca kolom int sebagai float
+                    # (ada nilai kosong); skema writer harus tetap sama
+                    schema = pa.schema([
+                        field.with_type(pa.float64()) if pa.types.is_integer(field.type) else field
+                        for field in schema
+                    ])
+            for name, group in chunk.groupby(column, sort=False):
+                if name not in writers:
+                    parts[name] = directory / f"_bagian-{len(parts)}.parquet"
+                    writers[name] = pq.ParquetWriter(parts[name], schema)
+                writers[name].write_table(pa.Table.from_pandas(group, schema=schema, preserve_index=False))
+                counts[name] = counts.get(name, 0) + len(group)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    tasks, skipped = [], []
+    slugs = set()
+    for name in sorted(counts):
+        if counts[name] < min_respondents:
+            skipped.append((name, counts[name]))
+            parts[name].unlink()
+            continue
+        slug = slugify(name)
+        while slug in slugs:
+            slug += '-'
+        slugs.add(slug)
+        part = parts[name].rename(directory / f"{slug}.parquet")
+        tasks.append({'institution': str(name), 'slug': slug, 'path': part, 'n': counts[name]})
+    return tasks, skipped
+
+
+def _prepare():
+    # Dimuat sekali per proses (induk sebelum fork, atau initializer worker)
+    os.environ["MEDAN_LAZY_TABS"] = "0"
+    sys.path.insert(0, str(APP_DIR))
+    import export_static  # noqa: F401
+    import streamlit.testing.v1  # noqa: F401
+
+    load_all()
+
+
+def render_report(task, out_dir):
+    from export_static import build_html, render_sections
+
+    start = time.perf_counter()
+    os.environ[RESPONDEN_ENV] = str(task['path'])
+    try:
+        document = build_html(render_sections(), title=task['institution'], plotly_src=PLOTLY_FILE)
+        out = Path(out_dir) / f"{task['slug']}.html"
+        out.write_text(document, encoding='utf-8')
+        return dict(task, out=out, bytes=out.stat().st_size, seconds=time.perf_counter() - start, error=None)
+    except Exception as exc:  # noqa: BLE001
+        return dict(task, out=None, bytes=0, seconds=time.perf_counter() - start,
+                    error=f"{type(exc).__name__}: {exc}")
+    finally:
+        os.environ.pop(RESPONDEN_ENV, None)
+
+
+def write_index(out_dir, results, skipped):
+    rows = ''.join(
+        f'<tr><td><a href="{html.escape(r["out"].name)}">{html.escape(r["institution"])}</a></td>'
+        f'<td>{r["n"]:,}</td></tr>'
+        for r in sorted(results, key=lambda r: r['institution']) if r['error'] is None
+    )
+    note = (
+        f'<p>{len(skipped)} institusi dilewati (kurang dari batas minimum responden).</p>' if skipped else ''
+    )
+    document = (
+        '<!DOCTYPE html><html lang="id"><head><meta charset="utf-8">'
+        '<title>MEDAN YOUTH INSIGHTS — Laporan per Institusi</title>'
+        '<style>body { font-family: sans-serif; margin: 2rem; } table { border-collapse: collapse; } '
+        'td, th { border: 1px solid #E2E8F0; padding: 0.4rem 0.8rem; text-align: left; }</style>'
+        '</head><body><h1>Laporan per Institusi</h1>'
+        f'<table><tr><th>Institusi</th><th>Responden</th></tr>{rows}</table>{note}'
+        '</body></html>'
+    )
+    path = Path(out_dir) / "index.html"
+    path.write_text(document, encoding='utf-8')
+    return path
+
+
+def run(out_dir=DEFAULT_OUT, workers=None, min_respondents=DEFAULT_MIN_RESPONDENTS, column=INSTITUTION_COLUMN,
+        limit=None, log=print):
+    path = respondent_path()
+    if path is None:
+        raise FileNotFoundError("File responden (data/responden.parquet atau data/responden.csv) tidak ditemukan")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    from plotly.offline import get_plotlyjs
+
+    from bootstrap import WORKERS_ENV as BOOTSTRAP_WORKERS_ENV
+
+    # Diwarisi worker (fork maupun spawn) lewat environment
+    os.environ[BOOTSTRAP_WORKERS_ENV] = str(max(1, (os.cpu_count() or 1) // workers))
+
+    (out_dir / PLOTLY_FILE).write_text(get_plotlyjs(), encoding='utf-8')
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="medan-institusi-") as parts:
+        tasks, skipped = split_respondents(path, parts, column, min_respondents)
+        tasks = tasks[:limit] if limit else tasks
+        log(f"{len(tasks)} institusi dari {path.name} ({len(skipped)} dilewati, < {min_respondents} responden), "
+            f"{workers} worker, dipecah dalam {time.perf_counter() - start:.1f} dtk")
+
+        _prepare()
+        # fork: worker mewarisi data & modul yang sudah dimuat tanpa menyalin
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=None if 'fork' in methods else _prepare) as pool:
+            futures = [pool.submit(render_report, task, out_dir) for task in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results.append(result)
+                elapsed = time.perf_counter() - start
+                eta = elapsed / done * (len(tasks) - done)
+                status = f"GAGAL {result['error']}" if result['error'] else f"{result['bytes'] / 1024:.0f} KB"
+                log(f"[{done:>{len(str(len(tasks)))}}/{len(tasks)}] {result['institution']:<28} "
+                    f"{result['n']:>6,} responden  {result['seconds']:>5.1f} dtk  {status}  (sisa ~{eta:.0f} dtk)")
+
+    index = write_index(out_dir, results, skipped)
+    elapsed = time.perf_counter() - start
+    ok = [r for r in results if r['error'] is None]
+    total_bytes = sum(r['bytes'] for r in ok)
+    log(f"{len(ok)}/{len(tasks)} laporan ditulis ke {out_dir} dalam {elapsed:.1f} dtk: "
+        f"{len(ok) / elapsed:.2f} laporan/dtk ({len(ok) / elapsed * 60:.0f} laporan/menit), "
+        f"{total_bytes / 1024 / 1024:.1f} MB; indeks: {index}")
+    return results, skipped, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render laporan HTML statis per institusi secara paralel")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help=f"Folder output (default: {DEFAULT_OUT})")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument("--min-responden", type=int, default=DEFAULT_MIN_RESPONDENTS, dest="min_respondents")
+    parser.add_argument("--kolom", default=INSTITUTION_COLUMN, dest="column", help="Kolom institusi")
+    parser.add_argument("--limit", type=int, default=None, help="Hanya N institusi pertama (uji cepat)")
+    args = parser.parse_args()
+
+    results, _, _ = run(args.out, args.workers, args.min_respondents, args.column, args.limit)
+    return 1 if any(r['error'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    # AppTest mengganti modul __main__ saat merender; jalankan lewat modul
+    # bernama agar fungsi worker tetap bisa di-pickle
+    import batch_reports
+
+    sys.exit(batch_reports.main())
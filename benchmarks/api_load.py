@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Uji beban api.py: server dijalankan sebagai proses terpisah yang dikunci ke
+# satu core (jika mesin punya lebih dari satu core, klien memakai core lain),
+# lalu beberapa proses klien mengirim GET keep-alive secara bersamaan selama
+# durasi tertentu per skenario: payload JSON/Arrow dari cache, revalidasi
+# 304 dengan If-None-Match, dan agregat survei dengan filter.
+#
+#   python benchmarks/api_load.py [--seconds 5] [--connections 32] [--clients 2]
+APP_DIR = Path(__file__).resolve().parent.parent
+
+SCENARIOS = (
+    ("JSON 200", "/api/datasets/platform", False),
+    ("Arrow 200", "/api/datasets/platform.arrow", False),
+    ("JSON 304 (If-None-Match)", "/api/datasets/platform", True),
+    ("indeks /api 304", "/api", True),
+    ("survei + filter 200", "/api/survey/platform?gender=Perempuan", False),
+)
+
+
+async def _connection(host, port, request, deadline, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def _client(host, port, request, seconds, connections, cpus, queue):
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpus)
+    latencies = []
+
+    async def run():
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*[_connection(host, port, request, deadline, latencies) for _ in range(connections)])
+
+    asyncio.run(run())
+    queue.put(latencies)
+
+
+def load(host, port, path, etag, seconds, connections, clients, cpus):
+    headers = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+    if etag:
+        headers += f"If-None-Match: {etag}\r\n"
+    request = (headers + "\r\n").encode()
+    queue = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(target=_client, args=(host, port, request, seconds, connections // clients or 1,
+                                                      cpus, queue))
+        for _ in range(clients)
+    ]
+    for proc in procs:
+        proc.start()
+    latencies = [latency for _ in procs for latency in queue.get()]
+    for proc in procs:
+        proc.join()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji beban API laporan (satu core server)")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--clients", type=int, default=2, help="Jumlah proses klien")
+    parser.add_argument("--port", type=int, default=8650)
+    args = parser.parse_args()
+
+    host = "127.0.0.1"
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+    server_cpu = {cpus[0]} if cpus else None
+    client_cpus = set(cpus[1:]) or None
+
+    def pin():
+        if server_cpu and hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, server_cpu)
+
+    server = subprocess.Popen([sys.executable, str(APP_DIR / "api.py"), "--host", host, "--port", str(args.port)],
+                              preexec_fn=pin, stdout=subprocess.PIPE, text=True)
+    try:
+        server.stdout.readline()
+        base = f"http://{host}:{args.port}"
+        if not client_cpus:
+            print("Peringatan: hanya satu core, klien dan server berbagi core yang sama")
+        print(f"server di core {sorted(server_cpu) if server_cpu else '?'}, {args.clients} proses klien, "
+              f"{args.connections} koneksi keep-alive, {args.seconds:g} dtk per skenario\n")
+        print(f"{'skenario':<28} {'req/dtk':>9} {'p50':>9} {'p99':>9} {'request':>9}")
+        for label, path, revalidate in SCENARIOS:
+            try:
+                # Request pertama: payload diserialisasi sekali dan ETag dicatat
+                with urllib.request.urlopen(base + path) as response:
+                    etag = response.headers['ETag']
+            except urllib.error.HTTPError as exc:
+                print(f"{label:<28} dilewati ({exc.code})")
+                continue
+            latencies = load(host, args.port, path, etag if revalidate else None, args.seconds,
+                             args.connections, args.clients, client_cpus)
+            latencies.sort()
+            print(f"{label:<28} {len(latencies) / args.seconds:>9,.0f} "
+                  f"{statistics.median(latencies) * 1000:>6.2f} ms "
+                  f"{latencies[int(len(latencies) * 0.99)] * 1000:>6.2f} ms {len(latencies):>9,}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Benchmark rerun end-to-end per bagian sidebar (dan per tab) lewat AppTest
+# headless. Tiap kasus diukur: waktu dinding rerun (median beberapa ulangan,
+# tanpa tracemalloc), puncak memori Python saat rerun (satu ulangan dengan
+# tracemalloc setelah kasus dipanaskan) dan ukuran payload protobuf yang
+# dikirim ke browser.
+#
+#   python benchmarks/bench_sections.py              # bandingkan dengan baseline
+#   python benchmarks/bench_sections.py --update     # tulis baseline baru
+#
+# Keluar dengan kode 1 bila ada kasus yang melewati ambang regresi.
+#
+# AppTest membuat ScriptCache baru tiap run sehingga app.py dikompilasi ulang
+# di setiap rerun; di sini satu ScriptCache dipakai bersama (seperti server,
+# yang meng-cache bytecode sekali) agar puncak KB mengukur rerun bagian itu
+# sendiri, bukan kompilasi app.py. Perubahan yang sengaja menggeser angka harus
+# menulis ulang baseline (--update) di commit yang sama dan menyebutkannya di
+# pesan commit; digest app.py di baseline dipakai untuk mengingatkan hal ini.
+APP_DIR = Path(__file__).resolve().parent.parent
+APP_PATH = APP_DIR / "app.py"
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "sections.json"
+
+sys.path.insert(0, str(APP_DIR))
+
+from export_static import SECTIONS  # noqa: E402
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.5
+# Selisih waktu di bawah ini dianggap derau, bukan regresi
+MIN_WALL_DELTA_MS = 50.0
+METRICS = ('wall_ms', 'peak_kb', 'payload_kb')
+
+
+def payload_bytes(node):
+    from streamlit.testing.v1.element_tree import Block
+
+    total = 0
+    for child in node.children.values():
+        proto = getattr(child, 'proto', None)
+        if proto is not None:
+            total += proto.ByteSize()
+        if isinstance(child, Block):
+            total += payload_bytes(child)
+    return total
+
+
+def _tab_radio(at):
+    # Pemilih tab ringan (lazy_tabs) adalah radio di area utama dengan key tab_*
+    for radio in at.main.radio:
+        if radio.key and radio.key.startswith('tab_'):
+            return radio
+    return None
+
+
+def measure(at, apply, repeat):
+    def rerun():
+        apply()
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    walls = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rerun()
+        walls.append((time.perf_counter() - start) * 1000)
+
+    # Kasus sudah panas (bytecode & cache terisi); puncak dihitung dari tepat
+    # sebelum rerun yang diukur
+    tracemalloc.start()
+    try:
+        apply()
+        tracemalloc.reset_peak()
+        at.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    return {
+        'wall_ms': round(statistics.median(walls), 2),
+        'peak_kb': round(peak / 1024, 1),
+        'payload_kb': round((payload_bytes(at.main) + payload_bytes(at.sidebar)) / 1024, 1)
+    }
+
+
+def run_suite(repeat=DEFAULT_REPEAT, timeout=120):
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+
+    script_cache = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    # Run pertama membangun semua cache; dicatat terpisah sebagai cold start
+    start = time.perf_counter()
+    at.run()
+    results = {'cold_start': {'wall_ms': round((time.perf_counter() - start) * 1000, 2)}}
+
+    for section in SECTIONS:
+        results[section] = measure(at, lambda: at.sidebar.radio[0].set_value(section), repeat)
+        radio = _tab_radio(at)
+        if radio is None:
+            continue
+        key = radio.key
+        for option in radio.options:
+            results[f"{section} / {option}"] = measure(
+                at, lambda: at.radio(key=key).set_value(option), repeat)
+        # Kembalikan ke tab pertama agar run bagian berikutnya sebanding
+        at.radio(key=key).set_value(radio.options[0]).run()
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        for metric in METRICS:
+            if metric not in current or not base.get(metric):
+                continue
+            ratio = current[metric] / base[metric]
+            if ratio <= threshold:
+                continue
+            if metric == 'wall_ms' and current[metric] - base[metric] < MIN_WALL_DELTA_MS:
+                continue
+            regressions.append((case, metric, base[metric], current[metric], ratio))
+    return regressions
+
+
+def app_version():
+    return hashlib.blake2b(APP_PATH.read_bytes(), digest_size=16).hexdigest()
+
+
+def environment():
+    import streamlit
+
+    from data_loader import data_version
+
+    return {
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'machine': platform.machine(),
+        'data_version': data_version(),
+        'app_version': app_version()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rerun per bagian laporan")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="rasio terhadap baseline yang dianggap regresi")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--update", action="store_true", help="simpan hasil sebagai baseline")
+    args = parser.parse_args()
+
+    results = run_suite(args.repeat)
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8')) if baseline_path.exists() else None
+
+    print(f"{'kasus':<58} {'ms':>9} {'puncak KB':>10} {'payload KB':>11}")
+    for case, r in results.items():
+        print(f"{case:<58} {r['wall_ms']:>9.1f} {r.get('peak_kb', 0):>10.1f} {r.get('payload_kb', 0):>11.1f}")
+
+    if args.update or baseline is None:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({'environment': environment(), 'results': results},
+                                            indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"Baseline ditulis ke {baseline_path}")
+        return 0
+
+    current = environment()
+    if baseline.get('environment', {}).get('data_version') != current['data_version']:
+        print("Peringatan: versi data berbeda dengan baseline, perbandingan mungkin tidak sebanding")
+    if baseline.get('environment', {}).get('app_version') != current['app_version']:
+        print("Peringatan: app.py berubah sejak baseline ditulis; bila angka bergeser karena perubahan yang "
+              "disengaja, tulis ulang baseline dengan --update di commit yang sama")
+
+    regressions = compare(results, baseline['results'], args.threshold)
+    for case, metric, before, after, ratio in regressions:
+        print(f"REGRESI {case} [{metric}]: {before} -> {after} ({ratio:.2f}x)")
+    if regressions:
+        return 1
+    print(f"Tidak ada regresi di atas {args.threshold:.2f}x baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Tabulasi silang tertimbang: crosstab.CrosstabIndex (kode kategori +
+# np.bincount) vs groupby pandas pada kolom yang sama, untuk file responden
+# sintetis. Target: di bawah BUDGET_MS per query pada sejuta responden.
+#
+#   python benchmarks/crosstab.py [--sizes 100000 1000000]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crosstab import MENIT_BINS, MENIT_LABELS, CrosstabIndex  # noqa: E402
+from survey import KARIR_LABELS, MENTAL_HEALTH_COLUMNS, PLATFORM_COLUMNS  # noqa: E402
+
+BUDGET_MS = 200
+
+QUERIES = [
+    ('menit_tiktok x stress_akademik', ['menit_tiktok', 'stress_akademik'], None),
+    ('menit_tiktok x stress x minat_karir', ['menit_tiktok', 'stress_akademik', 'minat_karir'], None),
+    ('kecamatan x institusi x gender', ['kecamatan', 'institusi', 'gender'], None),
+    ('+ filter gender & pendidikan', ['menit_tiktok', 'stress_akademik', 'minat_karir'],
+     {'gender': ['Perempuan'], 'pendidikan': ['SMA']}),
+]
+
+
+def synthetic_frame(n, seed=0):
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    cols = {
+        'kelompok_umur': rng.choice(['15-19 tahun', '20-24 tahun'], n),
+        'gender': rng.choice(['Laki-laki', 'Perempuan'], n),
+        'pendidikan': rng.choice(['SMA', 'Mahasiswa'], n),
+        'kecamatan': rng.choice([f"Kecamatan {i}" for i in range(1, 22)], n),
+        'institusi': rng.choice([f"Institusi {i}" for i in range(1, 56)], n),
+        'minat_karir': rng.choice(KARIR_LABELS, n),
+    }
+    for platform in PLATFORM_COLUMNS.values():
+        cols[f'pakai_{platform}'] = rng.integers(0, 2, n, dtype=np.int8)
+        cols[f'menit_{platform}'] = rng.gamma(2.0, 30.0, n).round()
+    for column in MENTAL_HEALTH_COLUMNS.values():
+        cols[column] = rng.integers(0, 2, n, dtype=np.int8)
+    return pd.DataFrame(cols)
+
+
+def groupby_crosstab(frame, weights, variables, filters):
+    # Pembanding: jalur pandas biasa (kolom kategori + groupby sum)
+    import pandas as pd
+
+    keys = {}
+    for v in variables:
+        if v.startswith('menit_'):
+            pakai = frame[f"pakai_{v[len('menit_'):]}"].to_numpy() > 0
+            codes = np.digitize(np.where(pakai, np.maximum(frame[v].fillna(0).to_numpy(), 1), 0), MENIT_BINS)
+            keys[v] = pd.Categorical.from_codes(codes, MENIT_LABELS)
+        else:
+            keys[v] = frame[v]
+    data = pd.DataFrame(keys).assign(w=weights)
+    mask = np.ones(len(frame), dtype=bool)
+    for column, values in (filters or {}).items():
+        mask &= frame[column].isin(values).to_numpy()
+    grouped = data[mask].groupby(variables, observed=False)['w'].agg(['sum', 'size'])
+    levels = [0] + list(range(2, len(variables)))
+    total = grouped['sum'].groupby(level=levels, observed=False).transform('sum')
+    return grouped.assign(persen=grouped['sum'] / total * 100)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tabulasi silang: np.bincount vs groupby")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'responden':>10} {'query':<38} {'bincount':>10} {'groupby':>10} {'cepat':>7}")
+    for n in args.sizes:
+        frame = synthetic_frame(n)
+        weights = np.random.default_rng(1).uniform(0.5, 2.0, n)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "responden.parquet"
+            frame.to_parquet(path)
+            start = time.perf_counter()
+            index = CrosstabIndex.build(path)
+            build_s = time.perf_counter() - start
+        # Bobot sintetis (tanpa margin populasi), dipasang langsung ke indeks
+        index.weights = weights
+        for label, variables, filters in QUERIES:
+            fast = timed(lambda: index.tabulate(variables, filters), args.repeat)
+            slow = timed(lambda: groupby_crosstab(frame, weights, variables, filters), args.repeat)
+            failed |= fast > BUDGET_MS
+            flag = '' if fast <= BUDGET_MS else f'  > {BUDGET_MS} ms!'
+            print(f"{n:>10,} {label:<38} {fast:>7.1f} ms {slow:>7.1f} ms {slow / fast:>6.1f}x{flag}")
+        print(f"{'':>10} indeks dibangun {build_s:.2f} dtk, {index.nbytes / 1024 / 1024:.1f} MB")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
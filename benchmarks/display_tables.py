@@ -0,0 +1,108 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Biaya serialisasi tabel tampilan per rerun: DataFrame pandas (dikonversi
+# ke Arrow oleh st.dataframe setiap kali dipanggil) vs pyarrow.Table dari
+# data_loader.load_table() (langsung ditulis ke IPC). Yang diukur adalah
+# jalur yang sama dengan yang dipakai Streamlit di dalam st.dataframe.
+# Bagian kedua membandingkan tabel yang dulu diformat dengan Styler pandas
+# (demografi, ringkasan segmen) dengan display.column_config/text_table.
+#
+#   python benchmarks/display_tables.py [--repeat 200]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data_loader import load_dataset, load_table  # noqa: E402
+from display import NUMBER_FORMATS, text_table  # noqa: E402
+
+PRIORITY_COLUMNS = ['Research Topics', 'Alasan']
+
+# (label, DataFrame seperti sebelumnya, argumen load_table)
+CASES = [
+    ('roadmap', lambda: load_dataset('roadmap'), ('roadmap',), {}),
+    ('implementation_priority', lambda: load_dataset('implementation_priority'), ('implementation_priority',), {}),
+    ('success_cases', lambda: load_dataset('success_cases'), ('success_cases',), {}),
+    ('capacity_building', lambda: load_dataset('capacity_building'), ('capacity_building',), {}),
+    ('research_priority', lambda: load_dataset('research_priority'), ('research_priority',), {}),
+] + [
+    (f'research_priority[{level}]',
+     lambda level=level: load_dataset('research_priority').pipe(
+         lambda df: df[df['Priority'] == level][PRIORITY_COLUMNS]),
+     ('research_priority',), dict(columns=PRIORITY_COLUMNS, where={'Priority': level}))
+    for level in ('Tinggi', 'Sedang', 'Rendah')
+]
+
+
+# (label, Styler seperti sebelumnya, pengganti tanpa Styler)
+STYLER_CASES = [
+    ('demografi (format angka)',
+     lambda: load_dataset('demografi').style.format({
+         'Jumlah (ribu jiwa)': '{:.1f}',
+         'Persentase Populasi Medan': '{:.1f}%'
+     }),
+     lambda: load_table('demografi')),
+    ('segment_summary (tanpa indeks)',
+     lambda: load_dataset('segment_summary').style.hide(axis='index'),
+     lambda: text_table('segment_summary')),
+]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialisasi tabel tampilan: pandas vs pyarrow.Table")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    from streamlit import dataframe_util
+
+    def from_pandas(make_frame):
+        # Jalur lama: slicing pandas per rerun + konversi DataFrame -> Arrow
+        frame = dataframe_util.convert_anything_to_pandas_df(make_frame(), ensure_copy=False)
+        return dataframe_util.convert_pandas_df_to_arrow_bytes(frame)
+
+    def from_arrow(args_, kwargs):
+        return dataframe_util.convert_arrow_table_to_arrow_bytes(load_table(*args_, **kwargs))
+
+    print(f"{'tabel':<32} {'pandas':>10} {'pa.Table':>10} {'hemat':>10}")
+    totals = [0.0, 0.0]
+    for label, make_frame, args_, kwargs in CASES:
+        before = timed(lambda: from_pandas(make_frame), args.repeat)
+        after = timed(lambda: from_arrow(args_, kwargs), args.repeat)
+        totals[0] += before
+        totals[1] += after
+        print(f"{label:<32} {before:>7.3f} ms {after:>7.3f} ms {before - after:>7.3f} ms")
+    print(f"{'TOTAL per rerun (semua tab)':<32} {totals[0]:>7.3f} ms {totals[1]:>7.3f} ms "
+          f"{totals[0] - totals[1]:>7.3f} ms")
+
+    from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+    from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+
+    def from_styler(make_styler):
+        # Jalur Styler: render CSS/nilai tampilan per sel + konversi DataFrame
+        styler = make_styler()
+        marshall_styler(ArrowProto(), styler, 'bench')
+        return from_pandas(lambda: styler.data)
+
+    def from_table(make_table):
+        return dataframe_util.convert_arrow_table_to_arrow_bytes(make_table())
+
+    print(f"\n{'tabel berformat':<32} {'Styler':>10} {'pa.Table':>10} {'hemat':>10}")
+    for label, make_styler, make_table in STYLER_CASES:
+        before = timed(lambda: from_styler(make_styler), args.repeat)
+        after = timed(lambda: from_table(make_table), args.repeat)
+        print(f"{label:<32} {before:>7.3f} ms {after:>7.3f} ms {before - after:>7.3f} ms")
+    print(f"Format angka via column_config: {NUMBER_FORMATS}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import io
+import statistics
+import sys
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Biaya ekspor dataset per rerun: encode ulang semua format di setiap rerun
+# vs bytes dari cache exports.ENCODED (sekali per versi data), serta puncak
+# memori ZIP "unduh semua" yang dibangun utuh di BytesIO vs iter_zip().
+#
+#   python benchmarks/exports.py [--rows 20000] [--reruns 20]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from exports import available_formats, encode, export_bytes, iter_zip  # noqa: E402
+
+
+def synthetic_frames(rows, seed=0):
+    # Ukuran sebanding dengan agregat responden + beberapa dataset kecil
+    rng = np.random.default_rng(seed)
+    frames = {
+        'agregat_responden': pd.DataFrame({
+            'kecamatan': rng.choice([f"Kecamatan {i}" for i in range(1, 22)], rows),
+            'gender': rng.choice(['Laki-laki', 'Perempuan'], rows),
+            **{f'indikator_{i}': rng.random(rows) for i in range(20)}
+        })
+    }
+    for name in ('platform', 'konsumsi', 'karir', 'mental_health', 'roadmap', 'research_priority'):
+        frames[name] = pd.DataFrame({'Label': [f"{name} {i}" for i in range(12)], 'Nilai': rng.random(12)})
+    return frames
+
+
+def members(frames, formats, cached):
+    for name, frame in frames.items():
+        for fmt in formats:
+            if cached:
+                data = lambda name=name, fmt=fmt, frame=frame: export_bytes(name, fmt, 'bench', lambda: frame)
+            else:
+                data = lambda fmt=fmt, frame=frame: encode(frame, fmt)
+            yield f"{fmt}/{name}.{fmt}", fmt, data
+
+
+def zip_in_memory(items):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for filename, _, data in items:
+            archive.writestr(filename, data())
+    return buffer.getvalue()
+
+
+def peak(fn):
+    tracemalloc.start()
+    fn()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ekspor dataset: encode per rerun vs cache bytes")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    frames = synthetic_frames(args.rows)
+    formats = available_formats()
+    print(f"{len(frames)} dataset x {len(formats)} format ({', '.join(formats)}), "
+          f"agregat {args.rows:,} baris")
+
+    def rerun(cached):
+        start = time.perf_counter()
+        for _, _, data in members(frames, formats, cached):
+            data()
+        return (time.perf_counter() - start) * 1000
+
+    baseline = [rerun(False) for _ in range(args.reruns)]
+    cached = [rerun(True) for _ in range(args.reruns)]
+    print(f"\n{'mode':<26} {'pertama':>10} {'p50':>10}")
+    print(f"{'encode setiap rerun':<26} {baseline[0]:>7.1f} ms {statistics.median(baseline):>7.1f} ms")
+    print(f"{'cache per versi data':<26} {cached[0]:>7.1f} ms {statistics.median(cached[1:]):>7.2f} ms")
+
+    # Bytes anggota sudah di cache; yang diukur hanya perakitan arsip
+    in_memory = peak(lambda: zip_in_memory(members(frames, formats, True)))
+    streamed = peak(lambda: sum(len(chunk) for chunk in iter_zip(members(frames, formats, True))))
+    print(f"\npuncak memori ZIP di BytesIO : {in_memory / 1024 / 1024:>6.1f} MB")
+    print(f"puncak memori iter_zip()     : {streamed / 1024 / 1024:>6.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Biaya penonton pertama per worker: factory chart dengan Plotly Express vs
+# artefak figure hasil kompilasi (figure_artifacts.py). Setiap run adalah
+# proses baru (cache figure kosong) yang merender semua bagian dengan
+# instrumentasi aktif; dicatat total durasi span create_*_chart, waktu
+# dinding render, dan apakah plotly.express ikut diimpor.
+#
+# Keluar dengan kode 1 bila proses baru dengan artefak hasil kompilasi masih
+# mengimpor plotly.express (ada artefak yang tidak cocok, mis. hash sumber
+# factory tidak stabil antar proses). --check hanya menjalankan pemeriksaan
+# itu tanpa pengukuran pembanding.
+#
+#   python benchmarks/figure_artifacts.py [--repeat 3] [--check]
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+
+def measure():
+    from export_static import render_sections
+
+    start = time.perf_counter()
+    render_sections()
+    wall = time.perf_counter() - start
+
+    import instrumentation
+
+    spans = {
+        name: stats['total_s'] * 1000
+        for name, stats in instrumentation.REGISTRY.snapshot().items()
+        if name.startswith('create_')
+    }
+    return {'wall_ms': wall * 1000, 'factory_ms': spans, 'plotly_express': 'plotly.express' in sys.modules}
+
+
+def run(figure_dir, metrics_dir):
+    env = dict(os.environ, MEDAN_METRICS='1', MEDAN_METRICS_DIR=str(metrics_dir), MEDAN_FIGURE_DIR=str(figure_dir))
+    out = subprocess.run([sys.executable, __file__, '--measure'], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Penonton pertama: Plotly Express vs artefak figure")
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check", action="store_true", help="hanya periksa artefak terpakai semua")
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure()))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        artifacts, empty = tmp / "figures", tmp / "kosong"
+        subprocess.run([sys.executable, str(APP_DIR / "figure_artifacts.py"), "--out", str(artifacts)],
+                       check=True, capture_output=True)
+        if args.check:
+            missed = run(artifacts, tmp / "m")['plotly_express']
+            print("plotly.express diimpor walau artefak tersedia" if missed else "Semua figure dari artefak")
+            return 1 if missed else 0
+        before = [run(empty, tmp / "m") for _ in range(args.repeat)]
+        after = [run(artifacts, tmp / "m") for _ in range(args.repeat)]
+
+    def median(runs, name):
+        return statistics.median(r['factory_ms'].get(name, 0.0) for r in runs)
+
+    print(f"{'factory':<32} {'Plotly Express':>15} {'artefak':>10}")
+    for name in sorted(before[0]['factory_ms']):
+        print(f"{name:<32} {median(before, name):>12.1f} ms {median(after, name):>7.1f} ms")
+    total_before = statistics.median(sum(r['factory_ms'].values()) for r in before)
+    total_after = statistics.median(sum(r['factory_ms'].values()) for r in after)
+    print(f"{'TOTAL factory':<32} {total_before:>12.1f} ms {total_after:>7.1f} ms")
+    print(f"{'render semua bagian':<32} {statistics.median(r['wall_ms'] for r in before):>12.0f} ms "
+          f"{statistics.median(r['wall_ms'] for r in after):>7.0f} ms")
+    print(f"plotly.express diimpor: {before[0]['plotly_express']} -> {after[0]['plotly_express']}")
+    return 1 if any(r['plotly_express'] for r in after) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
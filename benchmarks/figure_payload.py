@@ -0,0 +1,74 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Laporan bytes figure Plotly per bagian, sebelum dan sesudah pemadatan
+# (figures.compact_figure + template "medan"). Setiap mode dijalankan di
+# subprocess terpisah karena MEDAN_COMPACT_FIGURES dibaca saat import.
+# Semua tab dirender (MEDAN_LAZY_TABS=0) agar setiap chart terhitung.
+#
+#   python benchmarks/figure_payload.py
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+
+def _walk(node):
+    from streamlit.testing.v1.element_tree import Block
+
+    for child in node.children.values():
+        yield child
+        if isinstance(child, Block):
+            yield from _walk(child)
+
+
+def measure():
+    from bench_sections import payload_bytes
+    from export_static import render_sections
+
+    report = {}
+    for section, tree in render_sections().items():
+        specs = [n.proto.spec for n in _walk(tree) if getattr(n, 'type', None) == 'plotly_chart']
+        report[section] = {
+            'charts': len(specs),
+            'figure_bytes': sum(len(s.encode('utf-8')) for s in specs),
+            'payload_bytes': payload_bytes(tree)
+        }
+    return report
+
+
+def run_mode(compact):
+    env = dict(os.environ, MEDAN_COMPACT_FIGURES='1' if compact else '0')
+    out = subprocess.run([sys.executable, __file__, '--measure'], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes figure Plotly per bagian, sebelum/sesudah pemadatan")
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(), ensure_ascii=False))
+        return
+
+    before, after = run_mode(False), run_mode(True)
+    print(f"{'bagian':<32} {'chart':>5} {'figure sebelum':>15} {'sesudah':>9} {'hemat':>7} {'payload sebelum':>16} {'sesudah':>9}")
+    totals = [0, 0, 0, 0]
+    for section, b in before.items():
+        a = after[section]
+        saving = 1 - a['figure_bytes'] / b['figure_bytes'] if b['figure_bytes'] else 0.0
+        print(f"{section:<32} {a['charts']:>5} {b['figure_bytes']:>15,} {a['figure_bytes']:>9,} {saving:>7.1%} "
+              f"{b['payload_bytes']:>16,} {a['payload_bytes']:>9,}")
+        for i, v in enumerate((b['figure_bytes'], a['figure_bytes'], b['payload_bytes'], a['payload_bytes'])):
+            totals[i] += v
+    print(f"{'TOTAL':<32} {'':>5} {totals[0]:>15,} {totals[1]:>9,} {1 - totals[1] / totals[0]:>7.1%} "
+          f"{totals[2]:>16,} {totals[3]:>9,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Waktu rerun untuk perubahan widget di tab "🛍️ Pola Konsumsi", tanpa dan
+# dengan fragment:
+#   - sebelum: waktu dinding rerun penuh setelah widget diubah (yang terjadi
+#     bila region tidak dibungkus st.fragment);
+#   - sesudah: waktu dinding rerun fragment konsumsi_panel, yaitu rerun yang
+#     diminta frontend saat widget di dalam fragment berubah.
+# AppTest sendiri selalu meminta rerun penuh dan membuat FragmentStorage baru
+# di setiap run; di sini storage dipakai bersama antar run dan RerunData
+# diberi fragment_id_queue sehingga ScriptRunner hanya menjalankan fungsi
+# fragment. Span instrumentasi (MEDAN_METRICS=1) dicetak sebagai pembanding.
+#
+#   python benchmarks/fragment_rerun.py [--repeat 20]
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+SECTION = "📈 Analisis Data & Temuan"
+TAB = "🛍️ Pola Konsumsi"
+FRAGMENT_SPAN = "konsumsi_panel"
+
+
+def fragment_reruns():
+    # Mengembalikan (storage, fungsi untuk memilih fragment yang dirun ulang)
+    from streamlit.runtime.fragment import MemoryFragmentStorage
+    from streamlit.runtime.scriptrunner import RerunData
+    from streamlit.testing.v1 import local_script_runner
+
+    class Storage(MemoryFragmentStorage):
+        def __init__(self):
+            super().__init__()
+            self.registered = set()
+
+        def set(self, key, value):
+            super().set(key, value)
+            self.registered.add(key)
+
+    storage = Storage()
+    target = {'id': None}
+
+    def rerun_data(**kwargs):
+        if target['id'] is not None:
+            kwargs.update(fragment_id_queue=[target['id']], is_fragment_scoped_rerun=True)
+        return RerunData(**kwargs)
+
+    local_script_runner.MemoryFragmentStorage = lambda: storage
+    local_script_runner.RerunData = rerun_data
+
+    def select(fragment_id):
+        target['id'] = fragment_id
+
+    return storage, select
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rerun penuh vs rerun fragment Pola Konsumsi")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # Instrumentasi harus aktif sebelum app (dan instrumentation.py) diimpor
+    os.environ["MEDAN_METRICS"] = "1"
+    os.environ.setdefault("MEDAN_METRICS_DIR", tempfile.mkdtemp(prefix="medan-metrics-"))
+    from streamlit.testing.v1 import AppTest
+
+    storage, select = fragment_reruns()
+    at = AppTest.from_file(str(APP_DIR / "app.py"), default_timeout=120).run()
+    at.sidebar.radio[0].set_value(SECTION).run()
+    at.radio(key="tab_analisis").set_value(TAB).run()
+
+    import instrumentation
+
+    options = at.multiselect(key="konsumsi_kategori").options
+    # Pemanasan: semua kombinasi yang dipakai sudah ada di cache figure
+    selections = [options, options[:3], options[1:], options[::2]]
+    for selection in selections:
+        at.multiselect(key="konsumsi_kategori").set_value(selection).run()
+
+    def window(name, start):
+        # Rata-rata span hanya untuk pemanggilan selama pengukuran
+        end = instrumentation.REGISTRY.snapshot()[name]
+        return (end['total_s'] - start[name]['total_s']) / (end['count'] - start[name]['count']) * 1000
+
+    def timed_run():
+        start = time.perf_counter()
+        at.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return elapsed
+
+    start_stats = instrumentation.REGISTRY.snapshot()
+    full = []
+    for i in range(args.repeat):
+        at.multiselect(key="konsumsi_kategori").set_value(selections[i % len(selections)])
+        full.append(timed_run())
+    full_script_ms = window('rerun', start_stats)
+
+    fragment = []
+    for i in range(args.repeat):
+        # Rerun penuh (tidak diukur) agar pohon elemen & storage fragment
+        # lengkap, lalu widget di dalam fragment diubah dan hanya fragment
+        # tersebut yang dijalankan ulang
+        storage.registered.clear()
+        at.run()
+        if len(storage.registered) != 1:
+            raise RuntimeError(f"Diharapkan satu fragment di '{TAB}', ada {len(storage.registered)}")
+        selection = selections[(i + 1) % len(selections)]
+        at.multiselect(key="konsumsi_kategori").set_value(selection)
+        # Pohon hasil rerun fragment hanya berisi elemen fragment; frontend
+        # tetap mengirim state semua widget, jadi pohon penuh dipulihkan
+        full_tree = at._tree
+        select(next(iter(storage.registered)))
+        try:
+            fragment.append(timed_run())
+        finally:
+            select(None)
+        if at.sidebar.children:
+            raise RuntimeError("Run yang diukur menjalankan ulang seluruh script, bukan fragment")
+        if at.multiselect(key="konsumsi_kategori").value != selection:
+            raise RuntimeError("Rerun fragment tidak menerapkan perubahan widget")
+        at._tree = full_tree
+
+    full_ms = statistics.median(full)
+    fragment_ms = statistics.median(fragment)
+    span_ms = window(FRAGMENT_SPAN, start_stats)
+    print(f"Perubahan filter kategori di '{TAB}' ({args.repeat}x):")
+    print(f"  rerun penuh (tanpa fragment)  : median {full_ms:.1f} ms dinding, script {full_script_ms:.1f} ms")
+    print(f"  rerun fragment konsumsi_panel : median {fragment_ms:.1f} ms dinding (span fungsi {span_ms:.1f} ms)")
+    print(f"  percepatan ~{full_ms / fragment_ms:.1f}x waktu dinding rerun")
+
+
+if __name__ == '__main__':
+    main()
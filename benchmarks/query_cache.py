@@ -0,0 +1,116 @@
+import argparse
+import itertools
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Replay beban filter sidebar terhadap cube agregat: tanpa cache vs lewat
+# query_cache.QueryCache dengan beberapa anggaran bytes. Kombinasi filter
+# diambil dengan distribusi Zipf (sebagian kecil irisan diminta berulang
+# kali), urutan pilihan diacak untuk menguji normalisasi kunci.
+#
+#   python benchmarks/query_cache.py [--requests 2000] [--budgets-kb 64 256 4096]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cube import AggregateCube  # noqa: E402
+from query_cache import QueryCache, normalize_filters  # noqa: E402
+from survey import (  # noqa: E402
+    DIMENSION_COLUMNS,
+    KARIR_LABELS,
+    KONSUMSI_COLUMNS,
+    MENTAL_HEALTH_COLUMNS,
+    PLATFORM_COLUMNS,
+)
+
+CATEGORIES = {
+    'kelompok_umur': ['15-19 tahun', '20-24 tahun'],
+    'gender': ['Laki-laki', 'Perempuan'],
+    'pendidikan': ['SMA', 'Mahasiswa'],
+    'kecamatan': [f"Kecamatan {i}" for i in range(1, 22)],
+}
+
+
+def synthetic_file(path, n, seed=0):
+    rng = np.random.default_rng(seed)
+    cols = {dim: rng.choice(CATEGORIES[dim], n) for dim in DIMENSION_COLUMNS}
+    for platform in PLATFORM_COLUMNS.values():
+        cols[f'pakai_{platform}'] = rng.integers(0, 2, n, dtype=np.int8)
+        cols[f'menit_{platform}'] = rng.gamma(2.0, 30.0, n).round()
+    for column in list(KONSUMSI_COLUMNS.values()) + list(MENTAL_HEALTH_COLUMNS.values()):
+        cols[column] = rng.integers(0, 2, n, dtype=np.int8)
+    cols['minat_karir'] = rng.choice(KARIR_LABELS, n)
+    pd.DataFrame(cols).to_parquet(path)
+
+
+def workload(n_requests, seed=0):
+    rng = np.random.default_rng(seed)
+    # Semua kombinasi 0-1 nilai untuk demografi + 0-2 kecamatan
+    options = []
+    for umur, gender, pendidikan in itertools.product(*[[None] + CATEGORIES[d] for d in DIMENSION_COLUMNS[:3]]):
+        for k in range(3):
+            for kecamatan in itertools.combinations(CATEGORIES['kecamatan'][:8], k):
+                options.append({
+                    'kelompok_umur': [umur] if umur else [],
+                    'gender': [gender] if gender else [],
+                    'pendidikan': [pendidikan] if pendidikan else [],
+                    'kecamatan': list(kecamatan),
+                })
+    rng.shuffle(options)
+    ranks = np.minimum(rng.zipf(1.3, n_requests) - 1, len(options) - 1)
+    requests = []
+    for r in ranks:
+        filters = {dim: list(rng.permutation(values)) for dim, values in options[r].items()}
+        requests.append(filters)
+    return requests, len(options)
+
+
+def replay(cube, requests, cache=None):
+    samples = []
+    for filters in requests:
+        start = time.perf_counter()
+        if cache is None:
+            cube.frames(filters)
+        else:
+            cache.get_or_compute(('frames', 'bench', normalize_filters(filters)), lambda: cube.frames(filters))
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay filter sidebar: tanpa cache vs QueryCache")
+    parser.add_argument("--respondents", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--budgets-kb", type=int, nargs="+", default=[64, 256, 4096])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "responden.parquet"
+        synthetic_file(path, args.respondents)
+        cube = AggregateCube.build(path)
+    requests, n_options = workload(args.requests)
+    distinct = len({normalize_filters(f) for f in requests})
+    print(f"{args.requests:,} permintaan, {distinct:,} kombinasi filter berbeda (dari {n_options:,}), "
+          f"cube {cube.n_cells:,} sel")
+
+    # Referensi konsumsi dibaca sekali (data/konsumsi.csv) sebelum pengukuran
+    cube.frames()
+    baseline = replay(cube, requests)
+    print(f"\n{'mode':<22} {'p50':>8} {'rata2':>8} {'total':>9} {'hit':>6} {'evict':>6} {'bytes':>10}")
+    print(f"{'tanpa cache':<22} {statistics.median(baseline):>5.2f} ms {statistics.mean(baseline):>5.2f} ms "
+          f"{sum(baseline):>6.0f} ms")
+    for budget in args.budgets_kb:
+        cache = QueryCache('bench', max_bytes=budget * 1024, ttl=3600)
+        samples = replay(cube, requests, cache)
+        stats = cache.stats()
+        print(f"{f'cache {budget:,} KB':<22} {statistics.median(samples):>5.2f} ms {statistics.mean(samples):>5.2f} ms "
+              f"{sum(samples):>6.0f} ms {stats['hit_ratio']:>6.1%} {stats['evictions']:>6,} "
+              f"{stats['bytes'] / 1024:>7.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
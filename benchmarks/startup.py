@@ -0,0 +1,83 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Benchmark cold start worker: interpreter baru menjalankan app.py (mode
+# bare, halaman pembuka) dengan python -X importtime. Dilaporkan total waktu
+# import, waktu dinding proses, import top-level terberat, dan modul berat
+# mana yang ikut termuat. Sebagai pembanding diukur juga biaya import modul
+# berat yang kini ditunda.
+#
+#   python benchmarks/startup.py [--repeat 5]
+APP_DIR = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'plotly.express')
+
+RUN_APP = (
+    "import runpy, sys; sys.path.insert(0, {app_dir!r}); "
+    "runpy.run_path({app!r}, run_name='__main__')"
+)
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def importtime(code):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=APP_DIR,
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    modules = {}
+    top_level = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules[name] = cumulative
+        if indent == 1:
+            top_level.append((name, cumulative))
+    return {
+        'wall_ms': wall * 1000,
+        'import_ms': sum(c for _, c in top_level) / 1000,
+        'top_level': sorted(top_level, key=lambda x: -x[1]),
+        'modules': modules
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start (python -X importtime)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    code = RUN_APP.format(app_dir=str(APP_DIR), app=str(APP_DIR / "app.py"))
+    runs = [importtime(code) for _ in range(args.repeat)]
+    last = runs[-1]
+
+    print(f"Cold start app.py (median {args.repeat}x): "
+          f"import {statistics.median(r['import_ms'] for r in runs):.0f} ms, "
+          f"proses {statistics.median(r['wall_ms'] for r in runs):.0f} ms")
+    print("\nImport top-level terberat:")
+    for name, cumulative in last['top_level'][:args.top]:
+        print(f"  {name:<40} {cumulative / 1000:>8.1f} ms")
+
+    print("\nModul berat saat halaman pembuka:")
+    for name in HEAVY_MODULES:
+        state = 'termuat' if name in last['modules'] else 'ditunda'
+        print(f"  {name:<40} {state}")
+
+    # Biaya yang dihindari: import modul berat di atas streamlit saja
+    base = statistics.median(importtime("import streamlit")['import_ms'] for _ in range(args.repeat))
+    heavy = statistics.median(
+        importtime("import streamlit; import " + ", ".join(HEAVY_MODULES))['import_ms'] for _ in range(args.repeat)
+    )
+    cost = heavy - base
+    print(f"\nBiaya import {', '.join(HEAVY_MODULES)} setelah streamlit: {cost:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
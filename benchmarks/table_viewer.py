@@ -0,0 +1,87 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Viewer tabel responden berhalaman vs st.dataframe penuh: waktu query
+# (cari + sort + filter) dan bytes Arrow yang dikirim per interaksi, untuk
+# beberapa ukuran tabel sintetis dengan skema file responden.
+#
+#   python benchmarks/table_viewer.py [--sizes 10000 100000 1000000]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from survey import KARIR_LABELS, MENTAL_HEALTH_COLUMNS, PLATFORM_COLUMNS  # noqa: E402
+from table_viewer import DEFAULT_PAGE_SIZE, TableIndex, compact_frame  # noqa: E402
+
+KECAMATAN = [f"Medan {k}" for k in (
+    "Amplas", "Area", "Barat", "Baru", "Belawan", "Deli", "Denai", "Helvetia", "Johor", "Kota", "Labuhan",
+    "Maimun", "Marelan", "Perjuangan", "Petisah", "Polonia", "Selayang", "Sunggal", "Tembung", "Timur", "Tuntungan"
+)]
+
+INTERACTIONS = [
+    ('halaman pertama', dict()),
+    ('cari "denai"', dict(search='denai')),
+    ('cari + sort menit_tiktok turun', dict(search='denai', sort='menit_tiktok', ascending=False)),
+    ('filter gender + sort kecamatan', dict(filters={'gender': ['Perempuan']}, sort='kecamatan')),
+]
+
+
+def synthetic_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    cols = {
+        'id_responden': np.arange(n),
+        'kelompok_umur': rng.choice(['15-19 tahun', '20-24 tahun'], n),
+        'gender': rng.choice(['Laki-laki', 'Perempuan'], n),
+        'pendidikan': rng.choice(['SMA', 'Mahasiswa'], n),
+        'kecamatan': rng.choice(KECAMATAN, n),
+        'institusi': rng.choice([f"Institusi {i}" for i in range(1, 56)], n),
+    }
+    for platform in PLATFORM_COLUMNS.values():
+        cols[f'pakai_{platform}'] = rng.integers(0, 2, n)
+        cols[f'menit_{platform}'] = rng.gamma(2.0, 30.0, n).round()
+    cols['minat_karir'] = rng.choice(KARIR_LABELS, n)
+    for column in MENTAL_HEALTH_COLUMNS.values():
+        cols[column] = rng.integers(0, 2, n)
+    return compact_frame(pd.DataFrame(cols))
+
+
+def arrow_bytes(frame):
+    table = pa.Table.from_pandas(frame)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Viewer berhalaman vs st.dataframe penuh")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'baris':>10} {'interaksi':<32} {'query dingin':>12} {'hangat':>8} {'halaman':>10} {'tabel penuh':>12}")
+    for n in args.sizes:
+        frame = synthetic_frame(n)
+        index = TableIndex(frame)
+        full = arrow_bytes(frame)
+        for label, query in INTERACTIONS:
+            start = time.perf_counter()
+            rows = index.query(**query)
+            cold = (time.perf_counter() - start) * 1000
+            warm = []
+            for page in range(args.repeat):
+                start = time.perf_counter()
+                index.page(index.query(**query), page, DEFAULT_PAGE_SIZE)
+                warm.append((time.perf_counter() - start) * 1000)
+            page_bytes = arrow_bytes(index.page(rows, 0, DEFAULT_PAGE_SIZE))
+            print(f"{n:>10,} {label:<32} {cold:>9.1f} ms {statistics.median(warm):>5.2f} ms "
+                  f"{page_bytes / 1024:>7.1f} KB {full / 1024 / 1024:>9.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from survey import (
+    DEFAULT_CHUNKSIZE,
+    INDICATOR_SOURCE_COLUMNS,
+    MENTAL_HEALTH_COLUMNS,
+    PLATFORM_COLUMNS,
+    indicator_frame,
+    iter_chunks,
+    read_columns,
+)
+
+# Interval kepercayaan bootstrap untuk persentase pengguna platform dan
+# prevalensi kesehatan mental. Memakai Poisson bootstrap: tiap responden
+# mendapat pengali Poisson(1) per replikasi. Responden dengan bobot dan pola
+# indikator identik digabung lebih dulu; jumlah c pengali Poisson(1) yang
+# independen berdistribusi Poisson(c), jadi cukup satu undian per pola unik
+# (hasilnya sama persis, tapi ukuran array turun dari jutaan baris menjadi
+# ribuan pola). Blok replikasi dibagi ke process pool.
+DEFAULT_REPLICATES = 1000
+DEFAULT_SEED = 2024
+CONFIDENCE = 0.95
+
+PLATFORM_INDICATORS = [f'pakai_{p}' for p in PLATFORM_COLUMNS.values()]
+MENTAL_HEALTH_INDICATORS = list(MENTAL_HEALTH_COLUMNS.values())
+CI_INDICATORS = PLATFORM_INDICATORS + MENTAL_HEALTH_INDICATORS
+
+# Batas jumlah proses bootstrap (default: jumlah CPU); diisi oleh
+# batch_reports agar pool bootstrap di dalam worker tidak ikut memakai semua core
+WORKERS_ENV = "MEDAN_BOOTSTRAP_WORKERS"
+
+# Nama kolom CI yang ditambahkan ke DataFrame chart
+CI_LOWER = 'CI Bawah (%)'
+CI_UPPER = 'CI Atas (%)'
+
+
+def _chunk_patterns(w, X):
+    # Kunci pola ditentukan per baris dengan kodebook yang sama untuk semua
+    # chunk: baris yang indikatornya biner selalu dikodekan sebagai bit agar
+    # pengelompokan cukup groupby dua kolom, baris lain sebagai tuple nilai.
+    # Dikembalikan terpisah (bit, tuple) supaya kedua jenis kunci tidak
+    # pernah tercampur dalam satu indeks
+    binary = np.isin(X, (0.0, 1.0)).all(axis=1)
+    bits = X[binary].astype(np.int64) @ (1 << np.arange(X.shape[1], dtype=np.int64))
+    coded = pd.DataFrame({'w': w[binary], 'bits': bits}).groupby(['w', 'bits']).size()
+    if binary.all():
+        return coded, None
+    rows = np.column_stack([w[~binary], X[~binary]])
+    patterns, counts = np.unique(rows, axis=0, return_counts=True)
+    index = pd.MultiIndex.from_arrays([patterns[:, 0], [tuple(r) for r in patterns[:, 1:]]])
+    return coded, pd.Series(counts, index=index)
+
+
+def _decode_bits(bits, k):
+    bits = np.asarray(bits, dtype=np.int64)
+    return ((bits[:, None] >> np.arange(k, dtype=np.int64)) & 1).astype(np.float64)
+
+
+def _merge(partials):
+    merged = pd.concat(partials).groupby(level=[0, 1], sort=False).sum()
+    return merged.index.get_level_values(0).to_numpy(dtype=np.float64), merged.to_numpy(dtype=np.float64), merged
+
+
+def collapse_patterns(path, chunksize=DEFAULT_CHUNKSIZE, weights=None):
+    # Pola unik (bobot, indikator) beserta jumlah kemunculannya
+    coded, other = [], []
+    for chunk in iter_chunks(path, chunksize, columns=read_columns(INDICATOR_SOURCE_COLUMNS, weights=weights)):
+        X = indicator_frame(chunk)[CI_INDICATORS].to_numpy(dtype=np.float64)
+        w = np.ones(len(chunk)) if weights is None else weights.for_chunk(chunk)
+        bits, rows = _chunk_patterns(w, X)
+        coded.append(bits)
+        if rows is not None:
+            other.append(rows)
+    if not coded:
+        raise ValueError(f"File responden kosong: {path}")
+    w, counts, merged = _merge(coded)
+    X = _decode_bits(merged.index.get_level_values(1), len(CI_INDICATORS))
+    if other:
+        w_other, counts_other, merged = _merge(other)
+        w = np.concatenate([w, w_other])
+        X = np.vstack([X, np.array(list(merged.index.get_level_values(1)), dtype=np.float64)])
+        counts = np.concatenate([counts, counts_other])
+    return w, X, counts
+
+
+def _replicate_block(w, X, counts, n_replicates, seed):
+    # Dijalankan di worker: estimasi rasio tertimbang untuk satu blok replikasi
+    rng = np.random.default_rng(seed)
+    multipliers = rng.poisson(counts, size=(n_replicates, len(counts))).astype(np.float64)
+    numerator = multipliers @ (w[:, None] * X)
+    denominator = multipliers @ w
+    return numerator / denominator[:, None]
+
+
+def bootstrap_replicates(w, X, counts, n_replicates=DEFAULT_REPLICATES, seed=DEFAULT_SEED, workers=None):
+    workers = workers or int(os.environ.get(WORKERS_ENV, 0)) or os.cpu_count() or 1
+    blocks = np.array_split(np.arange(n_replicates), workers)
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+    tasks = [(w, X, counts, len(block), s) for block, s in zip(blocks, seeds) if len(block)]
+    if len(tasks) == 1:
+        return _replicate_block(*tasks[0])
+    # spawn: aman dipanggil dari proses server Streamlit yang multithread
+    with ProcessPoolExecutor(len(tasks), mp_context=multiprocessing.get_context("spawn")) as pool:
+        return np.vstack(list(pool.map(_replicate_block, *zip(*tasks))))
+
+
+def bootstrap_ci(path, n_replicates=DEFAULT_REPLICATES, seed=DEFAULT_SEED, workers=None,
+                 weights=None, confidence=CONFIDENCE, chunksize=DEFAULT_CHUNKSIZE):
+    w, X, counts = collapse_patterns(path, chunksize, weights)
+    replicates = bootstrap_replicates(w, X, counts, n_replicates, seed, workers)
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(replicates, [alpha, 1 - alpha], axis=0) * 100
+    ci = pd.DataFrame({CI_LOWER: np.round(lower, 1), CI_UPPER: np.round(upper, 1)}, index=CI_INDICATORS)
+    return {
+        'platform': ci.loc[PLATFORM_INDICATORS].set_axis(list(PLATFORM_COLUMNS)),
+        'mental_health': ci.loc[MENTAL_HEALTH_INDICATORS].set_axis(list(MENTAL_HEALTH_COLUMNS)),
+        'n_patterns': len(counts)
+    }
+
+
+def with_ci(data, ci, key_column):
+    # Tambahkan kolom CI ke DataFrame chart berdasarkan kolom label
+    return data.join(ci, on=key_column)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bootstrap CI persentase survei")
+    parser.add_argument("path")
+    parser.add_argument("--replicates", type=int, default=DEFAULT_REPLICATES)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    from weighting import load_margins, rake
+
+    start = time.perf_counter()
+    weights = rake(args.path) if load_margins() is not None else None
+    result = bootstrap_ci(args.path, args.replicates, workers=args.workers, weights=weights)
+    elapsed = time.perf_counter() - start
+    print(result['platform'].to_string())
+    print(result['mental_health'].to_string())
+    print(f"{args.replicates} replikasi, {result['n_patterns']:,} pola unik, {elapsed:.1f} dtk")
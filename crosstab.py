@@ -0,0 +1,233 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from survey import (
+    DEFAULT_CHUNKSIZE,
+    INDICATOR_SOURCE_COLUMNS,
+    KONSUMSI_COLUMNS,
+    MENTAL_HEALTH_COLUMNS,
+    PLATFORM_COLUMNS,
+    SEGMENT_COLUMN,
+    available_columns,
+    iter_chunks,
+    read_columns,
+)
+
+# Tabulasi silang tertimbang atas variabel kategorik survei. Setiap variabel
+# disimpan sekali per versi data sebagai kode kategori (int8/int16) per
+# responden, bersama vektor bobot raking. Satu query menggabungkan kode 2-3
+# variabel menjadi satu indeks sel (np.ravel_multi_index) lalu menjumlahkan
+# bobot per sel dengan np.bincount: satu pass linear tanpa groupby, hashing
+# atau string, sehingga jutaan responden tetap terjawab dalam puluhan ms.
+MIN_VARIABLES = 2
+MAX_VARIABLES = 3
+
+YA_TIDAK = ['Tidak', 'Ya']
+
+# Menit harian dikelompokkan; bukan pengguna platform masuk 'Tidak pakai'
+MENIT_BINS = [1, 31, 61, 121]
+MENIT_LABELS = ['Tidak pakai', '1-30 menit', '31-60 menit', '61-120 menit', '>120 menit']
+
+# Variabel teks; kategorinya dibaca dari file
+CATEGORICAL_VARIABLES = {
+    'kelompok_umur': "Kelompok Umur",
+    'gender': "Gender",
+    'pendidikan': "Jenjang Pendidikan",
+    'kecamatan': "Kecamatan",
+    'institusi': "Institusi",
+    SEGMENT_COLUMN: "Segmen",
+    'minat_karir': "Minat Karir",
+}
+
+# Nama kolom -> (label, jenis kode)
+VARIABLES = {
+    **{column: (label, 'kategori') for column, label in CATEGORICAL_VARIABLES.items()},
+    **{f'menit_{p}': (f"Menit {label}", 'menit') for label, p in PLATFORM_COLUMNS.items()},
+    **{f'pakai_{p}': (f"Pengguna {label}", 'biner') for label, p in PLATFORM_COLUMNS.items()},
+    **{column: (f"Beli Online {label}", 'biner') for label, column in KONSUMSI_COLUMNS.items()},
+    **{column: (label, 'biner') for label, column in MENTAL_HEALTH_COLUMNS.items()},
+}
+
+COUNT_COLUMN = 'Jumlah (tertimbang)'
+RESPONDENT_COLUMN = 'Responden'
+ROW_PERCENT_COLUMN = '% Baris'
+COLUMN_PERCENT_COLUMN = '% Kolom'
+
+
+def _codes(chunk, column, kind):
+    if kind == 'biner':
+        return (chunk[column].to_numpy(dtype=np.float64) > 0).astype(np.int8)
+    # kind == 'menit'
+    platform = column[len('menit_'):]
+    menit = np.nan_to_num(chunk[column].to_numpy(dtype=np.float64))
+    menit = np.where(chunk[f'pakai_{platform}'].to_numpy() > 0, np.maximum(menit, 1), 0)
+    return np.digitize(menit, MENIT_BINS).astype(np.int8)
+
+
+def _percent(counts, axis):
+    total = counts.sum(axis=axis, keepdims=True)
+    return 100 * np.divide(counts, total, out=np.zeros_like(counts), where=total > 0)
+
+
+class Crosstab:
+    def __init__(self, variables, labels, counts, respondents, seconds):
+        self.variables = variables
+        self.labels = labels
+        self.counts = counts
+        self.respondents = respondents
+        self.seconds = seconds
+
+    @property
+    def n_respondents(self):
+        return int(self.respondents.sum())
+
+    @property
+    def row_percent(self):
+        # Baris = variabel pertama; dijumlahkan sepanjang kolom (variabel kedua)
+        return _percent(self.counts, axis=1)
+
+    @property
+    def column_percent(self):
+        return _percent(self.counts, axis=0)
+
+    def frame(self):
+        # Bentuk panjang: satu baris per sel, kolom label per variabel
+        grid = pd.MultiIndex.from_product(
+            [self.labels[v] for v in self.variables], names=[VARIABLES[v][0] for v in self.variables]
+        ).to_frame(index=False)
+        return grid.assign(**{
+            COUNT_COLUMN: self.counts.ravel(),
+            RESPONDENT_COLUMN: self.respondents.ravel(),
+            ROW_PERCENT_COLUMN: self.row_percent.ravel(),
+            COLUMN_PERCENT_COLUMN: self.column_percent.ravel(),
+        })
+
+
+class CrosstabIndex:
+    def __init__(self, codes, labels, weights, build_seconds=0.0, weighted=False):
+        self.codes = codes
+        self.labels = labels
+        self.weights = weights
+        self.build_seconds = build_seconds
+        self.weighted = weighted
+
+    @classmethod
+    def build(cls, path, chunksize=DEFAULT_CHUNKSIZE, segment_model=None, weights=None):
+        start = time.perf_counter()
+        file_columns = set(available_columns(path))
+        assign_segments = SEGMENT_COLUMN not in file_columns and segment_model is not None
+        variables = [
+            v for v in VARIABLES
+            if v in file_columns or (v == SEGMENT_COLUMN and assign_segments)
+        ]
+        columns = read_columns(
+            [c for c in INDICATOR_SOURCE_COLUMNS if c in file_columns],
+            [v for v in variables if v in file_columns],
+            weights=weights
+        )
+
+        parts = {v: [] for v in variables}
+        weight_parts = []
+        for chunk in iter_chunks(path, chunksize, columns=columns):
+            if assign_segments:
+                chunk[SEGMENT_COLUMN] = segment_model.assign_names(chunk)
+            for v in variables:
+                kind = VARIABLES[v][1]
+                if kind == 'kategori':
+                    parts[v].append(chunk[v].astype(str).astype('category'))
+                else:
+                    parts[v].append(_codes(chunk, v, kind))
+            weight_parts.append(
+                weights.for_chunk(chunk) if weights is not None else np.ones(len(chunk))
+            )
+        if not weight_parts:
+            raise ValueError(f"File responden kosong: {path}")
+
+        codes, labels = {}, {}
+        for v in variables:
+            kind = VARIABLES[v][1]
+            if kind == 'kategori':
+                # Kategori tiap chunk berbeda; gabungkan dengan kategori terurut
+                merged = pd.api.types.union_categoricals(parts[v], sort_categories=True)
+                labels[v] = list(merged.categories)
+                dtype = np.int8 if len(labels[v]) < 128 else np.int16
+                codes[v] = merged.codes.astype(dtype)
+            else:
+                labels[v] = MENIT_LABELS if kind == 'menit' else YA_TIDAK
+                codes[v] = np.concatenate(parts[v])
+
+        return cls(
+            codes, labels, np.concatenate(weight_parts).astype(np.float64),
+            build_seconds=time.perf_counter() - start, weighted=weights is not None
+        )
+
+    @property
+    def variables(self):
+        return list(self.codes)
+
+    @property
+    def n_rows(self):
+        return len(self.weights)
+
+    @property
+    def nbytes(self):
+        return int(self.weights.nbytes + sum(c.nbytes for c in self.codes.values()))
+
+    def label(self, variable):
+        return VARIABLES[variable][0]
+
+    def mask(self, filters=None):
+        mask = None
+        for column, values in (filters or {}).items():
+            if values and column in self.codes:
+                # Tabel lookup per kode kategori: lebih murah dari np.isin
+                wanted = np.isin(self.labels[column], list(values))
+                m = wanted[self.codes[column]]
+                mask = m if mask is None else mask & m
+        return mask
+
+    def tabulate(self, variables, filters=None):
+        variables = list(dict.fromkeys(variables))
+        if not MIN_VARIABLES <= len(variables) <= MAX_VARIABLES:
+            raise ValueError(f"Tabulasi silang butuh {MIN_VARIABLES}-{MAX_VARIABLES} variabel berbeda")
+        start = time.perf_counter()
+
+        shape = tuple(len(self.labels[v]) for v in variables)
+        cell = np.ravel_multi_index([self.codes[v] for v in variables], shape)
+        weights = self.weights
+        mask = self.mask(filters)
+        if mask is not None:
+            cell, weights = cell[mask], weights[mask]
+        size = int(np.prod(shape))
+        counts = np.bincount(cell, weights=weights, minlength=size).reshape(shape)
+        respondents = np.bincount(cell, minlength=size).reshape(shape)
+
+        return Crosstab(
+            variables, {v: self.labels[v] for v in variables}, counts, respondents,
+            time.perf_counter() - start
+        )
+
+    def describe(self):
+        return {
+            'n_rows': self.n_rows,
+            'n_variables': len(self.codes),
+            'nbytes': self.nbytes,
+            'build_seconds': round(self.build_seconds, 3),
+            'weighted': self.weighted
+        }
+
+
+if __name__ == '__main__':
+    # Tabulasi silang dari command line:
+    #   python crosstab.py data/responden.parquet menit_tiktok stress_akademik segmen
+    from segmentation import load_segment_model
+    from weighting import load_margins, rake
+
+    weights = rake(sys.argv[1]) if load_margins() is not None else None
+    index = CrosstabIndex.build(sys.argv[1], segment_model=load_segment_model(), weights=weights)
+    result = index.tabulate(sys.argv[2:])
+    print(result.frame().to_string(index=False))
+    print(f"{result.n_respondents:,} responden, {result.seconds * 1000:.1f} ms")
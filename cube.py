@@ -0,0 +1,184 @@
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from data_loader import load_dataset
+from survey import (
+    DEFAULT_CHUNKSIZE,
+    DIMENSION_COLUMNS,
+    INDICATOR_SOURCE_COLUMNS,
+    SEGMENT_COLUMN,
+    available_columns,
+    frames_from_sums,
+    indicator_frame,
+    iter_chunks,
+    read_columns,
+)
+
+# Cube agregat: jumlah indikator survei yang sudah dikelompokkan per
+# kombinasi kelompok umur x gender x pendidikan x kecamatan x segmen.
+# Dibangun sekali per versi data (satu kali baca file secara chunk); filter
+# sidebar cukup menjumlahkan sel cube yang cocok (ratusan baris), bukan
+# memindai ulang jutaan baris responden.
+CUBE_DIMENSIONS = DIMENSION_COLUMNS + [SEGMENT_COLUMN]
+
+# Dataset acuan yang ikut membentuk frames() (pertumbuhan YoY konsumsi,
+# urutan & warna segmen); versinya harus ikut di kunci cache hasil cube
+REFERENCE_DATASETS = ("konsumsi", "segmentasi")
+
+# Nilai pengganti untuk dimensi yang tidak ada di file responden
+SEMUA = 'Semua'
+
+# Jumlah hasil groupby parsial yang ditahan sebelum digabung
+_MERGE_EVERY = 8
+
+
+class AggregateCube:
+    def __init__(self, cells, values, columns, build_seconds=0.0, build_peak_bytes=0, weighted=False):
+        self.cells = cells
+        self.values = values
+        self.columns = columns
+        self.build_seconds = build_seconds
+        self.build_peak_bytes = build_peak_bytes
+        self.weighted = weighted
+
+    @classmethod
+    def build(cls, path, chunksize=DEFAULT_CHUNKSIZE, trace_memory=False, segment_model=None, weights=None):
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+
+        file_columns = set(available_columns(path))
+        # Tanpa kolom segmen di file, segmen diberikan oleh model segmentasi
+        assign_segments = SEGMENT_COLUMN not in file_columns and segment_model is not None
+        dims = [d for d in CUBE_DIMENSIONS if d in file_columns or (d == SEGMENT_COLUMN and assign_segments)]
+        columns = read_columns(INDICATOR_SOURCE_COLUMNS, [d for d in dims if d in file_columns], weights=weights)
+
+        partials = []
+        for chunk in iter_chunks(path, chunksize, columns=columns):
+            if assign_segments:
+                chunk[SEGMENT_COLUMN] = segment_model.assign_names(chunk)
+            indicators = indicator_frame(chunk, weights)
+            if dims:
+                keys = [chunk[d].astype('category') for d in dims]
+                partials.append(indicators.groupby(keys, observed=True, dropna=False).sum())
+            else:
+                partials.append(indicators.sum().to_frame().T)
+            if len(partials) >= _MERGE_EVERY:
+                partials = [_merge(partials, dims)]
+        if not partials:
+            raise ValueError(f"File responden kosong: {path}")
+        grouped = _merge(partials, dims)
+
+        if dims:
+            cells = grouped.index.to_frame(index=False)
+        else:
+            cells = pd.DataFrame(index=range(len(grouped)))
+        for d in CUBE_DIMENSIONS:
+            if d not in cells:
+                cells[d] = SEMUA
+            cells[d] = cells[d].astype(str).astype('category')
+
+        build_peak_bytes = 0
+        if trace_memory:
+            build_peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        return cls(
+            cells[CUBE_DIMENSIONS],
+            grouped.to_numpy(dtype=np.float64),
+            list(grouped.columns),
+            build_seconds=time.perf_counter() - start,
+            build_peak_bytes=build_peak_bytes,
+            weighted=weights is not None
+        )
+
+    @property
+    def n_cells(self):
+        return len(self.cells)
+
+    @property
+    def nbytes(self):
+        return int(self.values.nbytes + self.cells.memory_usage(deep=True).sum())
+
+    @property
+    def n_respondents(self):
+        return int(self.values[:, self.columns.index('n_responden')].sum())
+
+    def options(self, dim):
+        return sorted(self.cells[dim].cat.categories)
+
+    def mask(self, filters=None):
+        mask = np.ones(self.n_cells, dtype=bool)
+        for dim, values in (filters or {}).items():
+            if values:
+                mask &= self.cells[dim].isin(values).to_numpy()
+        return mask
+
+    def sums(self, filters=None):
+        return pd.Series(self.values[self.mask(filters)].sum(axis=0), index=self.columns)
+
+    def segment_counts(self, filters=None):
+        mask = self.mask(filters)
+        n = self.values[mask, self.columns.index('n')]
+        return pd.Series(n, index=self.cells[SEGMENT_COLUMN].to_numpy()[mask]).groupby(level=0).sum()
+
+    def frames(self, filters=None, reference_konsumsi=None, reference_segmentasi=None):
+        frames = frames_from_sums(self.sums(filters), reference_konsumsi)
+        frames['segmentasi'] = segment_frame(self.segment_counts(filters), reference_segmentasi)
+        return frames
+
+    def table(self, filters=None):
+        # Sel cube beserta jumlah indikatornya: agregat tingkat responden
+        # tanpa baris individual (untuk ekspor)
+        mask = self.mask(filters)
+        cells = self.cells[mask].reset_index(drop=True)
+        return pd.concat([cells, pd.DataFrame(self.values[mask], columns=self.columns)], axis=1)
+
+    def describe(self):
+        return {
+            'n_respondents': self.n_respondents,
+            'n_weighted': round(float(self.values[:, self.columns.index('n')].sum()), 1),
+            'n_cells': self.n_cells,
+            'n_indicators': len(self.columns),
+            'nbytes': self.nbytes,
+            'build_seconds': round(self.build_seconds, 3),
+            'build_peak_bytes': self.build_peak_bytes
+        }
+
+
+def _merge(partials, dims):
+    combined = pd.concat(partials)
+    if not dims:
+        return combined.sum().to_frame().T
+    return combined.groupby(level=list(range(len(dims))), observed=True, dropna=False).sum()
+
+
+def segment_frame(counts, reference=None):
+    # Bentuk sama dengan data/segmentasi.csv; urutan & warna ikut dataset acuan
+    if reference is None:
+        reference = load_dataset("segmentasi")
+    total = counts.sum()
+    if SEMUA in counts.index or total == 0:
+        # File responden belum punya kolom segmen
+        return reference
+    persen = counts.reindex(reference['Segment']).fillna(0).to_numpy() / total * 100
+    return pd.DataFrame({
+        'Segment': reference['Segment'].to_numpy(),
+        'Persentase': np.round(persen, 1),
+        'Warna': reference['Warna'].to_numpy()
+    })
+
+
+if __name__ == '__main__':
+    # Laporan ukuran cube: python cube.py data/responden.parquet
+    from segmentation import load_segment_model
+    from weighting import load_margins, rake
+
+    weights = rake(sys.argv[1]) if load_margins() is not None else None
+    cube = AggregateCube.build(sys.argv[1], trace_memory=True, segment_model=load_segment_model(), weights=weights)
+    for key, value in cube.describe().items():
+        print(f"{key:>16}: {value:,}" if isinstance(value, int) else f"{key:>16}: {value}")
@@ -0,0 +1,165 @@
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+# Lapisan data: dataset laporan dibaca dari file di folder data/ (Parquet
+# atau CSV) sekali per proses lalu disimpan di cache bersama. Modul ini tetap
+# berada di sys.modules antar rerun Streamlit, sehingga cache berlaku untuk
+# semua sesi. Setiap pemanggilan hanya melakukan os.stat; file dibaca ulang
+# hanya jika mtime/ukurannya berubah, dan DataFrame baru dibuat hanya jika
+# hash isinya juga berubah.
+#
+# Untuk tabel tampilan tersedia load_table(): pyarrow.Table yang dibuat sekali
+# per versi data dan disimpan di entry cache yang sama. st.dataframe/st.table
+# menserialisasi pa.Table langsung ke IPC, tanpa konversi pandas -> Arrow di
+# setiap rerun.
+DATA_DIR = Path(os.environ.get("MEDAN_DATA_DIR", Path(__file__).parent / "data"))
+
+DATASETS = (
+    "demografi",
+    "segmentasi",
+    "platform",
+    "konsumsi",
+    "karir",
+    "mental_health",
+    "roadmap",
+    "research_priority",
+    "implementation_priority",
+    "success_cases",
+    "capacity_building",
+    "segment_summary",
+)
+
+# Parquet didahulukan jika kedua format tersedia
+EXTENSIONS = (".parquet", ".csv")
+
+# File survei tingkat responden (opsional), diolah oleh survey.py
+RESPONDEN_FILES = ("responden.parquet", "responden.csv")
+RESPONDEN_ENV = "MEDAN_RESPONDEN"
+
+_cache = {}
+_lock = threading.Lock()
+
+
+class DatasetNotFoundError(FileNotFoundError):
+    pass
+
+
+def dataset_path(name):
+    for ext in EXTENSIONS:
+        path = DATA_DIR / f"{name}{ext}"
+        if path.exists():
+            return path
+    raise DatasetNotFoundError(f"Dataset '{name}' tidak ditemukan di {DATA_DIR}")
+
+
+def respondent_path(data_dir=None):
+    # MEDAN_RESPONDEN menunjuk file responden lain (mis. satu institusi pada
+    # batch_reports.py); dibaca saat dipanggil, bukan saat import
+    override = os.environ.get(RESPONDEN_ENV)
+    if override and data_dir is None:
+        return Path(override)
+    data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+    for name in RESPONDEN_FILES:
+        path = data_dir / name
+        if path.exists():
+            return path
+    return None
+
+
+def _read(path, raw):
+    # pandas diimpor saat dataset pertama kali dibaca, bukan saat import modul
+    import pandas as pd
+
+    if path.suffix == ".parquet":
+        return pd.read_parquet(io.BytesIO(raw))
+    return pd.read_csv(io.BytesIO(raw))
+
+
+def _load_entry(name):
+    path = dataset_path(name)
+    stat = path.stat()
+    stamp = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    entry = _cache.get(name)
+    if entry is not None and entry["stamp"] == stamp:
+        return entry
+
+    with _lock:
+        entry = _cache.get(name)
+        if entry is not None and entry["stamp"] == stamp:
+            return entry
+
+        raw = path.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        if entry is not None and entry["digest"] == digest:
+            # File disentuh tanpa perubahan isi: pakai DataFrame lama
+            entry = dict(entry, stamp=stamp)
+        else:
+            entry = {"stamp": stamp, "digest": digest, "data": _read(path, raw)}
+        _cache[name] = entry
+        return entry
+
+
+def load_dataset(name):
+    return _load_entry(name)["data"]
+
+
+def _arrow(frame):
+    import pyarrow as pa
+
+    # pa.Table tidak bisa diubah, aman dibagi ke semua sesi
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def load_table(name, columns=None, where=None, formats=None):
+    # where: dict kolom -> nilai (filter sama dengan); formats: dict kolom ->
+    # format printf, kolom diganti teks siap tampil. Hasil per kombinasi
+    # disimpan di entry sehingga ikut kedaluwarsa bersama datanya
+    entry = _load_entry(name)
+    key = tuple(
+        tuple(sorted(opt.items())) if isinstance(opt, dict) else tuple(opt) if opt else None
+        for opt in (columns, where, formats)
+    )
+    tables = entry.setdefault("tables", {})
+    table = tables.get(key)
+    if table is None:
+        frame = entry["data"]
+        for column, value in (where or {}).items():
+            frame = frame[frame[column] == value]
+        if columns:
+            frame = frame[list(columns)]
+        if formats:
+            frame = frame.assign(**{
+                column: frame[column].map(lambda v, fmt=fmt: fmt % v)
+                for column, fmt in formats.items() if column in frame
+            })
+        table = tables[key] = _arrow(frame)
+    return table
+
+
+def load_all():
+    return {name: load_dataset(name) for name in DATASETS}
+
+
+def dataset_version(name):
+    return _load_entry(name)["digest"]
+
+
+def data_version(names=DATASETS):
+    # Versi gabungan untuk cache turunan (figure, tabel, ekspor, API)
+    h = hashlib.blake2b(digest_size=16)
+    for name in names:
+        h.update(name.encode())
+        h.update(dataset_version(name).encode())
+    return h.hexdigest()
+
+
+def clear_cache(name=None):
+    with _lock:
+        if name is None:
+            _cache.clear()
+        else:
+            _cache.pop(name, None)
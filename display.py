@@ -0,0 +1,29 @@
+import streamlit as st
+
+from data_loader import load_table
+
+# Format tabel tampilan. Styler pandas membangun HTML/CSS per sel di setiap
+# rerun; di sini format angka dinyatakan sekali sebagai format printf:
+#   - st.dataframe: data tetap numerik (bisa diurutkan), format diterapkan
+#     frontend lewat column_config;
+#   - st.table (tanpa column_config): kolom diganti teks siap tampil, dihitung
+#     sekali per versi data dan di-cache bersama pyarrow.Table di data_loader.
+NUMBER_FORMATS = {
+    "demografi": {
+        "Jumlah (ribu jiwa)": "%.1f",
+        "Persentase Populasi Medan": "%.1f%%",
+    },
+}
+
+
+def column_config(name):
+    # Untuk st.dataframe(load_table(name), column_config=column_config(name))
+    return {
+        column: st.column_config.NumberColumn(format=fmt)
+        for column, fmt in NUMBER_FORMATS.get(name, {}).items()
+    }
+
+
+def text_table(name, **kwargs):
+    # Untuk st.table: angka sudah berupa teks terformat
+    return load_table(name, formats=NUMBER_FORMATS.get(name), **kwargs)
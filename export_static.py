@@ -0,0 +1,305 @@
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+# Ekspor statis seluruh laporan: keenam bagian sidebar dijalankan secara
+# headless lewat AppTest Streamlit (tab biasa, bukan tab ringan, agar semua
+# isi tab ikut), lalu pohon elemennya diubah menjadi satu file HTML mandiri
+# dengan spesifikasi Plotly tertanam. Hasilnya bisa disajikan dari file
+# server biasa tanpa sesi Python per pengunjung.
+APP_DIR = Path(__file__).parent
+APP_PATH = APP_DIR / "app.py"
+DEFAULT_OUT = APP_DIR / "dist" / "index.html"
+
+SECTIONS = [
+    "📋 Executive Summary",
+    "🎯 Pendahuluan & Metodologi",
+    "📈 Analisis Data & Temuan",
+    "👥 Segmentasi Gen Z Medan",
+    "💡 Implikasi & Rekomendasi",
+    "📚 Kesimpulan & Referensi"
+]
+
+PAGE_CSS = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0; color: #1F2937; }
+nav { position: fixed; top: 0; left: 0; bottom: 0; width: 250px; padding: 1.5rem 1rem; background: #F0F2F6; }
+nav a { display: block; padding: 0.4rem 0.5rem; color: inherit; text-decoration: none; border-radius: 6px; }
+nav a.active { background: #DBEAFE; font-weight: 600; }
+main { margin-left: 290px; padding: 1rem 2rem 3rem; max-width: 1200px; }
+.section { display: none; }
+.section.active { display: block; }
+.row { display: flex; gap: 1rem; }
+.row > .col { min-width: 0; }
+.metric { padding: 0.5rem 0; }
+.metric .label { font-size: 0.9rem; color: #475569; }
+.metric .value { font-size: 2rem; }
+.metric .delta { font-size: 0.9rem; color: #09AB3B; }
+.tabs .tab-buttons button { border: none; background: none; padding: 0.5rem 1rem; cursor: pointer; font-size: 1rem; }
+.tabs .tab-buttons button.active { border-bottom: 2px solid #FF4B4B; color: #FF4B4B; }
+.tabs .tab-panel { display: none; }
+.tabs .tab-panel.active { display: block; }
+table.dataframe { border-collapse: collapse; width: 100%; font-size: 0.9rem; margin: 0.5rem 0; }
+table.dataframe th, table.dataframe td { border: 1px solid #E2E8F0; padding: 0.4rem; text-align: left; vertical-align: top; }
+details { border: 1px solid #E2E8F0; border-radius: 8px; padding: 0.5rem 1rem; margin: 0.5rem 0; }
+"""
+
+PAGE_JS = """
+function showSection(id) {
+  document.querySelectorAll('.section').forEach(s => s.classList.toggle('active', s.id === id));
+  document.querySelectorAll('nav a').forEach(a => a.classList.toggle('active', a.dataset.target === id));
+  window.dispatchEvent(new Event('resize'));
+}
+function showTab(button) {
+  const tabs = button.closest('.tabs');
+  const index = Array.from(button.parentNode.children).indexOf(button);
+  tabs.querySelectorAll(':scope > .tab-buttons > button').forEach((b, i) => b.classList.toggle('active', i === index));
+  tabs.querySelectorAll(':scope > .tab-panel').forEach((p, i) => p.classList.toggle('active', i === index));
+  window.dispatchEvent(new Event('resize'));
+}
+document.querySelectorAll('.plotly-chart').forEach(el => {
+  const spec = JSON.parse(el.querySelector('script').textContent);
+  Plotly.newPlot(el, spec.data, spec.layout, {responsive: true, displaylogo: false});
+});
+"""
+
+
+# Konversi markdown sederhana, cukup untuk konstruksi yang dipakai app.py:
+# heading, daftar (bersarang), garis, tebal/miring, paragraf dan HTML mentah
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<strong><em>\1</em></strong>', text)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])', r'<em>\1</em>', text)
+    return text
+
+
+_LIST_ITEM = re.compile(r'^(\s*)([-*•]|\d+\.)\s+(.*)$')
+
+
+def markdown_to_html(text):
+    out = []
+    paragraph = []
+    lists = []  # tumpukan (indent, tag)
+
+    def close_paragraph():
+        if paragraph:
+            out.append('<p>' + ''.join(paragraph).rstrip() + '</p>')
+            paragraph.clear()
+
+    def close_lists(indent=-1):
+        while lists and lists[-1][0] > indent:
+            out.append(f'</li></{lists.pop()[1]}>')
+
+    lines = text.split('\n')
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        item = _LIST_ITEM.match(line)
+
+        if not stripped:
+            close_paragraph()
+            close_lists()
+        elif stripped.startswith('<'):
+            # Blok HTML mentah (unsafe_allow_html) diteruskan apa adanya; blok
+            # <style> boleh berisi baris kosong
+            close_paragraph()
+            close_lists()
+            in_style = stripped.startswith('<style')
+            while i < len(lines) and (lines[i].strip() or in_style):
+                out.append(lines[i])
+                if '</style>' in lines[i]:
+                    in_style = False
+                i += 1
+            continue
+        elif re.fullmatch(r'-{3,}|\*{3,}', stripped):
+            close_paragraph()
+            close_lists()
+            out.append('<hr>')
+        elif re.match(r'#{1,6}\s', stripped):
+            close_paragraph()
+            close_lists()
+            level = len(stripped) - len(stripped.lstrip('#'))
+            out.append(f'<h{level}>{_inline(stripped[level:].strip())}</h{level}>')
+        elif item and stripped != '***':
+            close_paragraph()
+            indent = len(item.group(1))
+            tag = 'ol' if item.group(2)[0].isdigit() else 'ul'
+            if lists and indent == lists[-1][0]:
+                out.append('</li>')
+            elif lists and indent < lists[-1][0]:
+                close_lists(indent)
+                if lists:
+                    out.append('</li>')
+            if not lists or indent > lists[-1][0]:
+                lists.append((indent, tag))
+                out.append(f'<{tag}>')
+            out.append('<li>' + _inline(item.group(3)))
+        elif lists:
+            # Baris lanjutan dari item daftar
+            out.append(' ' + _inline(stripped))
+        else:
+            hard_break = line.endswith('  ')
+            paragraph.append(_inline(stripped) + ('<br>' if hard_break else ' '))
+        i += 1
+
+    close_paragraph()
+    close_lists()
+    return '\n'.join(out)
+
+
+def _plotly_html(spec, counter):
+    from figures import static_spec
+
+    # Tanpa frontend Streamlit, warna placeholder template harus diganti di sini
+    spec = json.dumps(static_spec(json.loads(spec)), ensure_ascii=False, separators=(',', ':'))
+    payload = spec.replace('</', '<\\/')
+    return (
+        f'<div class="plotly-chart" id="chart-{next(counter)}">'
+        f'<script type="application/json">{payload}</script></div>'
+    )
+
+
+def _dataframe_html(df):
+    import pandas as pd
+
+    show_index = not isinstance(df.index, pd.RangeIndex)
+    return df.to_html(index=show_index, classes='dataframe', border=0, escape=True)
+
+
+def render_node(node, counter):
+    kind = getattr(node, 'type', None)
+    children = getattr(node, 'children', None)
+
+    if kind == 'markdown':
+        return markdown_to_html(node.value)
+    if kind == 'metric':
+        delta = f'<div class="delta">{html.escape(node.delta)}</div>' if node.delta else ''
+        return (
+            f'<div class="metric"><div class="label">{html.escape(node.label)}</div>'
+            f'<div class="value">{html.escape(node.value)}</div>{delta}</div>'
+        )
+    if kind == 'plotly_chart':
+        return _plotly_html(node.proto.spec, counter)
+    if kind in ('arrow_data_frame', 'arrow_table', 'table'):
+        return _dataframe_html(node.value)
+    if kind == 'tab_container':
+        tabs = [children[k] for k in sorted(children)]
+        buttons = ''.join(
+            f'<button class="{"active" if i == 0 else ""}" onclick="showTab(this)">{html.escape(t.label)}</button>'
+            for i, t in enumerate(tabs)
+        )
+        panels = ''.join(
+            f'<div class="tab-panel{" active" if i == 0 else ""}">{render_children(t, counter)}</div>'
+            for i, t in enumerate(tabs)
+        )
+        return f'<div class="tabs"><div class="tab-buttons">{buttons}</div>{panels}</div>'
+    if kind == 'flex_container' and children and all(getattr(c, 'type', None) == 'column' for c in children.values()):
+        cols = [children[k] for k in sorted(children)]
+        return '<div class="row">' + ''.join(
+            f'<div class="col" style="flex: {c.proto.weight or 1}">{render_children(c, counter)}</div>'
+            for c in cols
+        ) + '</div>'
+    if kind == 'expander':
+        open_attr = ' open' if node.proto.expanded else ''
+        return (
+            f'<details{open_attr}><summary>{_inline(node.label)}</summary>'
+            f'{render_children(node, counter)}</details>'
+        )
+    if children is not None:
+        return render_children(node, counter)
+    # Widget dan elemen lain (radio, spinner, dll.) tidak punya padanan statis
+    return ''
+
+
+def render_children(node, counter):
+    return '\n'.join(render_node(node.children[k], counter) for k in sorted(node.children))
+
+
+def render_sections(timeout=120):
+    os.environ["MEDAN_LAZY_TABS"] = "0"
+    sys.path.insert(0, str(APP_DIR))
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout).run()
+    pages = {}
+    for section in SECTIONS:
+        at.sidebar.radio[0].set_value(section).run()
+        if at.exception:
+            raise RuntimeError(f"Gagal merender '{section}': {at.exception[0].message}")
+        pages[section] = at.main
+    return pages
+
+
+def _plotly_script(src=None):
+    if src is not None:
+        return f'<script src="{html.escape(src)}"></script>'
+    from plotly.offline import get_plotlyjs
+
+    return f'<script>{get_plotlyjs()}</script>'
+
+
+_STYLE_BLOCK = re.compile(r'<style>.*?</style>', re.S)
+
+
+def build_html(pages, title=None, plotly_src=None):
+    # plotly_src: URL plotly.js bersama (mis. batch banyak laporan); tanpa
+    # itu plotly.js ditanam di file agar mandiri
+    import itertools
+
+    counter = itertools.count(1)
+    nav = []
+    sections = []
+    styles = []
+    for i, (section, tree) in enumerate(pages.items()):
+        anchor = f"section-{i + 1}"
+        active = ' active' if i == 0 else ''
+        nav.append(f'<a href="#" class="{active.strip()}" data-target="{anchor}" '
+                   f'onclick="showSection(\'{anchor}\'); return false;">{html.escape(section)}</a>')
+        body = render_children(tree, counter)
+        # CSS kustom app muncul di setiap bagian; cukup satu kali di <head>
+        for style in _STYLE_BLOCK.findall(body):
+            if style not in styles:
+                styles.append(style)
+        body = _STYLE_BLOCK.sub('', body)
+        sections.append(f'<section id="{anchor}" class="section{active}">{body}</section>')
+
+    return (
+        '<!DOCTYPE html><html lang="id"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f'<title>MEDAN YOUTH INSIGHTS{" — " + html.escape(title) if title else ""}</title>'
+        f'<style>{PAGE_CSS}</style>' + ''.join(styles) +
+        _plotly_script(plotly_src) +
+        '</head><body>'
+        '<nav><h2>📊 Navigasi Laporan</h2>'
+        + (f'<p><strong>{html.escape(title)}</strong></p>' if title else '')
+        + ''.join(nav) + '</nav>'
+        '<main>' + '\n'.join(sections) + '</main>'
+        f'<script>{PAGE_JS}</script>'
+        '</body></html>'
+    )
+
+
+def export(out=DEFAULT_OUT):
+    out = Path(out)
+    start = time.perf_counter()
+    document = build_html(render_sections())
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(document, encoding='utf-8')
+    return out, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Ekspor laporan ke HTML statis mandiri")
+    parser.add_argument("--out", default=str(DEFAULT_OUT))
+    args = parser.parse_args()
+
+    path, elapsed = export(args.out)
+    size = path.stat().st_size
+    print(f"Laporan statis ditulis ke {path}")
+    print(f"Waktu build: {elapsed:.2f} dtk, ukuran bundle: {size / 1024 / 1024:.2f} MB ({size:,} byte)")
@@ -0,0 +1,130 @@
+import importlib.util
+import io
+import os
+import tempfile
+import time
+import zipfile
+
+from instrumentation import instrumented
+from query_cache import QueryCache, share
+
+# Ekspor dataset untuk mitra (CSV, Parquet, XLSX) dan arsip ZIP semuanya.
+# Bytes hasil encode disimpan di cache bersama dengan kunci nama dataset +
+# format + versi data, jadi satu versi data hanya di-encode sekali untuk
+# semua sesi; rerun tidak meng-encode ulang. Pemanggil memberi versi (digest
+# file, atau versi survei + filter) dan fungsi pemuat DataFrame yang hanya
+# dipanggil saat cache miss. ZIP tidak dibangun utuh di memori: iter_zip()
+# menghasilkan potongan bytes per anggota arsip dari bytes yang sudah
+# di-cache.
+FORMATS = {
+    'csv': ("CSV", "text/csv"),
+    'parquet': ("Parquet", "application/vnd.apache.parquet"),
+    'xlsx': ("XLSX", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+# XLSX butuh openpyxl (ada di requirements.txt). Jika tidak terpasang,
+# format XLSX tidak ditawarkan dan pengguna diberi tahu (panel unduhan dan
+# berkas catatan di ZIP), bukan hilang diam-diam
+XLSX_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+XLSX_MISSING_NOTICE = (
+    "Format XLSX tidak tersedia: paket openpyxl belum terpasang di server "
+    "(pip install -r requirements.txt). File CSV dan Parquet tetap lengkap."
+)
+NOTICE_FILE = "BACA_SAYA.txt"
+
+MAX_BYTES = int(float(os.environ.get("MEDAN_EXPORT_CACHE_MB", "32")) * 1024 * 1024)
+
+# Format yang sudah terkompresi disimpan apa adanya di ZIP
+_ZIP_COMPRESSION = {
+    'csv': zipfile.ZIP_DEFLATED,
+    'parquet': zipfile.ZIP_STORED,
+    'xlsx': zipfile.ZIP_STORED,
+    'txt': zipfile.ZIP_DEFLATED,
+}
+
+
+def available_formats():
+    return [fmt for fmt in FORMATS if fmt != 'xlsx' or XLSX_AVAILABLE]
+
+
+def notice_members():
+    # Anggota ZIP tambahan yang menjelaskan format yang tidak ikut
+    if XLSX_AVAILABLE:
+        return []
+    return [(NOTICE_FILE, 'txt', lambda: (XLSX_MISSING_NOTICE + "\n").encode('utf-8'))]
+
+
+def encode(frame, fmt):
+    buffer = io.BytesIO()
+    if fmt == 'csv':
+        frame.to_csv(buffer, index=False)
+    elif fmt == 'parquet':
+        frame.to_parquet(buffer, index=False)
+    elif fmt == 'xlsx':
+        if not XLSX_AVAILABLE:
+            raise ValueError("Format XLSX membutuhkan paket openpyxl")
+        frame.to_excel(buffer, index=False)
+    else:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+    return buffer.getvalue()
+
+
+# Versi data sudah ada di kunci, jadi entri tidak perlu kedaluwarsa; yang
+# membatasi hanya anggaran bytes
+ENCODED = share(QueryCache("exports", max_bytes=MAX_BYTES, ttl=float("inf")))
+
+
+def encode_dataset(name, fmt, load):
+    return encode(load(), fmt)
+
+
+encode_dataset = instrumented(encode_dataset, "export:{0}.{1}")
+
+
+def export_bytes(name, fmt, version, load):
+    return ENCODED.get_or_compute((name, fmt, version), lambda: encode_dataset(name, fmt, load))
+
+
+class _Pipe(io.RawIOBase):
+    # Tujuan tulis ZipFile yang tidak bisa di-seek: zipfile lalu memakai
+    # data descriptor dan setiap potongan bisa langsung diteruskan
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def iter_zip(members):
+    # members: iterable (nama file, format, fungsi -> bytes); bytes anggota
+    # diambil satu per satu, jadi yang ditahan hanya satu anggota arsip
+    pipe = _Pipe()
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(pipe, 'w') as archive:
+        for filename, fmt, data in members:
+            info = zipfile.ZipInfo(filename, date_time)
+            info.compress_type = _ZIP_COMPRESSION[fmt]
+            archive.writestr(info, data())
+            yield from pipe.drain()
+    yield from pipe.drain()
+
+
+@instrumented
+def zip_file(members):
+    # Untuk st.download_button: arsip ditulis potong demi potong ke file
+    # sementara, lalu file tersebut yang diserahkan (FileIO tanpa buffer,
+    # dibaca sekali oleh Streamlit)
+    spool = tempfile.TemporaryFile(buffering=0)
+    for chunk in iter_zip(members):
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
@@ -0,0 +1,272 @@
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+from figures import COMPACT
+
+# Artefak figure hasil kompilasi. Perintah compile (python
+# figure_artifacts.py) merender semua bagian laporan sekali lewat AppTest;
+# setiap pemanggilan factory chart yang dibungkus @compiled ditulis sebagai
+# file JSON berversi. Saat runtime, wrapper menghitung hash isi data masukan
+# + sumber factory (beserta helper yang dipanggilnya dan modul figures);
+# jika ada artefak dengan hash yang sama, figure dibangun
+# langsung dari JSON (go.Figure) tanpa memanggil factory, sehingga Plotly
+# Express tidak pernah diimpor. Data atau kode factory yang berubah
+# menghasilkan hash lain: artefak lama otomatis diabaikan dan factory
+# dipanggil seperti biasa.
+ARTIFACT_DIR = Path(os.environ.get("MEDAN_FIGURE_DIR", Path(__file__).parent / "artifacts" / "figures"))
+
+# Naikkan jika struktur file artefak berubah
+FORMAT_VERSION = 1
+
+APP_DIR = Path(__file__).resolve().parent
+
+# Modul yang selalu ikut hash sumber: template "medan", apply_layout,
+# compact_figure dan COLORSCALES dipakai semua factory
+SHARED_MODULES = ('figures',)
+
+# Diaktifkan oleh perintah compile: factory selalu dipanggil dan hasilnya ditulis
+RECORD = False
+
+_loaded = {}
+_source_hashes = {}
+_module_hashes = {}
+_lock = threading.Lock()
+_written = set()
+
+
+def plotly_version():
+    import plotly
+
+    return plotly.__version__
+
+
+def _code_key(code):
+    # Bytecode + konstanta (judul, warna, label) + nama, termasuk fungsi/lambda
+    # bersarang: literal yang berubah menghasilkan kunci lain
+    consts = tuple(_code_key(c) if inspect.iscode(c) else (type(c).__name__, repr(c)) for c in code.co_consts)
+    return (code.co_code, consts, code.co_names)
+
+
+def _function_hash(fn):
+    # app.py mendefinisikan ulang factory di setiap rerun; sumbernya cukup
+    # dibaca sekali per versi kode
+    code = fn.__code__
+    key = (code.co_filename, code.co_firstlineno, _code_key(code))
+    digest = _source_hashes.get(key)
+    if digest is None:
+        try:
+            source = inspect.getsource(fn)
+        except (OSError, TypeError):
+            source = fn.__qualname__
+        digest = _source_hashes[key] = hashlib.blake2b(source.encode('utf-8'), digest_size=8).hexdigest()
+    return digest
+
+
+def _file_hash(path):
+    # Isi file modul aplikasi; dibaca ulang hanya jika mtime/ukurannya berubah
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _module_hashes.get(key)
+    if digest is None:
+        digest = _module_hashes[key] = hashlib.blake2b(path.read_bytes(), digest_size=8).hexdigest()
+    return digest
+
+
+def _app_module_path(name):
+    # Modul milik aplikasi ditemukan lewat path di folder app, bukan lewat
+    # sys.modules: hasilnya tidak bergantung pada modul mana yang kebetulan
+    # sudah diimpor saat hash dihitung
+    path = APP_DIR / f"{name.split('.')[0]}.py"
+    return path if path.is_file() else None
+
+
+def _module_path(module):
+    path = getattr(module, '__file__', None)
+    if path is None or Path(path).resolve().parent != APP_DIR:
+        return None
+    return Path(path).resolve()
+
+
+def _names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _names(const)
+    return names
+
+
+def _hash_dependencies(h, fn, seen):
+    # Helper di file yang sama (mis. ci_error_bars di app.py) ikut di-hash
+    # sumbernya, konstanta modul (nama huruf besar) nilainya, dan modul
+    # aplikasi lain (termasuk yang diimpor di dalam fungsi) isi filenya
+    seen.add(fn.__code__)
+    h.update(_function_hash(fn).encode())
+    for name in sorted(_names(fn.__code__)):
+        if name not in fn.__globals__:
+            path = _app_module_path(name)
+        else:
+            value = fn.__globals__[name]
+            if inspect.ismodule(value):
+                path = _module_path(value)
+            elif inspect.isfunction(value):
+                value = inspect.unwrap(value)
+                if value.__code__.co_filename == fn.__code__.co_filename:
+                    if value.__code__ not in seen:
+                        _hash_dependencies(h, value, seen)
+                    continue
+                path = _app_module_path(value.__module__)
+            elif name.isupper():
+                h.update(f"{name}:{value!r}".encode('utf-8'))
+                continue
+            else:
+                continue
+        if path is not None:
+            h.update(f"{name}:{_file_hash(path)}".encode('utf-8'))
+
+
+def _source_hash(fn):
+    h = hashlib.blake2b(digest_size=8)
+    for name in SHARED_MODULES:
+        h.update(_file_hash(APP_DIR / f"{name}.py").encode())
+    _hash_dependencies(h, fn, set())
+    return h.hexdigest()
+
+
+def _update(h, value):
+    if hasattr(value, 'columns') and hasattr(value, 'index'):
+        import pandas as pd
+
+        h.update(repr(list(value.columns)).encode('utf-8'))
+        h.update(repr([str(t) for t in value.dtypes]).encode('utf-8'))
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    else:
+        h.update(repr(value).encode('utf-8'))
+
+
+def data_hash(source_hash, args, kwargs):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{FORMAT_VERSION}:{source_hash}:{int(COMPACT)}".encode())
+    for value in args:
+        _update(h, value)
+    for key in sorted(kwargs):
+        h.update(key.encode('utf-8'))
+        _update(h, kwargs[key])
+    return h.hexdigest()
+
+
+def artifact_path(name, digest, directory=None):
+    return Path(directory or ARTIFACT_DIR) / f"{name}-{digest}.json"
+
+
+def load_artifact(path):
+    # Dibaca sekali per proses; artefak format/versi plotly lain diabaikan
+    with _lock:
+        if path in _loaded:
+            return _loaded[path]
+    artifact = None
+    if path.exists():
+        artifact = json.loads(path.read_text(encoding='utf-8'))
+        if artifact.get('format') != FORMAT_VERSION or artifact.get('plotly') != plotly_version():
+            artifact = None
+    with _lock:
+        _loaded[path] = artifact
+    return artifact
+
+
+def write_artifact(path, name, digest, result):
+    import plotly.io as pio
+
+    figures = result if isinstance(result, tuple) else (result,)
+    artifact = {
+        'format': FORMAT_VERSION,
+        'factory': name,
+        'data_hash': digest,
+        'plotly': plotly_version(),
+        'compiled_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'tuple': isinstance(result, tuple),
+        'figures': [json.loads(pio.to_json(fig, validate=False)) for fig in figures]
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_text(json.dumps(artifact, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp, path)
+    _written.add(path)
+
+
+def compiled(fn):
+    name = fn.__name__
+    source_hash = None
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        nonlocal source_hash
+        # Dihitung saat panggilan pertama: helper yang didefinisikan setelah
+        # factory di app.py baru ada di globals saat itu
+        if source_hash is None:
+            source_hash = _source_hash(fn)
+        digest = data_hash(source_hash, args, kwargs)
+        path = artifact_path(name, digest)
+        if RECORD:
+            result = fn(*args, **kwargs)
+            write_artifact(path, name, digest, result)
+            return result
+        artifact = load_artifact(path)
+        if artifact is None:
+            return fn(*args, **kwargs)
+        figures = tuple(go.Figure(spec, skip_invalid=True) for spec in artifact['figures'])
+        return figures if artifact['tuple'] else figures[0]
+    return wrapper
+
+
+def compile_all(out=None, clean=True):
+    global ARTIFACT_DIR, RECORD
+
+    from export_static import render_sections
+
+    if out is not None:
+        ARTIFACT_DIR = Path(out)
+    RECORD = True
+    _written.clear()
+    try:
+        render_sections()
+    finally:
+        RECORD = False
+    removed = []
+    if clean:
+        # Artefak dari data/kode lama tidak akan pernah cocok lagi
+        for path in ARTIFACT_DIR.glob("*.json"):
+            if path not in _written:
+                path.unlink()
+                removed.append(path)
+    return sorted(_written), removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kompilasi figure laporan menjadi artefak JSON")
+    parser.add_argument("--out", type=Path, default=ARTIFACT_DIR, help=f"Folder artefak (default: {ARTIFACT_DIR})")
+    parser.add_argument("--keep-stale", action="store_true", help="Jangan hapus artefak yang tidak terpakai")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    written, removed = compile_all(args.out, clean=not args.keep_stale)
+    for path in written:
+        print(f"  {path.name:<66} {path.stat().st_size / 1024:>7.1f} KB")
+    print(f"{len(written)} artefak ditulis ke {args.out}, {len(removed)} artefak usang dihapus "
+          f"({time.perf_counter() - start:.1f} dtk)")
+
+
+if __name__ == '__main__':
+    # Jalankan lewat modul bernama agar RECORD terlihat oleh app.py
+    import figure_artifacts
+
+    sys.exit(figure_artifacts.main())
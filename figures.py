@@ -0,0 +1,179 @@
+import json
+import os
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit  # noqa: F401  (mendaftarkan template "streamlit" ke plotly.io)
+
+# Konvensi figure bersama dan pemadatan payload Plotly.
+#
+# Template "medan" diturunkan dari template "streamlit" (yang placeholder
+# warnanya diganti frontend sesuai tema), tetapi hanya membawa default trace
+# untuk jenis trace yang dipakai app dan posisi colorscale yang dibulatkan.
+# Template ikut terkirim di setiap figure, jadi ukurannya langsung
+# memengaruhi bytes per rerun.
+#
+# Frontend Streamlit menimpa template.layout dengan tema aktif, sehingga
+# konvensi tata letak app (latar transparan, warna font, colorbar
+# disembunyikan) tetap diterapkan di layout figure lewat apply_layout().
+TEMPLATE_NAME = "medan"
+TRACE_TYPES = ('bar', 'pie', 'heatmap', 'scatter')
+
+# Set MEDAN_COMPACT_FIGURES=0 untuk mengirim figure apa adanya (pembanding)
+COMPACT = os.environ.get("MEDAN_COMPACT_FIGURES", "1") != "0"
+
+LAYOUT = dict(
+    coloraxis_showscale=False,
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='#333333')
+)
+
+# Color scale kustom yang lebih gelap (ujung terang tidak terlalu cerah)
+COLORSCALES = {
+    'blues': [[0.0, '#1e3b8a'], [0.3, '#2563eb'], [0.6, '#3b82f6'], [1.0, '#60a5fa']],
+    'greens': [[0.0, '#065f46'], [0.3, '#059669'], [0.6, '#10b981'], [1.0, '#34d399']],
+    'purples': [[0.0, '#4c1d95'], [0.3, '#6d28d9'], [0.6, '#8b5cf6'], [1.0, '#a78bfa']],
+    'oranges': [[0.0, '#9a3412'], [0.3, '#ea580c'], [0.6, '#f97316'], [1.0, '#fdba74']],
+    'reds': [[0.0, '#7f1d1d'], [0.3, '#dc2626'], [0.6, '#ef4444'], [1.0, '#f87171']]
+}
+
+# Atribut trace yang nilainya sama dengan default plotly.js
+TRACE_DEFAULTS = {
+    'xaxis': 'x',
+    'yaxis': 'y',
+    'legendgroup': '',
+    'offsetgroup': '',
+    'textposition': 'auto'
+}
+BAR_DEFAULTS = {'orientation': 'v'}
+FULL_DOMAIN = [0.0, 1.0]
+
+
+def _round_stops(colorscale, digits=4):
+    return [[round(stop, digits), color] for stop, color in colorscale]
+
+
+def _round_colorscales(obj):
+    # Posisi colorscale seperti 0.1111111111111111 cukup 4 desimal
+    if isinstance(obj, dict):
+        return {
+            key: _round_stops(value) if _is_colorscale(value) else _round_colorscales(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_round_colorscales(v) for v in obj]
+    return obj
+
+
+def _is_colorscale(value):
+    return (
+        isinstance(value, list) and value
+        and all(isinstance(s, list) and len(s) == 2 and isinstance(s[0], float) for s in value)
+    )
+
+
+def _build_template():
+    base = pio.templates["streamlit"].to_plotly_json() if "streamlit" in pio.templates else {}
+    data = {t: v for t, v in base.get('data', {}).items() if t in TRACE_TYPES}
+    return go.layout.Template(_round_colorscales({'data': data, 'layout': base.get('layout', {})}))
+
+
+pio.templates[TEMPLATE_NAME] = _build_template()
+if COMPACT:
+    pio.templates.default = TEMPLATE_NAME
+
+
+# Warna tema terang Streamlit untuk placeholder template "streamlit"
+# (#000001-#000040). Frontend Streamlit menggantinya saat menggambar; di luar
+# Streamlit (ekspor HTML statis) placeholder harus diganti sendiri
+_CATEGORY = ['#0068c9', '#83c9ff', '#ff2b2b', '#ffabab', '#29b09d', '#7defa1', '#ff8700', '#ffd16a', '#6d3fc0',
+             '#d5dae5']
+_SEQUENTIAL = ['#e4f5ff', '#c7ebff', '#a6dcff', '#83c9ff', '#60b4ff', '#3d9df3', '#1c83e1', '#0068c9', '#0054a3',
+               '#004280']
+_DIVERGING = ['#7d353b', '#bd4043', '#ff4b4b', '#ff8c8c', '#ffc7c7', '#f0f2f6', '#a6dcff', '#60b4ff', '#1c83e1',
+              '#0054a3', '#004280']
+STATIC_THEME_COLORS = {
+    **{f'#{i + 1:06d}': color for i, color in enumerate(_CATEGORY)},
+    **{f'#{i + 11:06d}': color for i, color in enumerate(_SEQUENTIAL)},
+    **{f'#{i + 21:06d}': color for i, color in enumerate(_DIVERGING)},
+    '#000032': '#29b09d',
+    '#000033': '#ff2b2b',
+    '#000034': '#0068c9',
+    '#000036': '#808495',
+    '#000037': '#262730',
+    '#000038': '#ffffff',
+    '#000039': 'rgba(49, 51, 63, 0.1)',
+    '#000040': 'rgba(49, 51, 63, 0.05)'
+}
+
+
+def _resolve_colors(obj):
+    if isinstance(obj, dict):
+        return {key: _resolve_colors(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_resolve_colors(v) for v in obj]
+    if isinstance(obj, str):
+        return STATIC_THEME_COLORS.get(obj, obj)
+    return obj
+
+
+def static_spec(spec):
+    # Spesifikasi figure (dict JSON) untuk plotly.js biasa: template "medan"
+    # dengan warna tema terang menggantikan placeholder
+    layout = spec.setdefault('layout', {})
+    template = layout.get('template') or pio.templates[TEMPLATE_NAME].to_plotly_json()
+    layout['template'] = _resolve_colors(template)
+    return spec
+
+
+def apply_layout(fig, **overrides):
+    fig.update_layout(**{**LAYOUT, **overrides})
+    return fig
+
+
+def _compact_trace(trace):
+    for key, default in TRACE_DEFAULTS.items():
+        if trace.get(key) == default:
+            del trace[key]
+    if trace.get('type') == 'bar':
+        for key, default in BAR_DEFAULTS.items():
+            if trace.get(key) == default:
+                del trace[key]
+    marker = trace.get('marker')
+    if marker and marker.get('pattern') == {'shape': ''}:
+        del marker['pattern']
+    domain = trace.get('domain')
+    if domain and domain.get('x') == FULL_DOMAIN and domain.get('y') == FULL_DOMAIN:
+        del trace['domain']
+    return trace
+
+
+def _compact_layout(layout, trace_types):
+    template = layout.get('template')
+    if template:
+        # Default trace hanya berguna untuk jenis trace yang ada di figure
+        template['data'] = {t: v for t, v in template.get('data', {}).items() if t in trace_types}
+    for key, axis in layout.items():
+        if key.startswith(('xaxis', 'yaxis')) and isinstance(axis, dict) and axis.get('domain') == FULL_DOMAIN:
+            del axis['domain']
+    coloraxis = layout.get('coloraxis')
+    if coloraxis and coloraxis.get('showscale') is False:
+        # Colorbar tidak ditampilkan, judulnya tidak perlu dikirim
+        coloraxis.pop('colorbar', None)
+    return _round_colorscales(layout)
+
+
+def compact_figure(fig):
+    # Buang atribut bernilai default dan bagian template yang tidak terpakai.
+    # Dipanggil sekali di factory figure (hasilnya ikut di-cache).
+    if not COMPACT:
+        return fig
+    spec = json.loads(pio.to_json(fig, validate=False))
+    data = [_compact_trace(trace) for trace in spec.get('data', [])]
+    layout = _compact_layout(spec.get('layout', {}), {t.get('type', 'scatter') for t in data})
+    return go.Figure({'data': data, 'layout': layout}, skip_invalid=True)
+
+
+def figure_bytes(fig):
+    return len(pio.to_json(fig, validate=False).encode('utf-8'))
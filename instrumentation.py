@@ -0,0 +1,208 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+# Instrumentasi hot path: durasi tiap bagian, pemanggilan create_*_chart,
+# st.plotly_chart/st.dataframe dan pemuatan data. Aktif hanya dengan
+# MEDAN_METRICS=1; bila tidak aktif, instrumented() mengembalikan fungsi
+# aslinya dan fungsi run/section langsung kembali, jadi tidak ada biaya per
+# panggilan. Setiap rerun ditulis sebagai satu baris JSON ke log
+# berotasi, dan agregatnya ke file teks format Prometheus (untuk textfile
+# collector node_exporter atau scraper lokal lain).
+ENABLED = os.environ.get("MEDAN_METRICS", "0") == "1"
+METRICS_DIR = Path(os.environ.get("MEDAN_METRICS_DIR", Path(__file__).parent / "metrics"))
+LOG_PATH = METRICS_DIR / "rerun.jsonl"
+PROMETHEUS_PATH = METRICS_DIR / "medan.prom"
+
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+# File Prometheus ditulis ulang paling sering sekali per interval ini
+PROMETHEUS_INTERVAL = 10.0
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class SpanStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+
+
+class Registry:
+    # Agregat lintas sesi; sesi Streamlit berjalan di thread berbeda
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._collectors = []
+        self._written_at = 0.0
+
+    def register_collector(self, collector):
+        # collector() -> baris teks Prometheus tambahan (mis. counter cache)
+        with self._lock:
+            self._collectors.append(collector)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = SpanStats()
+            stats.observe(seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {
+                    'count': s.count,
+                    'mean_ms': round(s.total / s.count * 1000, 2),
+                    'max_ms': round(s.max * 1000, 2),
+                    'total_s': round(s.total, 3)
+                }
+                for name, s in sorted(self._stats.items())
+            }
+
+    def prometheus_text(self):
+        lines = [
+            '# HELP medan_span_seconds Durasi span instrumentasi laporan',
+            '# TYPE medan_span_seconds histogram'
+        ]
+        with self._lock:
+            for name, s in sorted(self._stats.items()):
+                label = _escape_label(name)
+                for bound, n in zip(BUCKETS, s.buckets):
+                    lines.append(f'medan_span_seconds_bucket{{span="{label}",le="{bound}"}} {n}')
+                lines.append(f'medan_span_seconds_bucket{{span="{label}",le="+Inf"}} {s.count}')
+                lines.append(f'medan_span_seconds_sum{{span="{label}"}} {s.total:.6f}')
+                lines.append(f'medan_span_seconds_count{{span="{label}"}} {s.count}')
+            collectors = list(self._collectors)
+        for collector in collectors:
+            lines.extend(collector())
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path=PROMETHEUS_PATH, force=False):
+        now = time.monotonic()
+        if not force and now - self._written_at < PROMETHEUS_INTERVAL:
+            return
+        self._written_at = now
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Tulis atomik agar scraper tidak pernah membaca file setengah jadi
+        tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp.write_text(self.prometheus_text(), encoding='utf-8')
+        os.replace(tmp, path)
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+REGISTRY = Registry()
+register_collector = REGISTRY.register_collector
+_local = threading.local()
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def _rerun_logger():
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            METRICS_DIR.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES,
+                                          backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger = logging.getLogger('medan.metrics')
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+            _logger = logger
+    return _logger
+
+
+class Run:
+    # Span satu rerun script; disimpan per thread karena tiap sesi punya
+    # thread script-nya sendiri
+    def __init__(self, section, session_id):
+        self.section = section
+        self.session_id = session_id
+        self.started = time.perf_counter()
+        self.spans = []
+
+    def record(self, name, seconds):
+        self.spans.append((name, seconds))
+
+    def as_record(self):
+        return {
+            'ts': round(time.time(), 3),
+            'session': self.session_id,
+            'section': self.section,
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 2),
+            'spans': [{'name': name, 'ms': round(s * 1000, 3)} for name, s in self.spans]
+        }
+
+
+def observe(name, seconds):
+    REGISTRY.observe(name, seconds)
+    run = getattr(_local, 'run', None)
+    if run is not None:
+        run.record(name, seconds)
+
+
+def instrumented(fn, name=None):
+    # name boleh berisi {0}, {1}, ... untuk menyertakan argumen posisi,
+    # mis. "load_dataset:{0}"
+    if not ENABLED:
+        return fn
+    name = name or getattr(fn, '__name__', repr(fn))
+    templated = '{' in name
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            observe(name.format(*args) if templated else name, time.perf_counter() - start)
+    return wrapper
+
+
+def begin_run(section, session_id=None):
+    if not ENABLED:
+        return None
+    run = Run(section, session_id or uuid.uuid4().hex[:8])
+    _local.run = run
+    return run
+
+
+def end_run(run):
+    if run is None:
+        return None
+    _local.run = None
+    record = run.as_record()
+    REGISTRY.observe('rerun', record['total_ms'] / 1000)
+    _rerun_logger().info(json.dumps(record, ensure_ascii=False))
+    REGISTRY.write_prometheus()
+    return record
+
+
+def start_section(run):
+    if run is not None:
+        run.section_started = time.perf_counter()
+
+
+def end_section(run):
+    if run is not None:
+        observe(f"section:{run.section}", time.perf_counter() - run.section_started)
@@ -0,0 +1,157 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import instrumentation
+
+# Cache hasil agregat (frame cube per kombinasi filter, tabulasi silang)
+# bersama untuk semua sesi. Kunci = jenis query + versi data + kombinasi
+# filter yang dinormalisasi, jadi urutan pilihan multiselect tidak membuat
+# entri baru. Dibatasi anggaran bytes (bukan jumlah entri): entri paling
+# lama tidak dipakai dibuang sampai total ukuran muat, dan entri yang lebih
+# tua dari TTL dianggap kedaluwarsa. Nilai yang disimpan dipakai bersama
+# lintas sesi, jadi pemanggil tidak boleh mengubahnya.
+MAX_BYTES = int(float(os.environ.get("MEDAN_QUERY_CACHE_MB", "64")) * 1024 * 1024)
+TTL_SECONDS = float(os.environ.get("MEDAN_QUERY_CACHE_TTL", "900"))
+
+
+def normalize_filters(filters):
+    # {dim: [nilai, ...]} -> tuple terurut, dimensi tanpa pilihan diabaikan
+    return tuple(sorted(
+        (dim, tuple(sorted(str(v) for v in values))) for dim, values in (filters or {}).items() if values
+    ))
+
+
+def estimate_bytes(value):
+    # Perkiraan ukuran objek hasil query (DataFrame, array, dict/list/tuple)
+    if hasattr(value, 'memory_usage') and hasattr(value, 'columns'):
+        return int(value.memory_usage(deep=True).sum())
+    if hasattr(value, 'memory_usage'):
+        return int(value.memory_usage(deep=True))
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(k) + estimate_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v) for v in value)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + estimate_bytes(vars(value))
+    return sys.getsizeof(value)
+
+
+class QueryCache:
+    def __init__(self, name, max_bytes=MAX_BYTES, ttl=TTL_SECONDS, clock=time.monotonic):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[2] > self.ttl:
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = estimate_bytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                # Lebih besar dari seluruh anggaran: tidak disimpan
+                return value
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        # Dua sesi dengan miss bersamaan bisa menghitung ganda; hasilnya sama
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl_s': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+    def prometheus_lines(self):
+        return prometheus_lines([self])
+
+
+# (nama metrik, kunci stats(), tipe Prometheus)
+_METRICS = (
+    ('hits_total', 'hits', 'counter'),
+    ('misses_total', 'misses', 'counter'),
+    ('evictions_total', 'evictions', 'counter'),
+    ('expirations_total', 'expirations', 'counter'),
+    ('entries', 'entries', 'gauge'),
+    ('bytes', 'bytes', 'gauge'),
+    ('max_bytes', 'max_bytes', 'gauge'),
+)
+
+
+def prometheus_lines(caches):
+    # Satu baris TYPE per metrik, sampel semua cache dikelompokkan di bawahnya
+    stats = [(cache.name, cache.stats()) for cache in caches]
+    lines = []
+    for metric, key, kind in _METRICS:
+        lines.append(f'# TYPE medan_query_cache_{metric} {kind}')
+        lines.extend(f'medan_query_cache_{metric}{{cache="{name}"}} {values[key]}' for name, values in stats)
+    return lines
+
+
+# Cache bersama lintas sesi (modul tetap di sys.modules antar rerun); yang
+# didaftarkan lewat share() ikut diekspor ke Prometheus dan panel debug
+SHARED = []
+
+
+def share(cache):
+    SHARED.append(cache)
+    return cache
+
+
+instrumentation.register_collector(lambda: prometheus_lines(SHARED))
+
+# Hasil agregat survei
+AGGREGATES = share(QueryCache("aggregates"))
@@ -0,0 +1,341 @@
+import argparse
+import hashlib
+import itertools
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_DIR, load_dataset
+from survey import (
+    DEFAULT_CHUNKSIZE,
+    INDICATOR_SOURCE_COLUMNS,
+    KARIR_LABELS,
+    KONSUMSI_COLUMNS,
+    PLATFORM_COLUMNS,
+    indicator_frame,
+    iter_chunks,
+    read_columns,
+)
+from weighting import load_margins, rake
+
+# Mesin segmentasi berbasis data: mini-batch k-means (NumPy, tervektorisasi)
+# atas vektor fitur responden. File dibaca per chunk sehingga memori tetap
+# terbatas berapa pun jumlah responden, dan hasilnya deterministik untuk seed
+# yang sama. Cluster lalu dicocokkan ke empat nama segmen laporan sehingga
+# output-nya berbentuk sama dengan data/segmentasi.csv.
+MODEL_PATH = DATA_DIR / "segmen_model.npz"
+
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_EPOCHS = 3
+
+# Batas drift gelombang baru terhadap model tersimpan sebelum perlu
+# recluster penuh: rasio rata-rata jarak kuadrat ke centroid, dan total
+# variation distance antara porsi segmen gelombang baru dan porsi kumulatif
+INERTIA_DRIFT_THRESHOLD = 1.25
+SHARE_DRIFT_THRESHOLD = 0.10
+
+# Menit harian dinormalisasi terhadap 2 jam dan dipotong agar outlier
+# tidak mendominasi jarak
+MENIT_SCALE = 120.0
+MENIT_CLIP = 2.0
+
+PLATFORMS = list(PLATFORM_COLUMNS.values())
+
+FEATURE_NAMES = (
+    [f'pakai_{p}' for p in PLATFORMS]
+    + [f'menit_{p}' for p in PLATFORMS]
+    + list(KONSUMSI_COLUMNS.values())
+    + [f'karir_{i}' for i in range(len(KARIR_LABELS))]
+)
+
+
+def segment_features(chunk):
+    indicators = indicator_frame(chunk)
+    X = indicators[FEATURE_NAMES].to_numpy(dtype=np.float64)
+    menit = slice(len(PLATFORMS), 2 * len(PLATFORMS))
+    X[:, menit] = np.clip(X[:, menit] / MENIT_SCALE, 0, MENIT_CLIP)
+    return X
+
+
+def _sq_distances(X, centroids):
+    # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, tanpa array n x k x d
+    d = (X * X).sum(axis=1)[:, None] - 2 * X @ centroids.T + (centroids * centroids).sum(axis=1)[None, :]
+    return np.maximum(d, 0)
+
+
+def _kmeans_plus_plus(X, k, rng):
+    centroids = [X[rng.integers(len(X))]]
+    for _ in range(1, k):
+        d = _sq_distances(X, np.array(centroids)).min(axis=1)
+        total = d.sum()
+        p = d / total if total > 0 else None
+        centroids.append(X[rng.choice(len(X), p=p)])
+    return np.array(centroids)
+
+
+def _batch_sums(X, labels, k):
+    counts = np.bincount(labels, minlength=k).astype(np.float64)
+    sums = np.stack([np.bincount(labels, weights=X[:, j], minlength=k) for j in range(X.shape[1])], axis=1)
+    return counts, sums
+
+
+# Skor "seberapa cocok" centroid dengan tiap segmen laporan, dihitung dari
+# fitur yang digambarkan di halaman Segmentasi
+def _segment_scores(centroids):
+    f = {name: centroids[:, i] for i, name in enumerate(FEATURE_NAMES)}
+    karir = {label: f[f'karir_{i}'] for i, label in enumerate(KARIR_LABELS)}
+    usage = sum(f[f'menit_{p}'] for p in PLATFORMS)
+    return {
+        'Digital-First Urbanites': f['menit_tiktok'] + f['menit_instagram'] + f['beli_online_fashion'] + f['beli_online_kecantikan'],
+        'Edu-Career Seekers': karir['PNS/ASN'] + karir['Perusahaan Swasta'] + f['menit_youtube'],
+        'Entrepreneurial Hustlers': karir['Wirausaha/Digital'] + karir['Freelancer'] + f['pakai_shopee'],
+        'Tradition-Oriented Youth': -usage
+    }
+
+
+def name_clusters(centroids, names):
+    # Pilih pasangan cluster -> nama dengan skor total terbesar (k kecil,
+    # cukup coba semua permutasi)
+    scores = _segment_scores(centroids)
+    matrix = np.array([scores[name] for name in names])
+    matrix = (matrix - matrix.mean(axis=1, keepdims=True)) / (matrix.std(axis=1, keepdims=True) + 1e-9)
+    best = max(
+        itertools.permutations(range(len(centroids))),
+        key=lambda perm: sum(matrix[i, c] for i, c in enumerate(perm))
+    )
+    result = [None] * len(centroids)
+    for i, c in enumerate(best):
+        result[c] = names[i]
+    return result
+
+
+class SegmentModel:
+    def __init__(self, centroids, names, counts, inertia, seed=DEFAULT_SEED, waves=()):
+        self.centroids = centroids
+        self.names = list(names)
+        self.counts = counts
+        self.inertia = inertia
+        self.seed = seed
+        # Digest isi file gelombang yang sudah masuk ke counts
+        self.waves = list(waves)
+
+    @property
+    def k(self):
+        return len(self.centroids)
+
+    def assign(self, X):
+        distances = _sq_distances(X, self.centroids)
+        labels = distances.argmin(axis=1)
+        return labels, distances[np.arange(len(X)), labels]
+
+    def assign_names(self, chunk):
+        labels, _ = self.assign(segment_features(chunk))
+        return np.asarray(self.names, dtype=object)[labels]
+
+    def shares(self):
+        return self.counts / self.counts.sum() * 100
+
+    def segment_frame(self, reference=None):
+        if reference is None:
+            reference = load_dataset("segmentasi")
+        persen = pd.Series(self.shares(), index=self.names).reindex(reference['Segment']).fillna(0)
+        return pd.DataFrame({
+            'Segment': reference['Segment'].to_numpy(),
+            'Persentase': np.round(persen.to_numpy(), 1),
+            'Warna': reference['Warna'].to_numpy()
+        })
+
+    def profile_frame(self):
+        # Rata-rata fitur per segmen dalam satuan asli (persen & menit)
+        profile = pd.DataFrame(self.centroids, columns=FEATURE_NAMES)
+        out = pd.DataFrame({'Segment': self.names, 'Persentase': np.round(self.shares(), 1)})
+        for label, p in PLATFORM_COLUMNS.items():
+            out[f'Pengguna {label} (%)'] = np.round(profile[f'pakai_{p}'] * 100, 1)
+        for label, p in PLATFORM_COLUMNS.items():
+            out[f'Menit {label}'] = np.round(profile[f'menit_{p}'] * MENIT_SCALE, 1)
+        for label, kolom in KONSUMSI_COLUMNS.items():
+            out[f'Beli Online {label} (%)'] = np.round(profile[kolom] * 100, 1)
+        for i, label in enumerate(KARIR_LABELS):
+            out[f'Minat {label} (%)'] = np.round(profile[f'karir_{i}'] * 100, 1)
+        return out
+
+    def save(self, path=MODEL_PATH):
+        np.savez(
+            path,
+            centroids=self.centroids,
+            names=np.array(self.names),
+            counts=self.counts,
+            inertia=np.array(self.inertia),
+            seed=np.array(self.seed),
+            waves=np.array(self.waves, dtype=str)
+        )
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        with np.load(path, allow_pickle=False) as f:
+            return cls(
+                f['centroids'],
+                [str(n) for n in f['names']],
+                f['counts'],
+                float(f['inertia']),
+                int(f['seed']),
+                [str(w) for w in f['waves']] if 'waves' in f else []
+            )
+
+
+def wave_digest(path, block_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _assigned_counts(model, path, chunksize, weights=None):
+    # Porsi segmen (tertimbang jika ada bobot raking) dan total jarak kuadrat.
+    # Bobot raking menjumlah ke total populasi untuk setiap gelombang; hitungan
+    # diskalakan kembali ke jumlah responden gelombang agar tiap gelombang
+    # berkontribusi sebanding ukurannya di hitungan kumulatif
+    counts = np.zeros(model.k)
+    total_distance = 0.0
+    n_raw = 0
+    for chunk in iter_chunks(path, chunksize, columns=read_columns(INDICATOR_SOURCE_COLUMNS, weights=weights)):
+        labels, distances = model.assign(segment_features(chunk))
+        w = np.ones(len(chunk)) if weights is None else weights.for_chunk(chunk)
+        counts += np.bincount(labels, weights=w, minlength=model.k)
+        total_distance += (distances * w).sum()
+        n_raw += len(chunk)
+    if n_raw == 0:
+        raise ValueError(f"File responden kosong: {path}")
+    scale = n_raw / counts.sum()
+    return counts * scale, total_distance * scale, n_raw
+
+
+def fit_segments(path, names=None, seed=DEFAULT_SEED, batch_size=DEFAULT_BATCH_SIZE,
+                 epochs=DEFAULT_EPOCHS, chunksize=DEFAULT_CHUNKSIZE, weights=None):
+    if names is None:
+        names = list(load_dataset("segmentasi")['Segment'])
+    k = len(names)
+    rng = np.random.default_rng(seed)
+
+    centroids = None
+    seen = np.zeros(k)
+    for _ in range(epochs):
+        for chunk in iter_chunks(path, chunksize, columns=INDICATOR_SOURCE_COLUMNS):
+            X = segment_features(chunk)
+            if centroids is None:
+                centroids = _kmeans_plus_plus(X[rng.permutation(len(X))[:batch_size * 4]], k, rng)
+            order = rng.permutation(len(X))
+            for start in range(0, len(X), batch_size):
+                batch = X[order[start:start + batch_size]]
+                labels = _sq_distances(batch, centroids).argmin(axis=1)
+                counts, sums = _batch_sums(batch, labels, k)
+                # Update mini-batch: centroid = rata-rata berjalan semua titik
+                # yang pernah masuk ke cluster tersebut
+                seen += counts
+                hit = counts > 0
+                eta = counts[hit] / seen[hit]
+                centroids[hit] = (1 - eta)[:, None] * centroids[hit] + eta[:, None] * (sums[hit] / counts[hit, None])
+    if centroids is None:
+        raise ValueError(f"File responden kosong: {path}")
+
+    # Pass akhir: hitung porsi segmen dan inertia dengan centroid final
+    model = SegmentModel(centroids, [None] * k, np.zeros(k), 0.0, seed)
+    counts, total_distance, _ = _assigned_counts(model, path, chunksize, weights)
+
+    model.counts = counts
+    model.inertia = total_distance / counts.sum()
+    model.names = name_clusters(centroids, names)
+    model.waves = [wave_digest(path)]
+    return model
+
+
+def load_segment_model(path=MODEL_PATH):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return SegmentModel.load(path)
+
+
+class WaveUpdate:
+    def __init__(self, counts, n, inertia_ratio, share_drift):
+        self.counts = counts
+        self.n = n
+        self.inertia_ratio = inertia_ratio
+        self.share_drift = share_drift
+
+    @property
+    def needs_recluster(self):
+        return self.inertia_ratio > INERTIA_DRIFT_THRESHOLD or self.share_drift > SHARE_DRIFT_THRESHOLD
+
+
+def assign_wave(model, path, chunksize=DEFAULT_CHUNKSIZE, weights=None):
+    # Satu pass tervektorisasi: tiap chunk langsung dipetakan ke centroid
+    # tersimpan tanpa melatih ulang
+    counts, total_distance, n = _assigned_counts(model, path, chunksize, weights)
+
+    inertia_ratio = (total_distance / counts.sum()) / model.inertia if model.inertia > 0 else np.inf
+    share_drift = 0.5 * np.abs(counts / counts.sum() - model.counts / model.counts.sum()).sum()
+    return WaveUpdate(counts, n, float(inertia_ratio), float(share_drift))
+
+
+def update_segments(model, path, chunksize=DEFAULT_CHUNKSIZE, weights=None):
+    # Porsi segmen diperbarui secara inkremental dengan menambah hitungan
+    # gelombang baru ke hitungan kumulatif; centroid tidak diubah. File yang
+    # sama tidak boleh dihitung dua kali
+    digest = wave_digest(path)
+    if digest in model.waves:
+        raise ValueError(f"Gelombang {path} sudah ada di model segmen ({digest})")
+    update = assign_wave(model, path, chunksize, weights)
+    model.counts = model.counts + update.counts
+    model.waves.append(digest)
+    return update
+
+
+def _main(argv=None):
+    parser = argparse.ArgumentParser(description="Segmentasi responden Gen Z Medan")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fit_parser = sub.add_parser("fit", help="latih ulang segmen dari file responden")
+    fit_parser.add_argument("path")
+    fit_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    update_parser = sub.add_parser("update", help="tambahkan gelombang survei baru ke model tersimpan")
+    update_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.command == "update":
+        model = load_segment_model()
+        if model is None:
+            parser.error(f"model segmen belum ada di {MODEL_PATH}; jalankan 'fit' dulu")
+        if wave_digest(args.path) in model.waves:
+            print(f"{args.path} sudah pernah dimasukkan ke model; tidak ada perubahan")
+            return 0
+    # Porsi segmen ditimbang ke margin populasi jika data/populasi_margin.csv ada
+    weights = rake(args.path) if load_margins() is not None else None
+    if args.command == "fit":
+        model = fit_segments(args.path, seed=args.seed, weights=weights)
+        model.save()
+        print(model.profile_frame().to_string(index=False))
+        print(f"inertia {model.inertia:.4f}, {time.perf_counter() - start:.1f} dtk, disimpan ke {MODEL_PATH}")
+    else:
+        update = update_segments(model, args.path, weights=weights)
+        model.save()
+        # segmentasi.csv ditulis ulang; data_loader memuatnya lagi karena mtime berubah
+        model.segment_frame().to_csv(DATA_DIR / "segmentasi.csv", index=False)
+        print(
+            f"{update.n:,} responden baru dalam {time.perf_counter() - start:.1f} dtk; "
+            f"rasio inertia {update.inertia_ratio:.3f} (batas {INERTIA_DRIFT_THRESHOLD}), "
+            f"drift porsi {update.share_drift:.3f} (batas {SHARE_DRIFT_THRESHOLD})"
+        )
+        if update.needs_recluster:
+            print("Drift melewati batas: jalankan 'fit' untuk recluster penuh")
+            return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(_main())
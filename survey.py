@@ -0,0 +1,173 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loader import load_dataset, respondent_path  # noqa: F401  (respondent_path diekspor ulang)
+
+# Mesin ingest data survei tingkat responden. File CSV/Parquet dibaca per
+# chunk, setiap chunk diubah menjadi kolom indikator numerik lalu dijumlahkan,
+# sehingga memori hanya sebesar satu chunk + vektor jumlah berapa pun ukuran
+# filenya. Hasil akhirnya DataFrame dengan kolom yang sama persis dengan
+# dataset di data/ sehingga bisa langsung dipakai fungsi create_*_chart.
+
+DEFAULT_CHUNKSIZE = 250_000
+
+# Label chart -> nama kolom pada file responden
+PLATFORM_COLUMNS = {
+    'TikTok': 'tiktok',
+    'Instagram': 'instagram',
+    'YouTube': 'youtube',
+    'Spotify': 'spotify',
+    'Shopee': 'shopee'
+}
+
+KONSUMSI_COLUMNS = {
+    'Fashion': 'beli_online_fashion',
+    'Kuliner': 'beli_online_kuliner',
+    'Elektronik': 'beli_online_elektronik',
+    'Kecantikan': 'beli_online_kecantikan',
+    'Hiburan': 'beli_online_hiburan'
+}
+
+KARIR_LABELS = ['Wirausaha/Digital', 'PNS/ASN', 'Perusahaan Swasta', 'Freelancer', 'Lainnya']
+
+MENTAL_HEALTH_COLUMNS = {
+    'Stress Akademik': 'stress_akademik',
+    'Kecemasan Sosial': 'kecemasan_sosial',
+    'Depresi': 'depresi',
+    'Body Image Issues': 'body_image',
+    'Burnout': 'burnout'
+}
+
+# Kolom demografi (dipakai untuk filter & segmentasi)
+DIMENSION_COLUMNS = ['kelompok_umur', 'gender', 'pendidikan', 'kecamatan']
+SEGMENT_COLUMN = 'segmen'
+
+INDICATOR_SOURCE_COLUMNS = (
+    [f'pakai_{p}' for p in PLATFORM_COLUMNS.values()]
+    + [f'menit_{p}' for p in PLATFORM_COLUMNS.values()]
+    + list(KONSUMSI_COLUMNS.values())
+    + ['minat_karir']
+    + list(MENTAL_HEALTH_COLUMNS.values())
+)
+
+
+def available_columns(path):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        return list(pq.read_schema(path).names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE, columns=None):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns)
+
+
+def read_columns(*groups, weights=None):
+    # Kolom yang perlu dibaca dari file, tanpa duplikat
+    columns = [c for group in groups for c in group]
+    if weights is not None:
+        columns += weights.columns
+    return list(dict.fromkeys(columns))
+
+
+def indicator_frame(chunk, weights=None):
+    # Satu baris per responden, satu kolom per indikator yang bisa dijumlahkan.
+    # Dengan bobot (lihat weighting.py) semua indikator dikalikan bobot
+    # responden; 'n_responden' tetap hitungan mentah.
+    n = len(chunk)
+    cols = {'n': np.ones(n), 'n_responden': np.ones(n)}
+
+    for p in PLATFORM_COLUMNS.values():
+        pakai = chunk[f'pakai_{p}'].to_numpy(dtype=np.float64)
+        menit = np.nan_to_num(chunk[f'menit_{p}'].to_numpy(dtype=np.float64))
+        cols[f'pakai_{p}'] = pakai
+        # Menit hanya dihitung untuk pengguna platform tersebut
+        cols[f'menit_{p}'] = menit * pakai
+
+    for kolom in KONSUMSI_COLUMNS.values():
+        cols[kolom] = chunk[kolom].to_numpy(dtype=np.float64)
+
+    karir = chunk['minat_karir'].to_numpy(dtype=object)
+    for i, label in enumerate(KARIR_LABELS):
+        cols[f'karir_{i}'] = (karir == label).astype(np.float64)
+
+    for kolom in MENTAL_HEALTH_COLUMNS.values():
+        cols[kolom] = chunk[kolom].to_numpy(dtype=np.float64)
+
+    frame = pd.DataFrame(cols, index=chunk.index)
+    if weights is not None:
+        frame = frame.mul(weights.for_chunk(chunk), axis=0)
+        frame['n_responden'] = 1.0
+    return frame
+
+
+def accumulate_sums(path, chunksize=DEFAULT_CHUNKSIZE, weights=None):
+    total = None
+    for chunk in iter_chunks(path, chunksize, columns=read_columns(INDICATOR_SOURCE_COLUMNS, weights=weights)):
+        sums = indicator_frame(chunk, weights).sum()
+        total = sums if total is None else total.add(sums, fill_value=0)
+    if total is None:
+        raise ValueError(f"File responden kosong: {path}")
+    return total
+
+
+def _percent(part, whole):
+    return np.round(100 * np.divide(part, whole, out=np.zeros_like(part), where=whole > 0), 1)
+
+
+def frames_from_sums(sums, reference_konsumsi=None):
+    n = float(sums['n'])
+
+    pakai = np.array([sums[f'pakai_{p}'] for p in PLATFORM_COLUMNS.values()], dtype=np.float64)
+    menit = np.array([sums[f'menit_{p}'] for p in PLATFORM_COLUMNS.values()], dtype=np.float64)
+    platform = pd.DataFrame({
+        'Platform': list(PLATFORM_COLUMNS),
+        'Pengguna Gen Z (%)': _percent(pakai, np.full_like(pakai, n)),
+        'Waktu Harian (menit)': np.round(np.divide(menit, pakai, out=np.zeros_like(menit), where=pakai > 0), 1)
+    })
+
+    beli = np.array([sums[k] for k in KONSUMSI_COLUMNS.values()], dtype=np.float64)
+    konsumsi = pd.DataFrame({
+        'Kategori': list(KONSUMSI_COLUMNS),
+        'Persentase Pembelian Online': _percent(beli, np.full_like(beli, n))
+    })
+    # Pertumbuhan YoY butuh gelombang survei sebelumnya; ambil dari dataset acuan
+    if reference_konsumsi is None:
+        reference_konsumsi = load_dataset("konsumsi")
+    growth = reference_konsumsi.set_index('Kategori')['Pertumbuhan YoY (%)']
+    konsumsi['Pertumbuhan YoY (%)'] = konsumsi['Kategori'].map(growth).to_numpy()
+
+    karir_n = np.array([sums[f'karir_{i}'] for i in range(len(KARIR_LABELS))], dtype=np.float64)
+    karir = pd.DataFrame({
+        'Jenis Pekerjaan': KARIR_LABELS,
+        'Minat (%)': _percent(karir_n, np.full_like(karir_n, n))
+    })
+
+    mh = np.array([sums[k] for k in MENTAL_HEALTH_COLUMNS.values()], dtype=np.float64)
+    mental_health = pd.DataFrame({
+        'Masalah': list(MENTAL_HEALTH_COLUMNS),
+        'Prevalensi (%)': _percent(mh, np.full_like(mh, n))
+    })
+
+    return {
+        'platform': platform,
+        'konsumsi': konsumsi,
+        'karir': karir,
+        'mental_health': mental_health
+    }
+
+
+def aggregate_survey(path, chunksize=DEFAULT_CHUNKSIZE, reference_konsumsi=None, weights=None):
+    return frames_from_sums(accumulate_sums(path, chunksize, weights), reference_konsumsi)
@@ -0,0 +1,146 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from query_cache import normalize_filters
+from survey import DEFAULT_CHUNKSIZE, iter_chunks
+
+# Tabel besar (data responden) yang ditampilkan per halaman. Sorting,
+# pencarian dan filter dikerjakan di server terhadap indeks: urutan argsort
+# per kolom dihitung sekali lalu disimpan, pencarian teks dicocokkan ke
+# kategori unik (bukan ke jutaan string), lalu hanya baris di halaman aktif
+# yang dikirim ke browser. Payload per interaksi jadi konstan berapa pun
+# jumlah barisnya.
+DEFAULT_PAGE_SIZE = 50
+PAGE_SIZES = (25, 50, 100, 200)
+
+# Jumlah hasil query (urutan baris terfilter) yang diingat untuk pindah halaman
+_QUERY_CACHE_SIZE = 16
+
+
+def compact_frame(frame):
+    # Teks -> category, angka -> dtype terkecil yang muat
+    out = {}
+    for column, values in frame.items():
+        if values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype):
+            out[column] = values.astype('category')
+        elif pd.api.types.is_integer_dtype(values):
+            out[column] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_float_dtype(values):
+            out[column] = pd.to_numeric(values, downcast='float')
+        else:
+            out[column] = values
+    return pd.DataFrame(out)
+
+
+class TableIndex:
+    def __init__(self, frame):
+        self.frame = frame.reset_index(drop=True)
+        self.search_columns = [
+            c for c, dtype in self.frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+        ]
+        self._orders = {}
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path, chunksize=DEFAULT_CHUNKSIZE):
+        chunks = [compact_frame(chunk) for chunk in iter_chunks(path, chunksize)]
+        if not chunks:
+            raise ValueError(f"File responden kosong: {path}")
+        columns = list(chunks[0].columns)
+        categorical = [
+            c for c in columns if any(isinstance(chunk[c].dtype, pd.CategoricalDtype) for chunk in chunks)
+        ]
+        frame = pd.concat([chunk.drop(columns=categorical) for chunk in chunks], ignore_index=True)
+        for column in categorical:
+            # Kategori tiap chunk berbeda; gabungkan dengan kategori terurut
+            # agar kode kategori bisa langsung dipakai untuk sorting
+            frame[column] = pd.api.types.union_categoricals(
+                [chunk[column].astype('category') for chunk in chunks], sort_categories=True
+            )
+        frame = frame[columns]
+        return cls(frame)
+
+    @property
+    def n_rows(self):
+        return len(self.frame)
+
+    @property
+    def columns(self):
+        return list(self.frame.columns)
+
+    @property
+    def nbytes(self):
+        return int(self.frame.memory_usage(deep=True).sum())
+
+    def order(self, column):
+        # argsort stabil per kolom; kategori diurutkan lewat kodenya
+        with self._lock:
+            order = self._orders.get(column)
+        if order is None:
+            values = self.frame[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                if not values.cat.ordered:
+                    values = values.cat.reorder_categories(sorted(values.cat.categories))
+                key = values.cat.codes.to_numpy()
+            else:
+                key = values.to_numpy()
+            order = np.argsort(key, kind='stable')
+            with self._lock:
+                self._orders[column] = order
+        return order
+
+    def mask(self, search=None, filters=None):
+        mask = None
+        for column, values in (filters or {}).items():
+            if values and column in self.frame:
+                m = self.frame[column].isin(values).to_numpy()
+                mask = m if mask is None else mask & m
+        if search:
+            needle = search.strip().lower()
+            hit = np.zeros(self.n_rows, dtype=bool)
+            for column in self.search_columns:
+                categories = self.frame[column].cat.categories
+                matches = [i for i, c in enumerate(categories) if needle in str(c).lower()]
+                if matches:
+                    hit |= np.isin(self.frame[column].cat.codes.to_numpy(), matches)
+            mask = hit if mask is None else mask & hit
+        return mask
+
+    def query(self, search=None, filters=None, sort=None, ascending=True):
+        # Posisi baris hasil filter + pencarian, dalam urutan sort
+        key = (search or '', normalize_filters(filters), sort, ascending)
+        with self._lock:
+            rows = self._queries.get(key)
+            if rows is not None:
+                self._queries.move_to_end(key)
+                return rows
+
+        mask = self.mask(search, filters)
+        if sort is None:
+            rows = np.arange(self.n_rows) if mask is None else np.flatnonzero(mask)
+        else:
+            order = self.order(sort)
+            if not ascending:
+                order = order[::-1]
+            rows = order if mask is None else order[mask[order]]
+
+        with self._lock:
+            self._queries[key] = rows
+            while len(self._queries) > _QUERY_CACHE_SIZE:
+                self._queries.popitem(last=False)
+        return rows
+
+    def page(self, rows, page, page_size=DEFAULT_PAGE_SIZE):
+        start = page * page_size
+        selected = rows[start:start + page_size]
+        frame = self.frame.iloc[selected]
+        # Nomor baris asli (1-based) supaya responden tetap bisa dirujuk
+        return frame.set_index(pd.Index(selected + 1, name='No'))
+
+
+def n_pages(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+import threading
+import time
+
+import instrumentation
+
+# Pemanasan cache saat worker mulai. Streamlit baru menjalankan app.py saat
+# sesi pertama terhubung, jadi start() dipanggil dari script dan hanya
+# berlaku sekali per proses: sebuah thread latar menjalankan rutinitas
+# pemanasan dari app.py (muat dataset, tabel tampilan, figure default setiap
+# bagian, indeks data responden) ke cache bersama st.cache_* / data_loader.
+# Sesi pertama cukup merender halaman pembuka yang ringan sementara bagian
+# lain disiapkan. Setiap langkah dicatat durasinya (log medan.warmup dan
+# span instrumentasi "warmup:<langkah>"); status() memberi flag kesiapan.
+#
+# Set MEDAN_WARMUP=0 untuk menonaktifkan. Tidak berjalan di AppTest
+# (benchmark, ekspor statis) agar tidak mengganggu pengukuran.
+ENABLED = os.environ.get("MEDAN_WARMUP", "1") != "0"
+
+IDLE, RUNNING, READY = "idle", "running", "ready"
+
+_logger = logging.getLogger("medan.warmup")
+if not _logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    _logger.addHandler(_handler)
+    _logger.setLevel(logging.INFO)
+    _logger.propagate = False
+
+
+THREAD_NAME = "medan-warmup"
+
+
+class _SkipWarmupThread(logging.Filter):
+    # Fungsi cache dengan spinner memperingatkan "missing ScriptRunContext"
+    # bila dipanggil di luar script; wajar untuk thread pemanasan
+    def filter(self, record):
+        return record.threadName != THREAD_NAME
+
+
+logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(_SkipWarmupThread())
+
+
+class Warmup:
+    def __init__(self):
+        self.state = IDLE
+        self.started = None
+        self.finished = None
+        self.current = None
+        self.steps = []
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def step(self, name, fn):
+        # Satu langkah pemanasan; kegagalan dicatat dan tidak menghentikan
+        # langkah berikutnya (bagian terkait akan dibangun saat dibuka)
+        self.current = name
+        start = time.perf_counter()
+        error = None
+        try:
+            return fn()
+        except Exception as exc:  # noqa: BLE001
+            error = f"{type(exc).__name__}: {exc}"
+            return None
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                self.steps.append({'step': name, 'ms': round(seconds * 1000, 1), 'error': error})
+            instrumentation.observe(f"warmup:{name}", seconds)
+            _logger.info(json.dumps({'step': name, 'ms': round(seconds * 1000, 1), 'error': error},
+                                    ensure_ascii=False))
+
+    def run(self, routine):
+        try:
+            routine(self.step)
+        finally:
+            self.finished = time.time()
+            self.current = None
+            self.state = READY
+            self._done.set()
+            _logger.info(json.dumps(self.summary(), ensure_ascii=False))
+
+    def summary(self):
+        with self._lock:
+            steps = list(self.steps)
+        return {
+            'state': self.state,
+            'steps': len(steps),
+            'errors': sum(1 for s in steps if s['error']),
+            'total_ms': round(sum(s['ms'] for s in steps), 1),
+            'current': self.current
+        }
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+
+WARMUP = Warmup()
+_start_lock = threading.Lock()
+
+
+def _under_apptest():
+    from streamlit import config
+
+    return bool(config.get_option("global.appTest"))
+
+
+def start(routine):
+    # Dipanggil di setiap rerun; hanya panggilan pertama per proses yang
+    # menjalankan thread pemanasan
+    if not ENABLED or WARMUP.state != IDLE:
+        return WARMUP
+    with _start_lock:
+        if WARMUP.state != IDLE or _under_apptest():
+            return WARMUP
+        WARMUP.state = RUNNING
+        WARMUP.started = time.time()
+        threading.Thread(target=WARMUP.run, args=(routine,), name=THREAD_NAME, daemon=True).start()
+    return WARMUP
+
+
+def status():
+    return WARMUP.summary()
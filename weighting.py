@@ -0,0 +1,124 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_DIR
+from survey import DEFAULT_CHUNKSIZE, iter_chunks
+
+# Pembobotan survei (raking / iterative proportional fitting) ke total
+# populasi BPS. Responden dikelompokkan ke sel kombinasi kategori margin
+# (mis. kelompok umur x gender x kecamatan); IPF berjalan di atas vektor
+# jumlah per sel dengan np.bincount, bukan per baris, sehingga biayanya
+# bergantung pada jumlah sel, bukan jumlah responden. Bobot responden adalah
+# faktor penyesuaian sel tempat ia berada.
+MARGIN_PATH = DATA_DIR / "populasi_margin.csv"
+
+DEFAULT_MAX_ITER = 100
+DEFAULT_TOLERANCE = 1e-6
+
+
+def load_margins(path=MARGIN_PATH):
+    # Format: dimensi,kategori,jumlah (satu baris per kategori)
+    path = Path(path)
+    if not path.exists():
+        return None
+    table = pd.read_csv(path)
+    return {
+        dim: group.set_index('kategori')['jumlah'].astype(np.float64)
+        for dim, group in table.groupby('dimensi', sort=False)
+    }
+
+
+class RakingWeights:
+    def __init__(self, margins, cell_factors, iterations, max_error):
+        self.margins = margins
+        self.cell_factors = cell_factors
+        self.iterations = iterations
+        self.max_error = max_error
+
+    @property
+    def columns(self):
+        return list(self.margins)
+
+    @property
+    def shape(self):
+        return tuple(len(m) for m in self.margins.values())
+
+    def cell_codes(self, chunk):
+        codes = []
+        for dim, margin in self.margins.items():
+            c = pd.Categorical(chunk[dim], categories=margin.index).codes
+            if (c < 0).any():
+                unknown = sorted(set(chunk[dim][c < 0].astype(str)))
+                raise ValueError(f"Kategori '{dim}' tidak ada di margin populasi: {unknown}")
+            codes.append(c)
+        return np.ravel_multi_index(codes, self.shape)
+
+    def for_chunk(self, chunk):
+        return self.cell_factors[self.cell_codes(chunk)]
+
+    def describe(self):
+        return {
+            'dimensions': self.columns,
+            'n_cells': int(np.prod(self.shape)),
+            'iterations': self.iterations,
+            'max_error': self.max_error
+        }
+
+
+def _ipf(counts, dim_codes, targets, max_iter, tol):
+    fitted = counts.copy()
+    max_error = np.inf
+    for iteration in range(1, max_iter + 1):
+        for codes, target in zip(dim_codes, targets):
+            current = np.bincount(codes, weights=fitted, minlength=len(target))
+            factor = np.divide(target, current, out=np.ones_like(target), where=current > 0)
+            fitted *= factor[codes]
+        max_error = max(
+            np.max(np.abs(np.bincount(codes, weights=fitted, minlength=len(target)) - target) / target)
+            for codes, target in zip(dim_codes, targets)
+        )
+        if max_error < tol:
+            break
+    return fitted, iteration, float(max_error)
+
+
+def rake(path, margins=None, chunksize=DEFAULT_CHUNKSIZE, max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOLERANCE):
+    if margins is None:
+        margins = load_margins()
+    if not margins:
+        raise ValueError("Margin populasi tidak tersedia")
+
+    # Semua margin diskalakan ke total margin pertama agar IPF konsisten
+    total = next(iter(margins.values())).sum()
+    margins = {dim: m * (total / m.sum()) for dim, m in margins.items()}
+
+    weights = RakingWeights(margins, None, 0, np.inf)
+    n_cells = int(np.prod(weights.shape))
+
+    # Pass 1: jumlah responden per sel
+    counts = np.zeros(n_cells)
+    for chunk in iter_chunks(path, chunksize, columns=weights.columns):
+        counts += np.bincount(weights.cell_codes(chunk), minlength=n_cells)
+
+    # Kode kategori tiap sel per dimensi, untuk bincount margin
+    dim_codes = np.unravel_index(np.arange(n_cells), weights.shape)
+    targets = [m.to_numpy() for m in margins.values()]
+    fitted, iterations, max_error = _ipf(counts, dim_codes, targets, max_iter, tol)
+
+    weights.cell_factors = np.divide(fitted, counts, out=np.zeros_like(fitted), where=counts > 0)
+    weights.iterations = iterations
+    weights.max_error = max_error
+    return weights
+
+
+if __name__ == '__main__':
+    # Cek konvergensi raking: python weighting.py data/responden.parquet
+    start = time.perf_counter()
+    result = rake(sys.argv[1])
+    for key, value in result.describe().items():
+        print(f"{key:>12}: {value}")
+    print(f"{'waktu':>12}: {time.perf_counter() - start:.2f} dtk")